@@ -0,0 +1,54 @@
+# play_02 탐색 단계(랜딩 → 메뉴 → 하위 메뉴)별 지연 시간 측정
+# webscraper.io 테스트 사이트의 로컬 사본을 띄워 두고 여러 번 반복 실행해 단계별 통계를 출력한다.
+#
+# 사용법
+#   1) 로컬 사본 준비 : wget -m -k -E https://webscraper.io/test-sites/e-commerce/allinone
+#                       cd webscraper.io && python -m http.server 8000
+#   2) 측정           : python bench_nav_steps.py --url http://localhost:8000/test-sites/e-commerce/allinone.html --runs 20
+# (필요 시) pip install playwright && playwright install chromium
+
+import argparse
+import asyncio
+import statistics
+from collections import defaultdict
+
+import play_02
+from browser_pool import BrowserPool
+
+
+async def bench(url: str, runs: int, pacing: float) -> dict:
+    """runs번 탐색을 반복하고 {단계 이름: [소요 시간(초), ...]}을 반환"""
+    results = defaultdict(list)
+
+    async with BrowserPool() as pool:
+        for _ in range(runs):
+            async with pool.page() as page:
+                timings = await play_02.run_steps(page, play_02.build_steps(url), pacing=pacing)
+            for name, seconds in timings:
+                results[name].append(seconds)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="play_02 탐색 단계별 지연 시간 벤치마크")
+    parser.add_argument("--url", default=play_02.URL, help="랜딩 페이지 URL (로컬 사본 권장)")
+    parser.add_argument("--runs", type=int, default=10, help="반복 횟수")
+    parser.add_argument("--pacing", type=float, default=0, help="단계 사이 대기(초), 데모 모드 비교용")
+    args = parser.parse_args()
+
+    results = asyncio.run(bench(args.url, args.runs, args.pacing))
+
+    print(f"{args.url} 기준 {args.runs}회 실행")
+    total = 0.0
+    for name, samples in results.items():
+        mean = statistics.mean(samples)
+        total += mean
+        print(f" - {name}: 평균 {mean * 1000:.0f}ms, "
+              f"중앙값 {statistics.median(samples) * 1000:.0f}ms, "
+              f"최대 {max(samples) * 1000:.0f}ms")
+    print(f"상품 조회 1회 평균 {total * 1000:.0f}ms (고정 대기 방식은 단계당 +{play_02.DEMO_PACING}초)")
+
+
+if __name__ == "__main__":
+    main()
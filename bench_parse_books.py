@@ -0,0 +1,70 @@
+# book_scrap_titles.parse_books 파싱 엔진별 처리 속도 측정
+# 저장해 둔 카탈로그 페이지(HTML)를 엔진마다 여러 번 파싱해 초당 레코드 수를 출력한다.
+#
+# 사용법
+#   1) 픽스처 저장 : python bench_parse_books.py --download 5
+#   2) 측정        : python bench_parse_books.py --rounds 20
+# (필요 시) pip install requests beautifulsoup4 lxml
+
+import argparse
+import time
+from pathlib import Path
+
+import book_scrap_titles as bst
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "books"
+
+
+def download_fixtures(fixture_dir: Path, pages: int) -> None:
+    """카탈로그 1~pages 페이지를 fixture_dir에 page-N.html로 저장"""
+    fixture_dir.mkdir(parents=True, exist_ok=True)
+    session = bst.make_session(1)
+
+    for page in range(1, pages + 1):
+        html = bst.fetch_page(session, page)
+        (fixture_dir / f"page-{page}.html").write_text(html, encoding="utf-8")
+
+    print(f"{pages}개 페이지를 {fixture_dir}에 저장했습니다.")
+
+
+def bench(engine: str, pages: list, rounds: int) -> float:
+    """engine으로 모든 페이지를 rounds번 파싱하고 초당 레코드 수를 반환"""
+    records = 0
+    start = time.perf_counter()
+
+    for _ in range(rounds):
+        seq = 1
+        for html in pages:
+            books = bst.parse_books(html, seq, engine=engine)
+            seq += len(books)
+            records += len(books)
+
+    elapsed = time.perf_counter() - start
+    return records / elapsed if elapsed else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="parse_books 엔진별 벤치마크")
+    parser.add_argument("--fixtures", type=Path, default=FIXTURE_DIR, help="저장된 HTML 폴더")
+    parser.add_argument("--download", type=int, default=0, help="측정 전에 받아 둘 페이지 수")
+    parser.add_argument("--rounds", type=int, default=10, help="엔진별 반복 횟수")
+    args = parser.parse_args()
+
+    if args.download:
+        download_fixtures(args.fixtures, args.download)
+
+    files = sorted(args.fixtures.glob("*.html"))
+    if not files:
+        print(f"픽스처 HTML이 없습니다: {args.fixtures} (--download N 으로 먼저 저장하세요)")
+        return
+
+    pages = [f.read_text(encoding="utf-8") for f in files]
+    print(f"픽스처 {len(pages)}개 페이지, 엔진별 {args.rounds}회 반복")
+
+    for engine in bst.PARSERS:
+        rate = bench(engine, pages, args.rounds)
+        print(f" - {engine:5s}: {rate:,.0f} records/sec")
+
+
+if __name__ == "__main__":
+    main()
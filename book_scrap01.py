@@ -6,13 +6,18 @@
 
 # (필요 시) pip install requests beautifulsoup4
 
-import requests
 from bs4 import BeautifulSoup
 
+from http_cache import get_session
+from rate_limit import mount_polite
+
+USE_HTTP_CACHE = True  # True면 재실행 시 변경 없는 페이지는 캐시에서 가져옴
+
 def scrape_first_book_title():
     url = "https://books.toscrape.com/"
     # 2. 페이지 요청
-    response = requests.get(url)
+    session = mount_polite(get_session(USE_HTTP_CACHE))  # 속도 제한 + 재시도
+    response = session.get(url)
     response.raise_for_status()  # 요청 실패 시 예외 발생
 
     # 3. HTML 파싱
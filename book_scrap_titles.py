@@ -10,7 +10,7 @@
 # 5갸지 데이터를 처음에 순번(1부터 시작)을 포함하여 6개 컬럼으로 표형 데이터를 만들어서
 # 페이징 처리는 하지 않음
 # 콘솔에 내용을 출력하는 파이썬 코드
-# (필요 시) pip install requests beautifulsoup4 pandas openpyxl
+# (필요 시) pip install requests beautifulsoup4 lxml openpyxl
 
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
@@ -23,20 +23,37 @@ GitHub에 바로 올려도 되는 가독성·모듈화·로그 관리된 코드
 """
 
 import logging
-import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Iterator, Tuple
 
 import pandas as pd
 import requests
+import soupsieve as sv
 from bs4 import BeautifulSoup
 from requests.compat import urljoin
 
+from crawl_checkpoint import CrawlCheckpoint
+from http_cache import get_session
+from rate_limit import HostRateLimiter, mount_polite
+from record_normalize import normalize_frame, to_records
+from record_sinks import open_sink
+
+try:
+    from lxml import etree, html as lxml_html
+except ImportError:  # lxml이 없으면 BeautifulSoup 경로만 사용
+    etree = lxml_html = None
+
 # ─── 설정 상수 ────────────────────────────────────────────────────────────
 BASE_URL    = "https://books.toscrape.com/"
 MAX_PAGES   = 50
-OUTPUT_FILE = Path(__file__).parent / "all_books.xlsx"
+OUTPUT_FILE = Path(__file__).parent / "all_books.xlsx"   # .xlsx / .csv / .parquet
+CHECKPOINT_FILE = Path(__file__).parent / "all_books.checkpoint.sqlite"
 USER_AGENT  = "MaintenanceBot/1.0 (+https://github.com/your_org/your_repo)"
+CONCURRENCY = 8     # 동시에 요청할 페이지 수 (1이면 기존처럼 순차 수집)
+REQUESTS_PER_SECOND = 10.0   # 호스트당 초당 요청 상한 (429 응답 시 Retry-After/백오프로 재시도)
+USE_HTTP_CACHE = True   # 재실행 시 변경 없는 페이지는 캐시(304 또는 무통신)로 처리
+PARSER_ENGINE = "lxml" if etree is not None else "bs4"   # "lxml" | "bs4"
 # ─────────────────────────────────────────────────────────────────────────
 
 # ─── 로깅 설정 ────────────────────────────────────────────────────────────
@@ -48,9 +65,22 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 # ─────────────────────────────────────────────────────────────────────────
 
-def fetch_page(session: requests.Session, page_num: int) -> BeautifulSoup:
+def make_session(pool_size: int = CONCURRENCY) -> requests.Session:
+    """
+    User-Agent가 설정된 Session을 만든다. (USE_HTTP_CACHE면 디스크 캐시 적용)
+    동시 요청 수만큼 커넥션 풀을 키워 스레드들이 연결을 재사용하도록 하고,
+    호스트별 속도 제한과 재시도를 적용한다.
     """
-    주어진 페이지 번호의 HTML을 가져와 BeautifulSoup 객체로 반환한다.
+    session = get_session(USE_HTTP_CACHE)
+    session.headers.update({"User-Agent": USER_AGENT})
+
+    limiter = HostRateLimiter(rate=REQUESTS_PER_SECOND, burst=max(pool_size, 1))
+    return mount_polite(session, limiter, pool_maxsize=max(pool_size, 1))
+
+
+def fetch_page(session: requests.Session, page_num: int) -> str:
+    """
+    주어진 페이지 번호의 HTML 문자열을 반환한다. (파싱은 parse_books에서 엔진별로 수행)
     404를 만나면 ValueError를 발생시킨다.
     """
     if page_num == 1:
@@ -64,84 +94,186 @@ def fetch_page(session: requests.Session, page_num: int) -> BeautifulSoup:
         raise ValueError(f"Page {page_num} not found (404)")
     resp.raise_for_status()
     resp.encoding = "utf-8"
-    return BeautifulSoup(resp.text, "html.parser")
+    return resp.text
 
 
-def parse_books(soup: BeautifulSoup, seq_start: int) -> List[Dict]:
+def iter_pages(
+    session: requests.Session,
+    max_pages: int = MAX_PAGES,
+    concurrency: int = CONCURRENCY,
+    start_page: int = 1,
+) -> Iterator[Tuple[int, str]]:
     """
-    BeautifulSoup 객체에서 책 리스트를 파싱해
-    순번(seq), 제목, 이미지URL, 평점, 가격(숫자), 재고여부를 딕셔너리 리스트로 반환.
+    start_page부터 최대 concurrency개의 요청을 동시에 띄워 두고, 결과는 페이지 번호 순서대로 돌려준다.
+    fetch_page의 예외(404 → ValueError, HTTPError)는 해당 페이지 차례에서 그대로 전달되며,
+    그 시점에 아직 시작하지 않은 요청은 취소된다.
     """
-    items = soup.select(
-        "#default > div > div > div > div > section > div:nth-child(2) > ol > li"
+    pool = ThreadPoolExecutor(max_workers=max(concurrency, 1))
+    pending = {}
+    next_page = start_page
+
+    try:
+        for page in range(start_page, max_pages + 1):
+            # 현재 페이지부터 concurrency개가 항상 진행 중이도록 채워 넣는다.
+            while next_page <= max_pages and next_page < page + concurrency:
+                pending[next_page] = pool.submit(fetch_page, session, next_page)
+                next_page += 1
+
+            yield page, pending.pop(page).result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+# ─── 파싱 엔진 ────────────────────────────────────────────────────────────
+# 셀렉터는 모듈 로드 시 한 번만 컴파일하고, 책(<li>)마다 컴파일된 객체를 재사용한다.
+ITEMS_SELECTOR = "#default > div > div > div > div > section > div:nth-child(2) > ol > li"
+TITLE_SELECTOR = "article > h3 > a"
+IMAGE_SELECTOR = "article > div.image_container > a > img"
+PRICE_SELECTOR = "article > div.product_price > p.price_color"
+STOCK_SELECTOR = "article > div.product_price > p.instock.availability"
+PRICE_COLUMN   = "가격(숫자)"
+
+# BeautifulSoup(soupsieve) 경로 : CSS 셀렉터를 미리 컴파일
+_SV_ITEMS = sv.compile(ITEMS_SELECTOR)
+_SV_TITLE = sv.compile(TITLE_SELECTOR)
+_SV_IMAGE = sv.compile(IMAGE_SELECTOR)
+_SV_PRICE = sv.compile(PRICE_SELECTOR)
+_SV_STOCK = sv.compile(STOCK_SELECTOR)
+
+
+def _has_class(name: str) -> str:
+    """XPath에서 class 속성에 name이 포함되어 있는지 검사하는 조건식"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# lxml 경로 : 위 CSS 셀렉터와 같은 의미의 XPath를 미리 컴파일
+if etree is not None:
+    _XP_ITEMS = etree.XPath(
+        "//*[@id='default']/div/div/div/div/section/*[2][self::div]/ol/li"
+    )
+    _XP_TITLE = etree.XPath("string(article/h3/a)")
+    _XP_IMAGE = etree.XPath(
+        f"string(article/div[{_has_class('image_container')}]/a/img/@src)"
+    )
+    _XP_PRICE = etree.XPath(
+        f"string(article/div[{_has_class('product_price')}]"
+        f"/p[{_has_class('price_color')}])"
+    )
+    _XP_STOCK = etree.XPath(
+        f"string(article/div[{_has_class('product_price')}]"
+        f"/p[{_has_class('instock')} and {_has_class('availability')}])"
     )
+
+
+def _make_record(seq: int, title: str, img_rel: str,
+                 price_text: str, availability_text: str) -> Dict:
+    """
+    엔진과 무관하게 추출한 원본 문자열로 레코드 딕셔너리를 만든다.
+    가격은 원본 문자열("£51.77") 그대로 두고, parse_books에서 페이지 단위로 한 번에 숫자로 바꾼다.
+    """
+    return {
+        "No": seq,
+        "제목": title,
+        "이미지URL": urljoin(BASE_URL, img_rel),
+        "평점": "–",  # 평점 보류
+        PRICE_COLUMN: price_text,
+        "재고여부(Boolean)": "In stock" in availability_text
+    }
+
+
+def _parse_books_bs4(html: str, seq_start: int) -> List[Dict]:
+    """BeautifulSoup(html.parser) + 컴파일된 soupsieve 셀렉터로 파싱 (fallback 경로)"""
+    soup = BeautifulSoup(html, "html.parser")
     results = []
 
-    for item in items:
-        title = item.select_one("article > h3 > a").get_text(strip=True)
-        img_rel = item.select_one("article > div.image_container > a > img")["src"]
-        img_url = urljoin(BASE_URL, img_rel)
-
-        # 평점 보류
-        rating = "–"
-
-        price_text = item.select_one(
-            "article > div.product_price > p.price_color"
-        ).get_text(strip=True)
-        clean_price = float(re.sub(r"[^\d.]", "", price_text))
-
-        availability_text = item.select_one(
-            "article > div.product_price > p.instock.availability"
-        ).get_text(strip=True)
-        in_stock = "In stock" in availability_text
-
-        results.append({
-            "No": seq_start,
-            "제목": title,
-            "이미지URL": img_url,
-            "평점": rating,
-            "가격(숫자)": clean_price,
-            "재고여부(Boolean)": in_stock
-        })
-        seq_start += 1
+    for seq, item in enumerate(_SV_ITEMS.select(soup), start=seq_start):
+        results.append(_make_record(
+            seq,
+            _SV_TITLE.select_one(item).get_text(strip=True),
+            _SV_IMAGE.select_one(item)["src"],
+            _SV_PRICE.select_one(item).get_text(strip=True),
+            _SV_STOCK.select_one(item).get_text(strip=True),
+        ))
 
     return results
 
 
-def save_to_excel(data: List[Dict], output_path: Path) -> None:
+def _parse_books_lxml(html: str, seq_start: int) -> List[Dict]:
+    """lxml + 컴파일된 XPath로 파싱 (빠른 경로)"""
+    tree = lxml_html.fromstring(html)
+    results = []
+
+    for seq, item in enumerate(_XP_ITEMS(tree), start=seq_start):
+        results.append(_make_record(
+            seq,
+            _XP_TITLE(item).strip(),
+            _XP_IMAGE(item),
+            _XP_PRICE(item).strip(),
+            _XP_STOCK(item).strip(),
+        ))
+
+    return results
+
+
+PARSERS = {"bs4": _parse_books_bs4}
+if etree is not None:
+    PARSERS["lxml"] = _parse_books_lxml
+# ─────────────────────────────────────────────────────────────────────────
+
+
+def parse_books(html: str, seq_start: int, engine: str = PARSER_ENGINE) -> List[Dict]:
     """
-    데이터 리스트를 pandas DataFrame으로 변환해 Excel 파일로 저장.
+    HTML에서 책 리스트를 파싱해
+    순번(seq), 제목, 이미지URL, 평점, 가격(숫자), 재고여부를 딕셔너리 리스트로 반환.
+    engine이 설치되어 있지 않으면 BeautifulSoup 경로로 대체한다.
+    가격 컬럼은 record_normalize.to_float로 한 번에 숫자로 정리한다. (숫자가 없으면 None)
     """
-    logger.info(f"Saving {len(data)} records to '{output_path}'")
-    df = pd.DataFrame(data)
-    df.to_excel(output_path, index=False)
-    logger.info("Excel 저장 완료")
+    records = PARSERS.get(engine, _parse_books_bs4)(html, seq_start)
+    if not records:
+        return records
+
+    frame = normalize_frame(pd.DataFrame(records), float_columns=(PRICE_COLUMN,))
+    return to_records(frame)
 
 
 def main():
-    session = requests.Session()
-    session.headers.update({"User-Agent": USER_AGENT})
+    session = make_session(CONCURRENCY)
+
+    # 이전 실행이 중간에 실패했다면 마지막 완료 페이지 다음부터 이어서 수집
+    checkpoint = CrawlCheckpoint(CHECKPOINT_FILE)
+    start_page = checkpoint.last_page() + 1
+    seq = checkpoint.next_seq()
+    if start_page > 1:
+        logger.info(f"체크포인트에서 재개: page {start_page}부터 (No {seq}~)")
 
-    all_books = []
-    seq = 1
+    finished = False
+
+    # 페이지는 병렬로 받아오지만 파싱은 페이지 순서대로 하므로 No 순번이 유지된다.
+    # 파싱한 페이지는 바로 파일에 이어 쓰므로, 중간에 실패해도 그때까지의 결과가 남는다.
+    with open_sink(OUTPUT_FILE) as sink:
+        # 이전 실행에서 수집해 둔 레코드부터 다시 기록
+        for books in checkpoint.iter_record_batches():
+            sink.write_rows(books)
 
-    for page in range(1, MAX_PAGES + 1):
         try:
-            soup = fetch_page(session, page)
+            for page, html in iter_pages(session, MAX_PAGES, CONCURRENCY, start_page):
+                books = parse_books(html, seq)
+                checkpoint.mark_done(page, books)
+                sink.write_rows(books)
+                seq += len(books)
+            finished = True
         except ValueError as ve:
             logger.warning(str(ve) + " — 크롤링 종료")
-            break
+            finished = True
         except requests.HTTPError as he:
-            logger.error(f"HTTP error on page {page}: {he}")
-            break
+            logger.error(f"HTTP error: {he} — 다음 실행 시 이어서 수집합니다.")
 
-        books = parse_books(soup, seq)
-        all_books.extend(books)
-        seq += len(books)
+    # 끝까지 수집했으면 다음 실행은 1페이지부터 새로 시작
+    if finished:
+        checkpoint.clear()
+    checkpoint.close()
 
-    if all_books:
-        save_to_excel(all_books, OUTPUT_FILE)
-    else:
+    if sink.count == 0:
         logger.warning("수집된 데이터가 없습니다.")
 
 if __name__ == "__main__":
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+browser_pool.py
+
+Playwright(async) Chromium 브라우저를 미리 띄워 두고 여러 스크래핑 작업에 나눠 쓰는 풀.
+
+- 브라우저 실행(launch)은 풀을 열 때 size개만 한 번 수행한다.
+- 작업마다 새 BrowserContext(쿠키·스토리지가 격리된 세션)를 만들어 page를 넘겨준다.
+- 동시에 열린 page 수는 max_pages로 제한한다.
+- 브라우저 하나가 recycle_after번 사용되면 다음 작업 전에 새 브라우저로 교체한다.
+- 한 프로세스에서는 풀 하나를 열어 여러 작업에 넘겨 쓴다. (play_all.py 참고)
+- 따로 실행하는 스크립트끼리도 warm 브라우저를 같이 쓰려면 브라우저 서버를 띄워 두고
+  CDP로 접속한다. 풀은 launch 대신 connect_over_cdp를 쓰고, 닫을 때 연결만 끊는다.
+    python browser_pool.py --serve                 # 브라우저 서버 (Ctrl+C로 종료)
+    set PLAYWRIGHT_CDP_ENDPOINT=http://127.0.0.1:9222   (또는 BrowserPool(cdp_endpoint=...))
+
+사용 예)
+    async with BrowserPool(size=2, max_pages=8) as pool:
+        async with pool.page(user_agent=UA) as page:
+            await page.goto(URL)
+
+        # 여러 작업을 동시에 : job(page, item) 코루틴을 items마다 실행
+        results = await pool.map(job, urls)
+
+    # 이미지·폰트·외부 도메인 요청을 막고 필요한 셀렉터만 기다리는 가벼운 로드
+    await goto_and_wait(page, URL, "tr[id^='lst']", FAST_LOAD)
+(필요 시) pip install playwright && playwright install chromium
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+from playwright.async_api import Browser, Page, Route, async_playwright
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from rate_limit import call_with_retry_async
+
+logger = logging.getLogger(__name__)
+
+# ─── 페이지 로드 프로파일 ─────────────────────────────────────────────────
+# block_types       : 중단(abort)할 리소스 종류 (Playwright request.resource_type)
+# block_third_party : 대상 사이트와 다른 도메인으로 가는 요청 중단 (광고·트래커 등)
+# allow_hosts       : block_third_party여도 허용할 호스트 (접미사 비교, 예: "cdn.example.com")
+# wait_until        : page.goto의 대기 기준 (셀렉터 대기는 goto_and_wait에서 별도로 수행)
+FULL_LOAD = {
+    "block_types": (),
+    "block_third_party": False,
+    "allow_hosts": (),
+    "wait_until": "networkidle",
+}
+FAST_LOAD = {
+    "block_types": ("image", "font", "media"),
+    "block_third_party": True,
+    "allow_hosts": (),
+    "wait_until": "domcontentloaded",
+}
+# ─────────────────────────────────────────────────────────────────────────
+
+# 브라우저 서버 설정 (--serve 로 띄운 브라우저에 접속할 때)
+CDP_ENDPOINT_ENV = "PLAYWRIGHT_CDP_ENDPOINT"
+DEFAULT_CDP_PORT = 9222
+
+
+class _BrowserSlot:
+    """풀 안의 브라우저 하나와 사용 현황"""
+
+    def __init__(self, browser: Browser):
+        self.browser = browser
+        self.uses = 0      # 지금까지 만든 context 수
+        self.active = 0    # 현재 열려 있는 context 수
+        self.lock = asyncio.Lock()
+
+
+class BrowserPool:
+    """warm 상태의 Chromium 브라우저들에서 격리된 context/page를 빌려주는 풀"""
+
+    def __init__(self, size: int = 1, max_pages: int = 8, recycle_after: int = 100,
+                 context_options: Optional[Dict] = None, cdp_endpoint: Optional[str] = None,
+                 **launch_options):
+        """
+        cdp_endpoint(또는 환경 변수 PLAYWRIGHT_CDP_ENDPOINT)를 주면 브라우저를 새로 띄우지 않고
+        이미 떠 있는 브라우저 서버에 접속한다. 이때 launch_options와 recycle_after는 쓰지 않는다.
+        """
+        self.cdp_endpoint = cdp_endpoint or os.environ.get(CDP_ENDPOINT_ENV)
+        self.size = size
+        self.max_pages = max_pages
+        self.recycle_after = recycle_after
+        self.context_options = context_options or {}
+        self.launch_options = launch_options
+        self._playwright = None
+        self._slots: List[_BrowserSlot] = []
+        self._semaphore = asyncio.Semaphore(max_pages)
+
+    async def start(self) -> "BrowserPool":
+        self._playwright = await async_playwright().start()
+        browsers = await asyncio.gather(*(self._launch() for _ in range(self.size)))
+        self._slots = [_BrowserSlot(b) for b in browsers]
+        source = f"{self.cdp_endpoint} 접속" if self.cdp_endpoint else "새로 실행"
+        logger.info(f"브라우저 풀 시작: {self.size}개 브라우저({source}), 최대 {self.max_pages}개 page")
+        return self
+
+    async def close(self) -> None:
+        # CDP로 접속한 브라우저는 close()가 이 풀이 만든 context만 정리하고 연결을 끊는다
+        for slot in self._slots:
+            await slot.browser.close()
+        self._slots = []
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def __aenter__(self) -> "BrowserPool":
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def _launch(self) -> Browser:
+        if self.cdp_endpoint:
+            return await self._playwright.chromium.connect_over_cdp(self.cdp_endpoint)
+        return await self._playwright.chromium.launch(**self.launch_options)
+
+    async def _acquire_slot(self) -> _BrowserSlot:
+        """사용 횟수가 남은 브라우저 중 가장 한가한 것을 고른다 (필요하면 교체)"""
+        fresh = [s for s in self._slots if s.uses < self.recycle_after]
+        slot = min(fresh or self._slots, key=lambda s: s.active)
+
+        async with slot.lock:
+            # 사용 횟수를 다 채웠고 진행 중인 작업이 없으면 새 브라우저로 교체
+            # (공유 브라우저 서버에 접속한 경우에는 다른 프로세스도 쓰고 있으므로 교체하지 않음)
+            if slot.uses >= self.recycle_after and slot.active == 0 and not self.cdp_endpoint:
+                logger.info(f"브라우저 교체 ({slot.uses}회 사용)")
+                await slot.browser.close()
+                slot.browser = await self._launch()
+                slot.uses = 0
+            slot.uses += 1
+            slot.active += 1
+        return slot
+
+    @asynccontextmanager
+    async def page(self, **context_options):
+        """격리된 context에서 새 page를 빌려준다. 블록을 벗어나면 context를 닫는다."""
+        async with self._semaphore:
+            slot = await self._acquire_slot()
+            context = None
+            try:
+                # 브라우저가 죽어 new_context가 실패해도 slot.active는 반드시 되돌린다
+                context = await slot.browser.new_context(**{**self.context_options, **context_options})
+                yield await context.new_page()
+            finally:
+                try:
+                    if context is not None:
+                        await context.close()
+                finally:
+                    slot.active -= 1
+
+    async def map(self, job: Callable[[Page, Any], Awaitable[Any]],
+                  items: Iterable[Any], **context_options) -> List[Any]:
+        """items마다 job(page, item)을 동시에 실행하고 결과를 입력 순서대로 반환"""
+        async def run(item):
+            async with self.page(**context_options) as page:
+                return await job(page, item)
+
+        return await asyncio.gather(*(run(item) for item in items))
+
+
+def _site_of(host: str) -> str:
+    """호스트의 사이트 도메인 (news.naver.com → naver.com, www.melon.com → melon.com)"""
+    labels = host.split(".")
+    # co.kr 처럼 2단계 국가 도메인은 한 단계 더 포함
+    if len(labels) >= 3 and len(labels[-1]) == 2 and labels[-2] in ("co", "or", "go", "ac", "ne", "re"):
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+async def apply_load_profile(page: Page, url: str, profile: Dict = FAST_LOAD) -> None:
+    """profile에 따라 불필요한 요청을 route 단계에서 중단하도록 page에 등록"""
+    block_types = set(profile.get("block_types", ()))
+    block_third_party = profile.get("block_third_party", False)
+    allow_hosts = tuple(profile.get("allow_hosts", ()))
+    if not block_types and not block_third_party:
+        return
+
+    site = _site_of(urlparse(url).hostname or "")
+
+    async def handle(route: Route):
+        request = route.request
+        host = urlparse(request.url).hostname or ""
+        third_party = _site_of(host) != site and not host.endswith(allow_hosts)
+
+        if request.resource_type in block_types or (block_third_party and third_party):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await page.route("**/*", handle)
+
+
+def _is_network_error(error: PlaywrightError) -> bool:
+    """연결 끊김·DNS 실패 등 네트워크 단계의 오류인지 (Chromium은 net::ERR_... 메시지를 준다)"""
+    return not isinstance(error, PlaywrightTimeoutError) and "net::ERR_" in (error.message or "")
+
+
+async def goto_and_wait(page: Page, url: str, selector: str,
+                        profile: Dict = FAST_LOAD, timeout: float = 10_000) -> None:
+    """
+    profile을 적용해 url로 이동한 뒤, networkidle 대신 selector가 나타날 때까지만 기다린다.
+    이동 요청은 rate_limit의 호스트별 속도 제한과 재시도(429/5xx·네트워크 오류)를 따른다.
+    시간 초과(TimeoutError)는 재시도하지 않는다. (느린 페이지 하나가 재시도 횟수 × timeout을 쓰지 않도록)
+    """
+    await apply_load_profile(page, url, profile)
+
+    async def goto():
+        try:
+            return await page.goto(url, wait_until=profile.get("wait_until", "domcontentloaded"),
+                                   timeout=timeout)
+        except PlaywrightError as e:
+            if _is_network_error(e):
+                raise ConnectionError(e.message) from e
+            raise
+
+    try:
+        await call_with_retry_async(goto, url, errors=(ConnectionError,))
+    except ConnectionError as e:
+        raise e.__cause__  # 재시도를 다 쓰면 원래의 Playwright 오류로 알림
+    await page.wait_for_selector(selector, timeout=timeout)
+
+
+async def serve_browser(port: int = DEFAULT_CDP_PORT, **launch_options) -> None:
+    """
+    여러 스크립트가 CDP로 같이 쓸 Chromium 브라우저 서버를 띄우고, 종료될 때까지 기다린다.
+    다른 프로세스에서는 BrowserPool(cdp_endpoint=f"http://127.0.0.1:{port}")으로 접속한다.
+    """
+    args = list(launch_options.pop("args", [])) + [f"--remote-debugging-port={port}"]
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(args=args, **launch_options)
+        closed = asyncio.Event()
+        browser.on("disconnected", lambda _: closed.set())
+        print(f"브라우저 서버 실행 중: http://127.0.0.1:{port} (종료: Ctrl+C)")
+        print(f"  접속 : {CDP_ENDPOINT_ENV}=http://127.0.0.1:{port}")
+        try:
+            await closed.wait()
+        finally:
+            if browser.is_connected():
+                await browser.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="공유 브라우저 서버")
+    parser.add_argument("--serve", action="store_true", help="CDP로 접속할 수 있는 브라우저 서버 실행")
+    parser.add_argument("--port", type=int, default=DEFAULT_CDP_PORT, help="원격 디버깅 포트")
+    parser.add_argument("--headed", action="store_true", help="브라우저 창 표시")
+    args = parser.parse_args()
+
+    if args.serve:
+        try:
+            asyncio.run(serve_browser(args.port, headless=not args.headed))
+        except KeyboardInterrupt:
+            pass
+    else:
+        parser.print_help()
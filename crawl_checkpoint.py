@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+crawl_checkpoint.py
+
+여러 페이지를 순서대로 수집하는 스크래퍼용 SQLite 체크포인트.
+완료한 페이지 번호, 다음 순번(seq), 그 페이지에서 만든 레코드를 한 트랜잭션으로 기록하므로
+중간에 실패해도 다시 실행하면 마지막 완료 페이지 다음부터 이어서 수집할 수 있다.
+
+사용 예)
+    checkpoint = CrawlCheckpoint("all_books.checkpoint.sqlite")
+    start_page = checkpoint.last_page() + 1
+    ...
+    checkpoint.mark_done(page, books)   # 페이지 처리 직후
+    ...
+    checkpoint.clear()                  # 크롤링을 끝까지 마쳤을 때
+"""
+
+import json
+import sqlite3
+from itertools import groupby
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+
+class CrawlCheckpoint:
+    """job 이름별로 완료 페이지와 레코드를 저장하는 체크포인트 저장소"""
+
+    def __init__(self, path: Path, job: str = "default"):
+        self.path = Path(path)
+        self.job = job
+        self.conn = sqlite3.connect(self.path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS pages (
+                job      TEXT    NOT NULL,
+                page     INTEGER NOT NULL,
+                next_seq INTEGER NOT NULL,
+                PRIMARY KEY (job, page)
+            );
+            CREATE TABLE IF NOT EXISTS records (
+                job  TEXT    NOT NULL,
+                page INTEGER NOT NULL,
+                data TEXT    NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_records_job_page ON records (job, page);
+        """)
+
+    def last_page(self) -> int:
+        """마지막으로 완료한 페이지 번호 (없으면 0)"""
+        row = self.conn.execute(
+            "SELECT MAX(page) FROM pages WHERE job = ?", (self.job,)
+        ).fetchone()
+        return row[0] or 0
+
+    def next_seq(self, default: int = 1) -> int:
+        """이어서 사용할 순번 (없으면 default)"""
+        row = self.conn.execute(
+            "SELECT next_seq FROM pages WHERE job = ? ORDER BY page DESC LIMIT 1",
+            (self.job,)
+        ).fetchone()
+        return row[0] if row else default
+
+    def mark_done(self, page: int, records: List[Dict]) -> None:
+        """페이지 완료 기록 : 레코드와 다음 순번을 한 트랜잭션으로 저장"""
+        next_seq = self.next_seq() + len(records)
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM records WHERE job = ? AND page = ?", (self.job, page)
+            )
+            self.conn.executemany(
+                "INSERT INTO records (job, page, data) VALUES (?, ?, ?)",
+                [(self.job, page, json.dumps(r, ensure_ascii=False)) for r in records]
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pages (job, page, next_seq) VALUES (?, ?, ?)",
+                (self.job, page, next_seq)
+            )
+
+    def iter_record_batches(self) -> Iterator[List[Dict]]:
+        """저장된 레코드를 페이지 순서대로 페이지 단위 묶음으로 반환"""
+        cursor = self.conn.execute(
+            "SELECT page, data FROM records WHERE job = ? ORDER BY page, rowid",
+            (self.job,)
+        )
+        for _, rows in groupby(cursor, key=lambda row: row[0]):
+            yield [json.loads(data) for _, data in rows]
+
+    def clear(self) -> None:
+        """job의 체크포인트 삭제 (크롤링을 끝까지 마친 뒤 호출)"""
+        with self.conn:
+            self.conn.execute("DELETE FROM records WHERE job = ?", (self.job,))
+            self.conn.execute("DELETE FROM pages WHERE job = ?", (self.job,))
+
+    def close(self) -> None:
+        self.conn.close()
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+http_cache.py
+
+requests 기반 스크래퍼들이 같이 쓰는 디스크 HTTP 캐시.
+
+- 캐시 키는 params까지 붙은 최종 URL + 요청 자격 정보(Cookie, Authorization) 기준이다.
+- 응답의 Vary 헤더에 나온 요청 헤더 값이 다르면 캐시를 쓰지 않고, Vary: * 응답은 저장하지 않는다.
+- TTL 안에 있는 응답은 네트워크 요청 없이 바로 돌려준다.
+- TTL이 지났으면 ETag / Last-Modified 로 조건부 GET을 보내고, 304면 저장본을 재사용한다.
+- 캐시 폴더 크기는 저장할 때마다 누적해 두고, max_bytes를 넘을 때만 폴더를 훑어
+  가장 오래 안 쓴 항목부터 max_bytes의 EVICT_TARGET 비율까지 지운다(LRU).
+
+사용 예)
+    from http_cache import get_session
+    session = get_session()          # 캐시 사용
+    session = get_session(False)     # 캐시 미사용 (일반 requests.Session)
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# ─── 설정 상수 ────────────────────────────────────────────────────────────
+DEFAULT_CACHE_DIR = Path(__file__).parent / ".http_cache"
+DEFAULT_TTL       = 60 * 60            # 초 단위, 이 시간 안에는 재검증도 하지 않음
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024  # 캐시 폴더 최대 크기
+EVICT_TARGET      = 0.9                # 정리할 때 max_bytes의 이 비율까지 줄여서 매번 정리하지 않게 함
+# ─────────────────────────────────────────────────────────────────────────
+
+logger = logging.getLogger(__name__)
+
+# 저장본으로 응답을 다시 만들 때 의미가 없어지는 헤더
+_DROP_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+# Vary와 상관없이 항상 캐시 키에 넣는 요청 헤더 (사용자마다 응답이 다를 수 있음)
+_KEY_HEADERS = ("Cookie", "Authorization")
+
+
+def cache_key(request: requests.PreparedRequest) -> str:
+    """준비된 요청(최종 URL + 자격 정보 헤더)으로 캐시 키 문자열을 만든다"""
+    parts = [request.url]
+    parts += [f"{name}: {request.headers.get(name, '')}" for name in _KEY_HEADERS]
+    return "\n".join(parts)
+
+
+def vary_headers(resp: requests.Response):
+    """응답 Vary 헤더에 나온 요청 헤더 이름 목록 (소문자)"""
+    return [name.strip().lower() for name in resp.headers.get("Vary", "").split(",") if name.strip()]
+
+
+class HttpCache:
+    """캐시 키(cache_key)별 응답 본문(.body)과 메타데이터(.json)를 폴더에 저장하는 캐시"""
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR,
+                 ttl: float = DEFAULT_TTL, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # 캐시 폴더 크기는 처음에 한 번만 훑고, 이후로는 저장할 때마다 증감만 반영
+        # (다른 프로세스가 같은 폴더를 써서 어긋나도 정리할 때 다시 훑어서 맞춤)
+        self._size = sum(size for _, _, size in self._scan())
+
+    def _paths(self, key: str):
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.body", self.cache_dir / f"{digest}.json"
+
+    def load(self, key: str) -> Optional[Dict]:
+        """저장된 메타데이터를 반환 (없거나 깨졌으면 None)"""
+        body_path, meta_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not body_path.exists():
+            return None
+        return meta
+
+    def is_fresh(self, meta: Dict) -> bool:
+        return time.time() - meta["stored_at"] < self.ttl
+
+    @staticmethod
+    def matches_vary(meta: Dict, request_headers) -> bool:
+        """저장할 때의 Vary 대상 요청 헤더 값이 지금 요청과 같은지"""
+        return all(request_headers.get(name) == value for name, value in meta.get("vary", {}).items())
+
+    def store(self, key: str, resp: requests.Response, request_headers) -> None:
+        """200 응답을 저장하고, 용량이 넘치면 LRU 정리"""
+        if "no-store" in resp.headers.get("Cache-Control", ""):
+            return
+        vary = vary_headers(resp)
+        if "*" in vary:
+            return  # 요청 헤더 외의 조건으로도 달라지는 응답은 저장하지 않음
+
+        body_path, meta_path = self._paths(key)
+        meta = {
+            "url": resp.url,
+            "vary": {name: request_headers.get(name) for name in vary},
+            "stored_at": time.time(),
+            "encoding": resp.encoding,
+            "headers": {k: v for k, v in resp.headers.items()
+                        if k.lower() not in _DROP_HEADERS},
+        }
+        delta = self._atomic_write(body_path, resp.content)
+        delta += self._atomic_write(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+        self._grow(delta)
+
+    def revalidated(self, key: str, meta: Dict, resp: requests.Response) -> None:
+        """304 응답을 받았을 때 저장 시각과 갱신된 검증 헤더를 반영"""
+        meta["stored_at"] = time.time()
+        for name in ("ETag", "Last-Modified", "Cache-Control", "Expires"):
+            if name in resp.headers:
+                meta["headers"][name] = resp.headers[name]
+        _, meta_path = self._paths(key)
+        self._grow(self._atomic_write(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8")))
+
+    def to_response(self, key: str, meta: Dict) -> requests.Response:
+        """저장본으로 requests.Response 객체를 만들어 반환 (resp.from_cache == True)"""
+        body_path, _ = self._paths(key)
+        os.utime(body_path)  # LRU 기준 시각 갱신
+
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.reason = "OK"
+        resp.url = meta["url"]
+        resp._content = body_path.read_bytes()
+        resp._content_consumed = True  # 본문을 이미 다 읽은 응답처럼 iter_content()가 _content를 쓰게 함
+        resp.raw = io.BytesIO(resp._content)
+        resp.headers = CaseInsensitiveDict(meta["headers"])
+        resp.encoding = meta.get("encoding")
+        resp.from_cache = True
+        return resp
+
+    def _scan(self):
+        """캐시 폴더의 (.body/.json 경로, 마지막 사용 시각, 크기) 목록"""
+        files = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith((".body", ".json")):
+                    st = entry.stat()
+                    files.append((entry.path, st.st_mtime, st.st_size))
+        return files
+
+    def _grow(self, delta: int) -> None:
+        """누적 크기에 delta를 더하고, max_bytes를 넘었을 때만 정리"""
+        with self._lock:
+            self._size += delta
+            over = self._size > self.max_bytes
+        if over:
+            self.evict()
+
+    def evict(self) -> None:
+        """캐시 폴더 크기가 max_bytes * EVICT_TARGET 이하가 될 때까지 오래 안 쓴 항목 삭제"""
+        with self._lock:
+            files = self._scan()
+            total = sum(size for _, _, size in files)
+            target = self.max_bytes * EVICT_TARGET
+
+            if total > self.max_bytes:
+                bodies = sorted((mtime, path) for path, mtime, _ in files if path.endswith(".body"))
+                for _, body in bodies:
+                    meta = body[:-len(".body")] + ".json"
+                    for path in (body, meta):
+                        try:
+                            total -= os.path.getsize(path)
+                            os.remove(path)
+                        except FileNotFoundError:
+                            pass
+                    if total <= target:
+                        break
+
+            self._size = total
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes) -> int:
+        """path를 data로 바꾸고 늘어난 바이트 수(덮어쓴 파일 크기를 뺀 값)를 반환"""
+        try:
+            old_size = path.stat().st_size
+        except FileNotFoundError:
+            old_size = 0
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        return len(data) - old_size
+
+
+class CachedSession(requests.Session):
+    """GET 요청에 HttpCache를 적용하는 requests.Session"""
+
+    def __init__(self, cache: Optional[HttpCache] = None):
+        super().__init__()
+        self.cache = cache or HttpCache()
+
+    def request(self, method, url, *args, **kwargs):
+        if method.upper() != "GET" or args:
+            return super().request(method, url, *args, **kwargs)
+
+        # 세션의 params·헤더·쿠키까지 합쳐진 실제 요청으로 키를 만든다
+        prepared = self.prepare_request(requests.Request(
+            "GET", url, params=kwargs.get("params"), headers=kwargs.get("headers"),
+            cookies=kwargs.get("cookies"), auth=kwargs.get("auth")))
+        key = cache_key(prepared)
+
+        meta = self.cache.load(key)
+        if meta and not self.cache.matches_vary(meta, prepared.headers):
+            meta = None  # 다른 Accept·Accept-Language 등으로 받은 저장본
+        if meta and self.cache.is_fresh(meta):
+            logger.debug(f"cache hit: {prepared.url}")
+            return self.cache.to_response(key, meta)
+
+        # 저장본이 있으면 조건부 GET
+        headers = dict(kwargs.pop("headers", None) or {})
+        if meta:
+            etag = meta["headers"].get("ETag")
+            last_modified = meta["headers"].get("Last-Modified")
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        resp = super().request(method, url, *args, headers=headers, **kwargs)
+
+        if resp.status_code == 304 and meta:
+            logger.debug(f"cache revalidated: {prepared.url}")
+            self.cache.revalidated(key, meta, resp)
+            return self.cache.to_response(key, meta)
+
+        if resp.status_code == 200:
+            self.cache.store(key, resp, prepared.headers)
+        return resp
+
+
+def get_session(use_cache: bool = True, **cache_options) -> requests.Session:
+    """
+    캐시를 쓰면 CachedSession, 아니면 일반 requests.Session을 반환.
+    cache_options는 HttpCache(cache_dir, ttl, max_bytes)에 그대로 전달된다.
+    """
+    if not use_cache:
+        return requests.Session()
+    return CachedSession(HttpCache(**cache_options))
@@ -6,16 +6,22 @@
 # 헤드라인 5개를 나열하기 위한 <ul>태그의 css 셀렉터 - #_SECTION_HEADLINE_LIST_7mn9y
 # 3. 출력은 헤드라인 제목 5개를 콘솔에 출력
 
-import requests
 from bs4 import BeautifulSoup
 
+from http_cache import get_session
+from rate_limit import mount_polite
+
+USE_HTTP_CACHE = True  # 뉴스는 자주 바뀌므로 TTL 0 : 매번 조건부 GET으로 재검증만 함
+CACHE_TTL = 0
+
 def main():
     url = 'https://news.naver.com/section/105'  # IT/과학 섹션
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
     }
 
-    res = requests.get(url, headers=headers)
+    session = mount_polite(get_session(USE_HTTP_CACHE, ttl=CACHE_TTL))  # 속도 제한 + 재시도
+    res = session.get(url, headers=headers)
     print(res.text)
     if res.status_code != 200:
         print(f"❌ 요청 실패: {res.status_code}")
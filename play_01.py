@@ -1,4 +1,6 @@
-from playwright.sync_api import sync_playwright
+import asyncio
+
+from browser_pool import FAST_LOAD, BrowserPool, goto_and_wait
 
 URL = "https://news.naver.com/section/105"
 SELECTOR = "#_SECTION_HEADLINE_LIST_hv1tj > li:nth-child(1) > div > div > div.sa_text > a > strong"
@@ -8,20 +10,30 @@ UA_STRING = (
     "Chrome/136.0.0.0 Safari/537.36"
 )
 
-with sync_playwright() as p:
-    browser = p.chromium.launch(headless=False)
+
+async def scrape_headline(page):
+    # 2) 이미지·폰트·외부 도메인 요청은 막고
+    # 3) 네트워크가 잠잠해질 때까지가 아니라 헤드라인 셀렉터가 등장할 때까지만 대기
+    await goto_and_wait(page, URL, SELECTOR, FAST_LOAD)
+
+    # 4) 텍스트 추출
+    return await page.locator(SELECTOR).inner_text()
+
+
+async def run(pool):
+    """이미 열린 풀에서 page를 빌려 헤드라인을 출력 (play_all.py에서 다른 작업과 풀을 같이 씀)"""
     # 1) user_agent 교체
-    context = browser.new_context(user_agent=UA_STRING)
-    page = context.new_page()
+    async with pool.page(user_agent=UA_STRING) as page:
+        headline = await scrape_headline(page)
+    print(headline)
+    return headline
 
-    # 2) 페이지 완전 로드 대기
-    page.goto(URL, wait_until="networkidle")
-    # 3) 셀렉터 등장 대기
-    page.wait_for_selector(SELECTOR, timeout=10_000)
 
-    # 4) 텍스트 추출 및 출력
-    title = page.locator(SELECTOR).inner_text()
-    print(title)
+async def main():
+    # 브라우저는 풀에서 한 번만 띄우고, 작업마다 격리된 context를 빌려 쓴다.
+    async with BrowserPool(headless=False) as pool:
+        await run(pool)
 
-    browser.close()
 
+if __name__ == "__main__":
+    asyncio.run(main())
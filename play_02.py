@@ -7,10 +7,16 @@
 # 콘솔에 출력하는 파이썬 코드
 
 # 최대한 심플하게 작성, 향후 고도화 예정
-# 각 액션 단계별로 확인할수 있게 헤드레스모드 해제하고 3초씩 쉰다.
-from playwright.sync_api import sync_playwright
+# 각 단계는 고정 sleep 없이 "URL 변경 + 다음 셀렉터 등장"을 기다리고 바로 다음 단계로 넘어간다.
+# 수업용으로 단계별 화면을 확인하려면 --demo 옵션 : 헤드레스 해제 + 단계마다 3초씩 쉰다.
+#   python play_02.py            # 빠른 실행
+#   python play_02.py --demo     # 수업용 데모 실행
+import argparse
+import asyncio
 import time
 
+from browser_pool import FAST_LOAD, BrowserPool, goto_and_wait
+
 URL = "https://webscraper.io/test-sites/e-commerce/allinone"
 MAIN_MENU = "#side-menu > li:nth-child(2) > a"
 SUB_MENU  = "#side-menu > li.nav-item.active > ul > li:nth-child(2) > a"
@@ -19,30 +25,76 @@ PRODUCT   = (
     "div.col-lg-9 > div.row > div:nth-child(1) > div > "
     "div > div.caption > h4:nth-child(2) > a"
 )
+DEMO_PACING = 3  # --demo 일 때 단계마다 쉬는 시간(초)
+TIMEOUT = 10_000
+
+
+def build_steps(url=URL):
+    """
+    상품 조회까지의 탐색 단계 목록.
+    goto/click 중 하나를 수행하고 wait_for 셀렉터가 나타나면 단계 완료로 본다.
+    """
+    return [
+        {"name": "랜딩 페이지", "goto": url,        "wait_for": MAIN_MENU},
+        {"name": "메뉴 클릭",   "click": MAIN_MENU, "wait_for": SUB_MENU},
+        {"name": "하위 메뉴",   "click": SUB_MENU,  "wait_for": PRODUCT},
+    ]
+
+
+async def run_steps(page, steps, pacing=0, profile=FAST_LOAD):
+    """
+    steps를 순서대로 실행하고 [(단계 이름, 소요 시간(초)), ...]을 반환.
+    click 단계는 클릭 후 URL이 바뀌고 wait_for 셀렉터가 나타날 때까지만 기다린다.
+    pacing(초)을 주면 단계가 끝날 때마다 그만큼 쉰다. (데모용, 소요 시간에는 포함하지 않음)
+    """
+    timings = []
+
+    for step in steps:
+        start = time.perf_counter()
+
+        if "goto" in step:
+            await goto_and_wait(page, step["goto"], step["wait_for"], profile, TIMEOUT)
+        else:
+            before = page.url
+            await page.click(step["click"])
+            await page.wait_for_url(lambda url: url != before, timeout=TIMEOUT)
+            await page.wait_for_selector(step["wait_for"], timeout=TIMEOUT)
+
+        timings.append((step["name"], time.perf_counter() - start))
+
+        if pacing:
+            await asyncio.sleep(pacing)
+
+    return timings
+
+
+async def run(pool, demo=False, url=URL):
+    """이미 열린 풀에서 page를 빌려 상품 조회 (play_all.py에서 다른 작업과 풀을 같이 씀)"""
+    async with pool.page() as page:
+        # 1) 랜딩 페이지 → 2) 메뉴 클릭 → 3) 하위 메뉴 클릭
+        timings = await run_steps(page, build_steps(url), pacing=DEMO_PACING if demo else 0)
 
-with sync_playwright() as p:
-    browser = p.chromium.launch(headless=False)
-    page = browser.new_page()
+        # 4) 첫 번째 상품 이름 추출 및 출력
+        product = await page.locator(PRODUCT).inner_text()
+        print(product)
 
-    # 1) 랜딩 페이지 이동
-    page.goto(URL, wait_until="networkidle")
-    time.sleep(3)
+        for name, seconds in timings:
+            print(f" - {name}: {seconds * 1000:.0f}ms")
 
-    # 2) 첫 번째 메뉴 클릭
-    page.wait_for_selector(MAIN_MENU, timeout=10_000)
-    page.click(MAIN_MENU)
-    time.sleep(3)
+        if demo:
+            await asyncio.sleep(DEMO_PACING)
+    return product
 
-    # 3) 두 번째 하위 메뉴 클릭
-    page.wait_for_selector(SUB_MENU, timeout=10_000)
-    page.click(SUB_MENU)
-    time.sleep(3)
 
-    # 4) 첫 번째 상품 이름 추출 및 출력
-    page.wait_for_selector(PRODUCT, timeout=10_000)
-    print(page.locator(PRODUCT).inner_text())
+async def main(demo=False, url=URL):
+    async with BrowserPool(headless=not demo) as pool:
+        await run(pool, demo, url)
 
-    time.sleep(3)
-    browser.close()
 
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="webscraper.io 상품 조회")
+    parser.add_argument("--demo", action="store_true", help="헤드레스 해제 + 단계별 3초 대기 (수업용)")
+    parser.add_argument("--url", default=URL, help="랜딩 페이지 URL (로컬 사본 사용 시)")
+    args = parser.parse_args()
 
+    asyncio.run(main(args.demo, args.url))
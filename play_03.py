@@ -1,48 +1,92 @@
-from playwright.sync_api import sync_playwright
+import asyncio
 from bs4 import BeautifulSoup
 import pandas as pd
-import time
-import re  # ① 숫자 처리용
+
+from browser_pool import FAST_LOAD, BrowserPool, goto_and_wait
+from record_normalize import normalize_frame
+from record_sinks import open_sink
 
 URL = "https://www.melon.com/chart/index.htm"
+ROW_SELECTOR = 'tr[id^="lst"]'
+
+# 컬럼 이름 : (행 기준 셀렉터, 값을 꺼낼 속성 - None이면 텍스트)
+COLUMNS = {
+    "순위":       ('td:nth-child(2) span.rank', None),
+    "곡 제목":     ('td:nth-child(6) .ellipsis.rank01 a', None),
+    "아티스트":    ('td:nth-child(6) .ellipsis.rank02 a', None),
+    "앨범명":      ('td:nth-child(7) div a', None),
+    "좋아요":      ('td:nth-child(8) button span.cnt', None),
+    "이미지 URL":  ('td:nth-child(4) a img', 'src'),
+}
+INT_COLUMNS = ("순위", "좋아요")
+
+
+async def fetch_html(pool, url):
+    """
+    이미 열린 브라우저 풀에서 page를 빌려 렌더링된 HTML을 가져온다.
+    이미지·폰트·외부 요청은 막고, 차트 행이 나타나면 바로 가져온다.
+    (앨범 이미지 URL은 img의 src 속성만 읽으므로 이미지를 받지 않아도 된다)
+    """
+    async with pool.page() as page:
+        await goto_and_wait(page, url, ROW_SELECTOR, FAST_LOAD)
+        return await page.content()
+
+
+def _value(tag, attr):
+    if tag is None:
+        return None
+    return tag.get(attr) if attr else tag.get_text(strip=True)
+
+
+def parse_chart(html):
+    """
+    차트 HTML을 타입이 정리된 DataFrame으로 변환.
+    컬럼마다 문서 전체에서 한 번씩만 select 하고, 숫자 정리는 pandas 벡터 연산으로 처리한다.
+    찾은 셀은 자신이 속한 행의 위치에 넣으므로, 어떤 행에 셀이 빠지거나 더 있어도 값이 밀리지 않는다.
+    (빠진 셀은 결측, 한 행에 여러 개 있으면 select_one처럼 첫 번째 값을 쓴다)
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    rows = soup.select(ROW_SELECTOR)
+    row_index = {id(row): i for i, row in enumerate(rows)}
+
+    data = {}
+    for name, (selector, attr) in COLUMNS.items():
+        values = [None] * len(rows)
+        filled = [False] * len(rows)
+        for tag in soup.select(f"{ROW_SELECTOR} > {selector}"):
+            # 셀을 감싸는 가장 가까운 차트 행을 찾는다
+            i = next((row_index[id(p)] for p in tag.parents if id(p) in row_index), None)
+            if i is not None and not filled[i]:
+                values[i] = _value(tag, attr)
+                filled[i] = True
+        data[name] = values
+
+    return normalize_frame(pd.DataFrame(data), int_columns=INT_COLUMNS)
+
+
+async def run(pool, output="melon_chart.xlsx"):
+    """이미 열린 풀로 차트를 가져와 저장 (play_all.py에서 다른 작업과 풀을 같이 씀)"""
+    # 1) Playwright로 HTML 가져오기
+    html = await fetch_html(pool, URL)
+
+    # 2) BeautifulSoup 파싱 : 행마다 select_one을 반복하지 않고 컬럼 단위로 한 번에 추출
+    chart = parse_chart(html)
+
+    # 3) 엑셀 저장
+    with open_sink(output) as sink:
+        sink.write_frame(chart)
+
+    print(f"✅ {output} 파일로 저장 완료!")
+    return chart
+
+
+async def main():
+    async with BrowserPool() as pool:
+        await run(pool)
+
 
-# 1) Playwright로 HTML 가져오기
-with sync_playwright() as p:
-    browser = p.chromium.launch()
-    page = browser.new_page()
-    page.goto(URL, wait_until="networkidle")
-    html = page.content()
-    browser.close()
-
-# 2) BeautifulSoup 파싱
-soup = BeautifulSoup(html, "html.parser")
-rows = soup.select('tr[id^="lst"]')
-
-# 3) 결과 저장용 리스트 준비
-data = []
-for row in rows:
-    # 원본 텍스트
-    rank_str = row.select_one('td:nth-child(2) span.rank').get_text(strip=True)
-    like_str = row.select_one('td:nth-child(8) button span.cnt').get_text(strip=True)
-
-    # 숫자 변환
-    rank_num = int(rank_str)
-    like_num = int(re.sub(r'\D', '', like_str))
-
-    data.append({
-        "순위":       rank_num,
-        "곡 제목":     row.select_one('td:nth-child(6) .ellipsis.rank01 a').get_text(strip=True),
-        "아티스트":    row.select_one('td:nth-child(6) .ellipsis.rank02 a').get_text(strip=True),
-        "앨범명":      row.select_one('td:nth-child(7) div a').get_text(strip=True),
-        "좋아요":      like_num,
-        "이미지 URL":  row.select_one('td:nth-child(4) a img')['src']
-    })
-
-# 4) DataFrame 생성 후 엑셀 저장
-df = pd.DataFrame(data)
-df.to_excel("melon_chart.xlsx", index=False)
-
-print("✅ melon_chart.xlsx 파일로 저장 완료!")
+if __name__ == "__main__":
+    asyncio.run(main())
 
 
 # 현재 페이지의 멜론 차트 100곡을 스크래핑할거야
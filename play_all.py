@@ -0,0 +1,62 @@
+# play_01 ~ play_03 작업을 브라우저 풀 하나로 실행
+# 스크립트를 하나씩 따로 실행하면 매번 Chromium을 새로 띄우지만,
+# 여기서는 풀을 한 번만 열고 warm 상태의 브라우저에서 작업마다 context만 새로 만들어 쓴다.
+#
+#   python play_all.py               # 세 작업을 동시에 실행
+#   python play_all.py --repeat 3    # 같은 풀로 세 작업을 3번 반복 (두 번째부터는 브라우저 실행 비용 없음)
+#
+# 다른 프로세스와도 브라우저를 같이 쓰려면 `python browser_pool.py --serve`로 서버를 띄우고
+# 환경 변수 PLAYWRIGHT_CDP_ENDPOINT=http://127.0.0.1:9222 를 지정한다. (play_01 ~ 03 단독 실행도 동일)
+# (필요 시) pip install playwright && playwright install chromium
+
+import argparse
+import asyncio
+import logging
+import time
+
+import play_01
+import play_02
+import play_03
+from browser_pool import BrowserPool
+
+JOBS = {
+    "play_01": play_01.run,
+    "play_02": play_02.run,
+    "play_03": play_03.run,
+}
+
+
+async def run_jobs(pool, names):
+    """names의 작업들을 같은 풀에서 동시에 실행하고 {작업 이름: 결과 또는 예외}를 반환"""
+    results = await asyncio.gather(*(JOBS[name](pool) for name in names), return_exceptions=True)
+    return dict(zip(names, results))
+
+
+async def main(names, repeat=1, size=1, max_pages=8):
+    async with BrowserPool(size=size, max_pages=max_pages) as pool:
+        for i in range(repeat):
+            start = time.perf_counter()
+            results = await run_jobs(pool, names)
+            elapsed = time.perf_counter() - start
+
+            print(f"\n[{i + 1}/{repeat}] {len(names)}개 작업 {elapsed:.2f}초")
+            for name, result in results.items():
+                if isinstance(result, Exception):
+                    print(f" - {name}: 실패 ({type(result).__name__}: {result})")
+                else:
+                    print(f" - {name}: 완료")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="play 작업들을 브라우저 풀 하나로 실행")
+    parser.add_argument("jobs", nargs="*", help=f"실행할 작업 (기본: 전체, {', '.join(JOBS)})")
+    parser.add_argument("--repeat", type=int, default=1, help="같은 풀로 반복 실행할 횟수")
+    parser.add_argument("--size", type=int, default=1, help="풀의 브라우저 수")
+    parser.add_argument("--max-pages", type=int, default=8, help="동시에 열 page 수")
+    args = parser.parse_args()
+    unknown = [name for name in args.jobs if name not in JOBS]
+    if unknown:
+        parser.error(f"알 수 없는 작업: {', '.join(unknown)}")
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    asyncio.run(main(args.jobs or list(JOBS), args.repeat, args.size, args.max_pages))
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+rate_limit.py
+
+모든 스크래퍼가 같이 쓰는 호스트별 요청 속도 제한 + 재시도 스케줄러.
+
+- HostRateLimiter : 호스트마다 토큰 버킷 하나 (초당 rate개, 최대 burst개까지 몰아서 허용)
+- RetryPolicy     : 429/5xx·연결 오류 시 지터(jitter)가 섞인 지수 백오프로 재시도,
+                    Retry-After 헤더가 있으면 줄이지 않고 그 시간만큼 해당 호스트 전체를 쉬게 한다.
+                    (max_retry_after보다 길면 재시도하지 않고 응답을 그대로 돌려준다)
+                    재시도는 멱등(idempotent) 메서드만 한다. (POST 등은 한 번만 보냄)
+- PoliteAdapter   : 위 두 가지를 적용한 requests HTTPAdapter (동기 requests 경로)
+- call_with_retry_async : 코루틴(Playwright page.goto 등)에 같은 규칙을 적용 (비동기 경로)
+
+사용 예)
+    session = requests.Session()
+    mount_polite(session)                       # 이후 session.get()은 속도 제한 + 재시도 적용
+
+    response = await call_with_retry_async(lambda: page.goto(url), url)
+"""
+
+import asyncio
+import email.utils
+import logging
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# ─── 설정 상수 ────────────────────────────────────────────────────────────
+DEFAULT_RATE        = 5.0    # 호스트당 초당 요청 수
+DEFAULT_BURST       = 5      # 한 번에 몰아서 보낼 수 있는 최대 요청 수
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BACKOFF     = 0.5    # 첫 재시도 기준 대기(초), 재시도마다 2배
+DEFAULT_MAX_BACKOFF = 30.0
+DEFAULT_MAX_RETRY_AFTER = 300.0  # 서버가 이보다 오래 기다리라고 하면 재시도하지 않음
+RETRY_STATUSES      = (429, 500, 502, 503, 504)
+RETRY_METHODS       = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE")  # urllib3 Retry와 같음
+# ─────────────────────────────────────────────────────────────────────────
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지는 토큰 버킷 (스레드 안전, 동기/비동기 대기 모두 지원)"""
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """토큰 하나를 예약하고, 그 토큰을 쓸 수 있을 때까지 기다려야 할 시간(초)을 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """이 버킷을 쓰는 모든 요청을 seconds초 동안 멈춘다 (Retry-After 처리용)"""
+        with self._lock:
+            self.tokens = min(self.tokens, 1.0) - seconds * self.rate
+
+
+class HostRateLimiter:
+    """호스트별 TokenBucket 모음. overrides로 호스트마다 다른 속도를 줄 수 있다."""
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST,
+                 overrides: Optional[Dict[str, float]] = None):
+        self.rate = rate
+        self.burst = burst
+        self.overrides = overrides or {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).hostname or ""
+        with self._lock:
+            if host not in self._buckets:
+                rate = self.overrides.get(host, self.rate)
+                self._buckets[host] = TokenBucket(rate, max(self.burst, 1))
+            return self._buckets[host]
+
+
+class RetryPolicy:
+    """재시도 여부와 대기 시간 결정 (full jitter 지수 백오프 + Retry-After)"""
+
+    def __init__(self, max_retries: int = DEFAULT_MAX_RETRIES, backoff: float = DEFAULT_BACKOFF,
+                 max_backoff: float = DEFAULT_MAX_BACKOFF, statuses=RETRY_STATUSES,
+                 methods=RETRY_METHODS, max_retry_after: Optional[float] = DEFAULT_MAX_RETRY_AFTER):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = set(statuses)
+        self.methods = {m.upper() for m in methods}
+        self.max_retry_after = max_retry_after
+
+    def should_retry(self, attempt: int, status: Optional[int] = None,
+                     method: Optional[str] = None) -> bool:
+        """
+        attempt는 0부터 시작. status가 None이면 연결 오류로 본다.
+        method를 주면 멱등 메서드(self.methods)일 때만 재시도한다. (서버에 두 번 반영되지 않도록)
+        """
+        if attempt >= self.max_retries:
+            return False
+        if method is not None and method.upper() not in self.methods:
+            return False
+        return status is None or status in self.statuses
+
+    def accepts_retry_after(self, retry_after: Optional[float]) -> bool:
+        """서버가 요청한 대기 시간을 기다릴 수 있는지 (max_retry_after가 None이면 항상)"""
+        return retry_after is None or self.max_retry_after is None or retry_after <= self.max_retry_after
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Retry-After가 있으면 그 값을 줄이지 않고 그대로, 없으면 0 ~ backoff·2^attempt 사이 임의 값
+        (Retry-After가 너무 길면 accepts_retry_after()로 먼저 걸러낸다)
+        """
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 초로 변환"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+# 모든 스크래퍼가 공유하는 기본 인스턴스
+DEFAULT_LIMITER = HostRateLimiter()
+DEFAULT_POLICY = RetryPolicy()
+
+
+class PoliteAdapter(HTTPAdapter):
+    """요청 전 호스트별 토큰을 얻고, 실패 응답·연결 오류는 정책에 따라 재시도하는 어댑터"""
+
+    def __init__(self, limiter: HostRateLimiter = DEFAULT_LIMITER,
+                 policy: RetryPolicy = DEFAULT_POLICY, **adapter_options):
+        super().__init__(**adapter_options)
+        self.limiter = limiter
+        self.policy = policy
+
+    def send(self, request, **kwargs):
+        bucket = self.limiter.bucket(request.url)
+        attempt = 0
+
+        while True:
+            bucket.acquire()
+            try:
+                resp = super().send(request, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if not self.policy.should_retry(attempt, method=request.method):
+                    raise
+                wait = self.policy.delay(attempt)
+                logger.warning(f"{request.url} 연결 오류, {wait:.1f}초 후 재시도: {e}")
+            else:
+                if not self.policy.should_retry(attempt, resp.status_code, request.method):
+                    return resp
+                retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                if not self.policy.accepts_retry_after(retry_after):
+                    logger.warning(f"{request.url} 응답 {resp.status_code}, Retry-After {retry_after:.0f}초가 "
+                                   f"최대 대기({self.policy.max_retry_after:.0f}초)보다 길어 재시도하지 않음")
+                    return resp
+                wait = self.policy.delay(attempt, retry_after)
+                logger.warning(f"{request.url} 응답 {resp.status_code}, {wait:.1f}초 후 재시도")
+                resp.close()
+                if retry_after is not None:
+                    # 호스트 전체를 멈추고, 대기는 다음 bucket.acquire()에서 한다.
+                    bucket.pause(wait)
+                    wait = 0
+
+            if wait > 0:
+                time.sleep(wait)
+            attempt += 1
+
+
+def mount_polite(session: requests.Session, limiter: HostRateLimiter = DEFAULT_LIMITER,
+                 policy: RetryPolicy = DEFAULT_POLICY, pool_maxsize: int = 10) -> requests.Session:
+    """session의 http/https 요청에 PoliteAdapter를 적용하고 session을 반환"""
+    adapter = PoliteAdapter(limiter, policy, pool_connections=1, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+async def call_with_retry_async(request: Callable[[], Awaitable[Any]], url: str,
+                                limiter: HostRateLimiter = DEFAULT_LIMITER,
+                                policy: RetryPolicy = DEFAULT_POLICY,
+                                errors: Tuple[Type[BaseException], ...] = (ConnectionError, asyncio.TimeoutError)) -> Any:
+    """
+    request()가 만드는 코루틴을 속도 제한 + 재시도 규칙으로 실행한다.
+    결과 객체에 status(또는 status_code)와 headers가 있으면 응답 코드도 검사한다.
+    (Playwright page.goto, aiohttp 응답 등) errors에 해당하는 예외는 연결 오류로 보고 재시도한다.
+    """
+    bucket = limiter.bucket(url)
+    attempt = 0
+
+    while True:
+        await bucket.acquire_async()
+        try:
+            result = await request()
+        except errors as e:
+            if not policy.should_retry(attempt):
+                raise
+            wait = policy.delay(attempt)
+            logger.warning(f"{url} 연결 오류, {wait:.1f}초 후 재시도: {e}")
+        else:
+            status = getattr(result, "status", None) or getattr(result, "status_code", None)
+            if status is None or not policy.should_retry(attempt, status):
+                return result
+            headers = getattr(result, "headers", None) or {}
+            retry_after = parse_retry_after(headers.get("retry-after") or headers.get("Retry-After"))
+            if not policy.accepts_retry_after(retry_after):
+                logger.warning(f"{url} 응답 {status}, Retry-After {retry_after:.0f}초가 "
+                               f"최대 대기({policy.max_retry_after:.0f}초)보다 길어 재시도하지 않음")
+                return result
+            wait = policy.delay(attempt, retry_after)
+            logger.warning(f"{url} 응답 {status}, {wait:.1f}초 후 재시도")
+            if retry_after is not None:
+                bucket.pause(wait)
+                wait = 0
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+        attempt += 1
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+record_normalize.py
+
+스크래핑한 문자열 컬럼을 숫자로 정리하는 pandas 벡터 연산 모음.
+행마다 re.sub / int() 를 호출하지 않고 컬럼 전체를 한 번에 변환한다.
+
+    순위   "1"          → 1       (to_int)
+    좋아요 "총건수\n123,456" → 123456  (to_int)
+    가격   "£51.77"     → 51.77   (to_float)
+
+숫자가 하나도 없는 값은 결측(<NA>)이 되며, 결과 컬럼은 Int64 / Float64 타입이다.
+"""
+
+from typing import Dict, Iterable, List
+
+import pandas as pd
+
+
+def to_int(series: pd.Series) -> pd.Series:
+    """숫자 이외의 문자를 모두 지우고 Int64 컬럼으로 변환"""
+    digits = series.astype("string").str.replace(r"\D", "", regex=True)
+    return pd.to_numeric(digits.mask(digits == ""), errors="coerce").astype("Int64")
+
+
+def to_float(series: pd.Series) -> pd.Series:
+    """숫자와 소수점 이외의 문자를 모두 지우고 Float64 컬럼으로 변환"""
+    cleaned = series.astype("string").str.replace(r"[^\d.]", "", regex=True)
+    return pd.to_numeric(cleaned.mask(cleaned == ""), errors="coerce").astype("Float64")
+
+
+def normalize_frame(df: pd.DataFrame, int_columns: Iterable[str] = (),
+                    float_columns: Iterable[str] = ()) -> pd.DataFrame:
+    """지정한 컬럼들을 정수/실수 타입으로 정리한 DataFrame을 반환 (원본은 변경하지 않음)"""
+    df = df.copy()
+    for col in int_columns:
+        df[col] = to_int(df[col])
+    for col in float_columns:
+        df[col] = to_float(df[col])
+    return df
+
+
+def to_records(df: pd.DataFrame) -> List[Dict]:
+    """DataFrame을 레코드 딕셔너리 목록으로 변환 (결측값은 None, 값은 파이썬 기본 타입)"""
+    return df.astype(object).where(df.notna(), None).to_dict("records")
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+record_sinks.py
+
+스크래핑한 레코드(딕셔너리)를 페이지 단위로 바로 파일에 이어 쓰는 저장소.
+전체 레코드를 메모리에 모았다가 마지막에 한 번에 저장하지 않으므로
+수집량과 상관없이 메모리 사용량이 일정하다.
+
+- CsvSink     : 배치마다 flush → 프로세스가 죽어도 그 시점까지의 행이 남는다.
+- ExcelSink   : openpyxl write-only 모드 (행은 임시파일로 흘려보내고 close 시 .xlsx 완성)
+- ParquetSink : pyarrow ParquetWriter, 배치마다 row group 하나 (타입이 지정된 컬럼)
+
+with 블록 안에서 예외가 나도 close()가 호출되어 그때까지 쓴 행으로 올바른 파일이 만들어진다.
+
+사용 예)
+    with open_sink("all_books.csv") as sink:
+        sink.write_rows(books)
+(필요 시) pip install openpyxl pyarrow
+"""
+
+import csv
+import logging
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RecordSink(ABC):
+    """
+    모든 sink의 공통 동작 (컬럼 순서 고정, 행 수 집계, with 문 지원)
+    하위 클래스는 _open/_write/_close를 모두 구현해야 만들 수 있다.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.columns: Optional[List[str]] = None
+        self.count = 0
+
+    def write_rows(self, rows: List[Dict]) -> None:
+        """레코드 묶음을 파일 끝에 추가 (첫 묶음의 키 순서가 컬럼 순서가 된다)"""
+        if not rows:
+            return
+        if self.columns is None:
+            self.columns = list(rows[0].keys())
+            self._open()
+        self._write([[row.get(col) for col in self.columns] for row in rows])
+        self.count += len(rows)
+
+    def write_frame(self, df) -> None:
+        """pandas DataFrame을 행 묶음으로 추가 (결측값 <NA>/NaN은 빈 칸으로 저장)"""
+        df = df.astype(object).where(df.notna(), None)
+        self.write_rows(df.to_dict("records"))
+
+    def close(self) -> None:
+        if self.columns is not None:
+            self._close()
+        logger.info(f"{self.count}건 저장 완료: '{self.path}'")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    # 하위 클래스 구현 부분
+    @abstractmethod
+    def _open(self) -> None:
+        """첫 묶음이 들어왔을 때 파일을 열고 헤더(self.columns)를 쓴다"""
+
+    @abstractmethod
+    def _write(self, values: List[List]) -> None:
+        """컬럼 순서대로 정리된 행 값 목록을 쓴다"""
+
+    @abstractmethod
+    def _close(self) -> None:
+        """파일을 완성하고 닫는다"""
+
+
+class CsvSink(RecordSink):
+    """CSV 저장 (엑셀에서 한글이 깨지지 않도록 utf-8-sig)"""
+
+    def _open(self) -> None:
+        self._file = open(self.path, "w", newline="", encoding="utf-8-sig")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.columns)
+
+    def _write(self, values: List[List]) -> None:
+        self._writer.writerows(values)
+        self._file.flush()
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+class ExcelSink(RecordSink):
+    """openpyxl write-only 모드 .xlsx 저장"""
+
+    def _open(self) -> None:
+        from openpyxl import Workbook
+
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet()
+        self._sheet.append(self.columns)
+
+    def _write(self, values: List[List]) -> None:
+        for row in values:
+            self._sheet.append(row)
+
+    def _close(self) -> None:
+        self._workbook.save(self.path)
+
+
+class ParquetSink(RecordSink):
+    """
+    Parquet 저장. schema(pyarrow.Schema)를 주지 않으면 첫 묶음에서 타입을 추론하고,
+    이후 묶음은 같은 스키마로 변환해서 쓴다.
+    """
+
+    def __init__(self, path: Path, schema=None):
+        super().__init__(path)
+        self.schema = schema
+
+    def _open(self) -> None:
+        self._writer = None
+
+    def _write(self, values: List[List]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        columns = {col: [row[i] for row in values] for i, col in enumerate(self.columns)}
+        if self.schema is None:
+            table = pa.table(columns)
+            self.schema = table.schema
+        else:
+            table = pa.table(columns, schema=self.schema)
+
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, self.schema)
+        self._writer.write_table(table)
+
+    def _close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+SINKS = {
+    ".csv": CsvSink,
+    ".xlsx": ExcelSink,
+    ".parquet": ParquetSink,
+}
+
+
+def open_sink(path: Path, **options) -> RecordSink:
+    """확장자(.csv / .xlsx / .parquet)에 맞는 sink를 만든다."""
+    suffix = Path(path).suffix.lower()
+    if suffix not in SINKS:
+        raise ValueError(f"지원하지 않는 출력 형식입니다: {suffix}")
+    return SINKS[suffix](path, **options)
@@ -5,10 +5,14 @@
 # 첫번째 li 태그는 타이틀 메타데이터이고 두번째 li 부터 실제 카테고리 정보가 있음
 # 카테고리 정보를 콘솔로 출력
 
-import requests
 from bs4 import BeautifulSoup
 import re
 
+from http_cache import get_session
+from rate_limit import mount_polite
+
+USE_HTTP_CACHE = True  # True면 재실행 시 변경 없는 페이지는 캐시에서 가져옴
+
 def extract_real_url(js_text):
     """javascript:goMenu('...') 에서 실제 URL 추출"""
     match = re.search(r"goMenu\('([^']+)'", js_text)
@@ -20,7 +24,8 @@ def main():
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
     }
 
-    res = requests.get(url, headers=headers)
+    session = mount_polite(get_session(USE_HTTP_CACHE))  # 속도 제한 + 재시도
+    res = session.get(url, headers=headers)
     if res.status_code != 200:
         print(f"❌ 요청 실패: {res.status_code}")
         return
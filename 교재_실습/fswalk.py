@@ -0,0 +1,64 @@
+# 공용 디렉토리 탐색 모듈
+# os.listdir + os.path.isdir/isfile 대신 os.scandir를 사용합니다.
+# scandir가 돌려주는 DirEntry는 파일 종류 정보를 이미 가지고 있어서
+# 항목마다 stat 시스템 콜을 다시 호출하지 않습니다. (파일이 많거나 네트워크 드라이브일수록 효과가 큼)
+#
+# 사용 예:
+#   from fswalk import walk_files
+#   for entry in walk_files("data", recursive=True, include=["*.txt", "*.log"]):
+#       print(entry.path, entry.stat().st_size)
+import os
+from fnmatch import fnmatch
+
+
+def _matches(rel_path, name, patterns):
+    """상대 경로 또는 파일 이름이 패턴 중 하나와 일치하는지 확인 (대소문자 무시)"""
+    rel_path = rel_path.lower()
+    name = name.lower()
+    return any(fnmatch(rel_path, p.lower()) or fnmatch(name, p.lower()) for p in patterns)
+
+
+def scan_entries(root, recursive=False, include=None, exclude=None, files_only=True):
+    """
+    폴더의 항목을 DirEntry로 하나씩 돌려주는 제너레이터
+
+    Args:
+        root (str): 탐색할 폴더 경로
+        recursive (bool): 하위 폴더까지 탐색할지 여부
+        include (list): 포함할 glob 패턴 목록 (예: ['*.txt']), None이면 전부 포함
+        exclude (list): 제외할 glob 패턴 목록, 폴더가 일치하면 그 하위는 탐색하지 않음
+        files_only (bool): True면 일반 파일만, False면 폴더 항목도 함께 반환
+
+    Yields:
+        os.DirEntry: 조건에 맞는 항목 (entry.path, entry.name, entry.stat() 사용 가능)
+    """
+    # 재귀 호출 대신 스택을 사용해 깊은 폴더 구조에서도 안전하게 탐색
+    stack = [(root, "")]
+
+    while stack:
+        folder, rel_folder = stack.pop()
+        with os.scandir(folder) as it:
+            for entry in it:
+                rel_path = f"{rel_folder}{entry.name}"
+
+                if exclude and _matches(rel_path, entry.name, exclude):
+                    continue
+
+                # 심볼릭 링크를 따라가지 않음 (링크 순환 방지)
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append((entry.path, f"{rel_path}/"))
+                    if files_only:
+                        continue
+                elif not entry.is_file():
+                    continue
+
+                if include and not _matches(rel_path, entry.name, include):
+                    continue
+
+                yield entry
+
+
+def walk_files(root, recursive=False, include=None, exclude=None):
+    """scan_entries(..., files_only=True)의 줄임 (파일 항목만 반환)"""
+    return scan_entries(root, recursive=recursive, include=include, exclude=exclude)
@@ -18,8 +18,9 @@ def list_files_in_directory(directory_path):
     if not os.path.exists(directory_path):
         return []
     
-    return [f for f in os.listdir(directory_path) 
-            if os.path.isfile(os.path.join(directory_path, f))]
+    # os.scandir는 파일 종류 정보를 함께 돌려주므로 항목마다 stat을 다시 하지 않음
+    with os.scandir(directory_path) as it:
+        return [entry.name for entry in it if entry.is_file()]
 
 def get_file_extension(file_path):
     """파일 확장자 반환"""
@@ -2,10 +2,10 @@
 import requests
 from bs4 import BeautifulSoup
 
-def scrape_website(url):
-    """웹사이트 내용을 스크래핑하는 함수"""
+def scrape_website(url, session=None):
+    """웹사이트 내용을 스크래핑하는 함수 (session에 캐시 세션을 넘기면 캐시 사용)"""
     try:
-        response = requests.get(url)
+        response = (session or requests).get(url)
         response.raise_for_status()  # 오류 발생시 예외 발생
         
         soup = BeautifulSoup(response.text, 'html.parser')
@@ -1,14 +1,20 @@
 # 🔧 파일 분류 자동화 프로그램
 import os
 import shutil
+import sys
 
-def classify_files(source_dir, target_dir):
+# 공용 모듈(교재_실습/fswalk.py)을 불러오기 위해 상위 폴더를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fswalk import walk_files
+
+def classify_files(source_dir, target_dir, recursive=False):
     """
     다양한 확장자의 파일들을 자동으로 분류하는 함수
 
     Args:
         source_dir (str): 분류할 파일들이 있는 소스 디렉토리 경로
         target_dir (str): 분류된 파일들이 저장될 대상 디렉토리 경로
+        recursive (bool): 하위 폴더의 파일까지 분류할지 여부
     """
     # 소스 디렉토리에 파일이 없으면 종료
     if not os.path.exists(source_dir):
@@ -21,12 +27,14 @@ def classify_files(source_dir, target_dir):
     # 파일 분류 작업 시작
     file_count = 0
 
-    for filename in os.listdir(source_dir):
-        source_file_path = os.path.join(source_dir, filename)
+    # 파일 항목만 가져오기 (디렉토리는 무시, 대상 폴더가 소스 안에 있으면 제외)
+    exclude = None
+    if os.path.abspath(target_dir).startswith(os.path.abspath(source_dir) + os.sep):
+        exclude = [os.path.relpath(target_dir, source_dir).replace(os.sep, '/')]
 
-        # 디렉토리는 무시
-        if os.path.isdir(source_file_path):
-            continue
+    for entry in walk_files(source_dir, recursive=recursive, exclude=exclude):
+        filename = entry.name
+        source_file_path = entry.path
 
         # 파일 확장자 추출 (마지막 점 이후 문자열)
         file_extension = filename.split('.')[-1].lower()
@@ -3,6 +3,11 @@
 import os
 import datetime
 import shutil
+import sys
+
+# 공용 모듈(교재_실습/fswalk.py)을 불러오기 위해 상위 폴더를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fswalk import walk_files
 
 def rename_files(folder_path, prefix="file_"):
     """
@@ -12,18 +17,14 @@ def rename_files(folder_path, prefix="file_"):
         folder_path: 파일이 있는 폴더 경로
         prefix: 새 파일 이름의 접두어
     """
-    # 폴더 내 파일 목록 가져오기 및 정렬
-    files = sorted(os.listdir(folder_path))
+    # 폴더 내 파일 목록 가져오기 및 정렬 (디렉토리는 제외)
+    files = sorted(entry.name for entry in walk_files(folder_path))
     
     # 각 파일에 대해 이름 변경 작업 수행
     for idx, filename in enumerate(files, 1):
         # 파일 경로
         file_path = os.path.join(folder_path, filename)
         
-        # 디렉토리는 건너뛰기
-        if os.path.isdir(file_path):
-            continue
-            
         # 파일명과 확장자 분리
         _, ext = os.path.splitext(filename)
         
@@ -46,9 +47,7 @@ def rename_png_files(folder_path, prefix="img_"):
         prefix: 새 파일 이름의 접두어
     """
     # PNG 파일만 필터링
-    png_files = [f for f in os.listdir(folder_path) 
-                if os.path.isfile(os.path.join(folder_path, f)) and 
-                f.lower().endswith('.png')]
+    png_files = [entry.name for entry in walk_files(folder_path, include=['*.png'])]
     
     # 파일 정렬
     png_files.sort()
@@ -77,13 +76,10 @@ def add_date_prefix(folder_path, date_str=None):
     if date_str is None:
         date_str = datetime.datetime.now().strftime("%Y-%m-%d_")
     
-    # 폴더 내 모든 파일에 대해 처리
-    for filename in os.listdir(folder_path):
-        file_path = os.path.join(folder_path, filename)
-        
-        # 디렉토리는 건너뛰기
-        if os.path.isdir(file_path):
-            continue
+    # 폴더 내 모든 파일에 대해 처리 (이름을 바꾸는 중에 목록이 변하지 않도록 먼저 목록을 만듦)
+    for entry in list(walk_files(folder_path)):
+        filename = entry.name
+        file_path = entry.path
             
         # 이미 날짜 접두어가 있으면 건너뛰기
         if filename.startswith(date_str):
@@ -163,9 +159,8 @@ def main():
     
     elif choice == "4":
         # 메뉴 4: 이름 충돌 처리 테스트
-        for filename in os.listdir(data_folder):
-            if os.path.isfile(os.path.join(data_folder, filename)):
-                handle_filename_conflict(data_folder, filename, result_folder)
+        for entry in walk_files(data_folder):
+            handle_filename_conflict(data_folder, entry.name, result_folder)
     
     elif choice == "5":
         # 메뉴 5: 종료
@@ -0,0 +1,146 @@
+# 파일 인코딩 판별 + 캐시
+# 한국어 로그는 UTF-8 외에 CP949/EUC-KR로 저장된 경우가 많습니다.
+# 파일 앞부분만 읽어서 BOM → UTF-8 → CP949 순서로 인코딩을 판별하고,
+# 판별 결과를 (경로, 크기, 수정 시각) 기준으로 저장해 두어
+# 파일이 바뀌지 않았으면 다음 검색에서는 판별을 건너뜁니다.
+import codecs
+import os
+import sqlite3
+
+# (선택) pip install charset-normalizer
+# UTF-8도 CP949도 아닌 파일이 있으면 이 라이브러리로 한 번 더 판별합니다.
+try:
+    from charset_normalizer import from_bytes
+except ImportError:
+    from_bytes = None
+
+# 판별할 때 읽는 파일 앞부분 크기 (바이트)
+SAMPLE_SIZE = 64 * 1024
+
+# BOM(바이트 순서 표시)과 인코딩 (긴 BOM부터 검사)
+BOMS = [
+    (codecs.BOM_UTF32_LE, 'utf-32-le'),
+    (codecs.BOM_UTF32_BE, 'utf-32-be'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+]
+
+# BOM 없이 시도해 볼 인코딩 (CP949는 EUC-KR을 포함하는 상위 집합)
+CANDIDATES = ['utf-8', 'cp949']
+
+
+def _decodes(sample, encoding):
+    """sample이 encoding으로 오류 없이 디코딩되는지 확인 (끝에서 잘린 글자는 허용)"""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    try:
+        decoder.decode(sample, final=False)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def detect_encoding(file_path, sample_size=SAMPLE_SIZE):
+    """
+    파일 앞부분을 읽어서 인코딩을 판별합니다.
+
+    Args:
+        file_path (str): 파일 경로
+        sample_size (int): 읽을 바이트 수
+
+    Returns:
+        str: 인코딩 이름 (판별하지 못하면 'utf-8')
+    """
+    with open(file_path, 'rb') as f:
+        sample = f.read(sample_size)
+
+    for bom, encoding in BOMS:
+        if sample.startswith(bom):
+            return encoding
+
+    for encoding in CANDIDATES:
+        if _decodes(sample, encoding):
+            return encoding
+
+    if from_bytes is not None:
+        best = from_bytes(sample).best()
+        if best is not None:
+            # 'utf_8' 같은 이름을 codecs 표준 이름('utf-8')으로 통일
+            return codecs.lookup(best.encoding).name
+
+    return 'utf-8'
+
+
+class EncodingCache:
+    """
+    파일별 인코딩 판별 결과 캐시
+
+    cache_path를 주면 SQLite 파일에 저장해서 프로그램을 다시 실행해도 재사용하고,
+    주지 않으면 실행 중인 동안만 메모리에 보관합니다.
+
+    사용 예:
+        cache = EncodingCache('search_index.sqlite')
+        encodings = cache.resolve(paths)        # {경로: 인코딩}
+    """
+
+    def __init__(self, cache_path=None):
+        self.cache_path = cache_path
+        self.memory = {}
+
+    def _connect(self):
+        conn = sqlite3.connect(self.cache_path)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS encodings (
+                path     TEXT PRIMARY KEY,
+                size     INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                encoding TEXT NOT NULL
+            )
+        """)
+        return conn
+
+    def resolve(self, paths):
+        """
+        각 파일의 인코딩을 반환합니다. 크기·수정 시각이 그대로인 파일은 판별하지 않습니다.
+
+        Args:
+            paths (list): 파일 경로 목록
+
+        Returns:
+            dict: {경로: 인코딩} (읽을 수 없는 파일은 빠짐)
+        """
+        conn = self._connect() if self.cache_path else None
+        if conn is not None:
+            for path, size, mtime_ns, encoding in conn.execute(
+                    "SELECT path, size, mtime_ns, encoding FROM encodings"):
+                self.memory.setdefault(path, (size, mtime_ns, encoding))
+
+        encodings = {}
+        changed = []
+        for path in paths:
+            key = os.path.abspath(path)
+            try:
+                st = os.stat(path)
+                cached = self.memory.get(key)
+                if cached and cached[:2] == (st.st_size, st.st_mtime_ns):
+                    encodings[path] = cached[2]
+                    continue
+                encoding = detect_encoding(path)
+            except OSError as e:
+                print(f"파일 {os.path.basename(path)} 인코딩 판별 오류: {e}")
+                continue
+
+            self.memory[key] = (st.st_size, st.st_mtime_ns, encoding)
+            changed.append((key, st.st_size, st.st_mtime_ns, encoding))
+            encodings[path] = encoding
+
+        if conn is not None:
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO encodings VALUES (?, ?, ?, ?)", changed)
+            conn.close()
+
+        return encodings
+
+
+# 캐시 파일을 지정하지 않은 검색이 함께 쓰는 메모리 캐시
+DEFAULT_CACHE = EncodingCache()
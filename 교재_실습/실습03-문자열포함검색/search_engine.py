@@ -0,0 +1,561 @@
+# 문자열 포함 검색 엔진
+# 파일마다 한 번만 읽어서 여러 키워드를 동시에 검사하고,
+# 검사할 파일이 많으면 프로세스 풀로 나눠서 처리합니다.
+# 파일 전체를 메모리에 올리지 않고 mmap 또는 고정 크기 청크로 읽기 때문에
+# 수 GB 로그 파일도 메모리 사용량이 일정합니다.
+# iter_matches는 일치한 줄(파일, 줄 번호, 바이트 위치, 내용)을 찾는 즉시 하나씩 돌려줍니다.
+# 일반 문자열 외에 정규식 / 대소문자 무시 / 단어 단위 검색도 지원합니다.
+# CP949/EUC-KR 등 UTF-8이 아닌 파일은 판별한 인코딩으로 읽어서 UTF-8로 바꾼 뒤 검사합니다.
+import mmap
+import os
+import re
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+# 공용 모듈(교재_실습/fswalk.py)을 불러오기 위해 상위 폴더를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fswalk import walk_files
+
+from encoding_cache import DEFAULT_CACHE, EncodingCache
+from search_index import SearchIndex
+
+# (선택) pip install pyahocorasick
+# 설치되어 있으면 Aho-Corasick 오토마톤으로 모든 키워드를 한 번의 순회로 찾습니다.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# 파일 수가 이보다 적으면 프로세스를 띄우는 비용이 더 크므로 순차 처리
+PARALLEL_MIN_FILES = 32
+
+# 청크 단위로 읽을 때 한 번에 읽는 크기 (바이트)
+CHUNK_SIZE = 1024 * 1024
+
+# 바이트 그대로 검사할 수 있는 인코딩 (키워드도 UTF-8 바이트로 찾음)
+UTF8_ENCODINGS = {'utf-8', 'utf-8-sig', 'ascii'}
+
+# 일치한 줄을 보여줄 때 키워드 앞뒤로 남길 글자 수
+CONTEXT_CHARS = 40
+
+# 일치 결과 한 건
+#   path: 파일 경로, line_no: 줄 번호(1부터), offset: 파일 처음부터 키워드까지의 바이트 위치
+#   keyword: 찾은 키워드, context: 키워드 주변 내용
+Match = namedtuple('Match', ['path', 'line_no', 'offset', 'keyword', 'context'])
+
+# 단어 단위 검색에서 "단어 글자"로 볼 바이트 (영문·숫자·_ 와 한글 등 모든 비ASCII 바이트)
+WORD_BYTES = rb'[0-9A-Za-z_\x80-\xff]'
+
+# 정규식 검색에서 바이트를 글자로 바꿀 때의 오류 처리
+# (잘못된 바이트도 그대로 되돌릴 수 있어서 글자 위치를 바이트 위치로 정확히 바꿀 수 있음)
+TEXT_ERRORS = 'surrogateescape'
+
+
+@lru_cache(maxsize=256)
+def compile_pattern(keyword, regex=False, ignore_case=False, whole_word=False):
+    """
+    키워드를 정규식으로 컴파일합니다. (같은 조건이면 캐시된 패턴을 재사용)
+
+    일반 문자열 검색은 바이트 패턴으로 컴파일해서 파일 내용(bytes)에 바로 씁니다.
+    정규식 검색은 글자(str) 패턴으로 컴파일합니다. 바이트 패턴에서는 ., \\w, {n}, [가-힣] 등이
+    한글 한 글자가 아니라 UTF-8 바이트 하나에 적용되기 때문입니다.
+
+    Args:
+        keyword (str): 키워드 또는 정규식
+        regex (bool): keyword를 정규식으로 해석할지 여부
+        ignore_case (bool): 대소문자 무시 (영문 기준)
+        whole_word (bool): 앞뒤가 단어 글자가 아닌 곳에서만 일치
+
+    Returns:
+        re.Pattern: 일반 문자열이면 bytes용, 정규식이면 str용 패턴 (정규식 문법 오류 시 re.error 발생)
+    """
+    # ^, $는 파일 전체가 아니라 줄의 처음·끝 (grep과 같은 줄 단위 의미)
+    flags = re.MULTILINE | (re.IGNORECASE if ignore_case else 0)
+
+    if regex:
+        source = keyword
+        if whole_word:
+            # str 패턴의 \w는 한글도 단어 글자로 봄
+            source = rf'(?<!\w)(?:{source})(?!\w)'
+        return re.compile(source, flags)
+
+    source = re.escape(keyword.encode('utf-8'))
+    if whole_word:
+        source = rb'(?<!' + WORD_BYTES + rb')(?:' + source + rb')(?!' + WORD_BYTES + rb')'
+    return re.compile(source, flags)
+
+
+class KeywordMatcher:
+    """
+    여러 키워드를 한 번에 검사하는 매처
+
+    - pyahocorasick이 있으면 오토마톤 한 번 순회로 모든 키워드를 찾습니다.
+    - 없으면 같은 내용(mmap 또는 청크)에서 키워드별로 바이트 검색을 합니다.
+      (파일을 다시 열거나 다시 읽지 않으며, 이미 찾은 키워드는 건너뜁니다)
+    - 대소문자 무시 / 단어 단위 검색이면 키워드마다 컴파일된 바이트 정규식을 씁니다.
+    - 정규식 검색이면 줄 단위로 잘린 청크를 글자로 바꿔서 str 정규식으로 검사합니다.
+      (mmap 바이트 검색은 쓰지 않음, 한 줄 안의 일치는 놓치지 않습니다)
+    """
+
+    def __init__(self, keywords, regex=False, ignore_case=False, whole_word=False):
+        # 중복 키워드 제거 (입력 순서 유지)
+        self.keywords = list(dict.fromkeys(keywords))
+        self.patterns = [k.encode('utf-8') for k in self.keywords]
+        self.options = {'regex': regex, 'ignore_case': ignore_case, 'whole_word': whole_word}
+        self.automaton = None
+
+        # 일반 문자열 검색이 아니면 정규식 사용 (정규식 문법 오류는 여기서 re.error 발생)
+        self.regexes = None
+        self.text_mode = regex
+        if regex or ignore_case or whole_word:
+            self.regexes = [compile_pattern(k, regex, ignore_case, whole_word) for k in self.keywords]
+
+        if self.regexes is None and ahocorasick is not None and all(self.keywords):
+            self.automaton = ahocorasick.Automaton()
+            for idx, keyword in enumerate(self.keywords):
+                self.automaton.add_word(keyword, idx)
+            self.automaton.make_automaton()
+
+        # 청크 경계에 걸친 키워드를 놓치지 않도록 다음 청크 앞에 붙일 바이트 수
+        self.overlap = max((len(p) for p in self.patterns), default=1) - 1
+
+    @property
+    def indexable(self):
+        """n-gram 역색인으로 후보를 줄일 수 있는지 (대소문자·정규식 검색은 불가)"""
+        return not (self.options['regex'] or self.options['ignore_case'])
+
+    def find(self, idx, data):
+        """
+        data(bytes)에서 idx번 키워드가 처음 나오는 (시작 위치, 길이)를 반환합니다. 없으면 None
+        """
+        if self.text_mode:
+            text = data.decode('utf-8', errors=TEXT_ERRORS)
+            m = self.regexes[idx].search(text)
+            if not m:
+                return None
+            # 글자 위치를 바이트 위치로 바꿈
+            start = len(text[:m.start()].encode('utf-8', errors=TEXT_ERRORS))
+            return (start, len(m.group().encode('utf-8', errors=TEXT_ERRORS)))
+        if self.regexes is not None:
+            m = self.regexes[idx].search(data)
+            return (m.start(), m.end() - m.start()) if m else None
+        pos = data.find(self.patterns[idx])
+        return (pos, len(self.patterns[idx])) if pos != -1 else None
+
+    def match(self, data):
+        """
+        내용(bytes)에 포함된 키워드의 인덱스 집합을 반환합니다.
+
+        Args:
+            data (bytes): 파일 내용
+
+        Returns:
+            set: self.keywords 기준 인덱스 집합
+        """
+        return self.match_chunks([data])
+
+    def match_chunks(self, chunks):
+        """
+        청크(bytes)들을 차례로 검사하고, 모든 키워드를 찾으면 바로 멈춥니다.
+
+        Args:
+            chunks (iterable): 앞 청크와 self.overlap 바이트씩 겹치는 bytes 청크들
+
+        Returns:
+            set: self.keywords 기준 인덱스 집합
+        """
+        found = set()
+
+        for chunk in chunks:
+            if self.automaton is not None:
+                text = chunk.decode('utf-8', errors='ignore')
+                for _, idx in self.automaton.iter(text):
+                    found.add(idx)
+                    if len(found) == len(self.keywords):
+                        break
+            elif self.regexes is not None:
+                if self.text_mode:
+                    # 청크는 줄 단위로 잘려 있으므로 글자 중간에서 잘리지 않음
+                    chunk = chunk.decode('utf-8', errors=TEXT_ERRORS)
+                for idx, regex in enumerate(self.regexes):
+                    if idx not in found and regex.search(chunk):
+                        found.add(idx)
+            else:
+                for idx, pattern in enumerate(self.patterns):
+                    if idx not in found and pattern in chunk:
+                        found.add(idx)
+
+            if len(found) == len(self.keywords):
+                break
+
+        return found
+
+    def match_mmap(self, mm):
+        """
+        메모리 맵 위에서 키워드별로 바이트를 직접 검색합니다. (첫 발견 위치에서 멈춤)
+        정규식 검색(text_mode)에는 쓸 수 없습니다.
+        """
+        if self.regexes is not None:
+            return {idx for idx, regex in enumerate(self.regexes) if regex.search(mm)}
+        return {idx for idx, pattern in enumerate(self.patterns) if mm.find(pattern) != -1}
+
+
+def iter_chunks(f, overlap, chunk_size=CHUNK_SIZE):
+    """
+    파일을 chunk_size씩 읽되, 앞 청크의 마지막 overlap 바이트를 붙여서 반환합니다.
+    """
+    tail = b''
+    while True:
+        block = f.read(chunk_size)
+        if not block:
+            break
+        chunk = tail + block
+        yield chunk
+        tail = chunk[-overlap:] if overlap else b''
+
+
+def iter_line_chunks(f, chunk_size=CHUNK_SIZE):
+    """
+    파일을 chunk_size 정도씩 읽되, 줄 중간에서 자르지 않고 마지막 줄바꿈까지만 반환합니다.
+    (정규식처럼 일치 길이를 미리 알 수 없는 검색용)
+    """
+    rest = b''
+    while True:
+        block = f.read(chunk_size)
+        if not block:
+            if rest:
+                yield rest
+            break
+        block = rest + block
+        cut = block.rfind(b'\n') + 1
+        if cut == 0:
+            rest = block
+            continue
+        yield block[:cut]
+        rest = block[cut:]
+
+
+def iter_text_chunks(f, chunk_size=CHUNK_SIZE):
+    """
+    텍스트 모드로 연 파일을 chunk_size 글자 정도씩 읽어 줄 단위로 자르고 UTF-8 바이트로 반환합니다.
+    (UTF-8이 아닌 파일을 UTF-8 키워드로 검사하기 위한 변환)
+    """
+    rest = ''
+    while True:
+        block = f.read(chunk_size)
+        if not block:
+            if rest:
+                yield rest.encode('utf-8')
+            break
+        block = rest + block
+        cut = block.rfind('\n') + 1
+        if cut == 0:
+            rest = block
+            continue
+        yield block[:cut].encode('utf-8')
+        rest = block[cut:]
+
+
+def list_target_files(folder_path, extensions, recursive=False):
+    """
+    폴더에서 검색 대상 확장자를 가진 파일 경로 목록을 반환합니다.
+
+    Args:
+        folder_path (str): 검색할 폴더 경로
+        extensions (list): 검색할 파일 확장자 목록
+        recursive (bool): 하위 폴더까지 검색할지 여부
+
+    Returns:
+        list: 파일 경로 목록
+    """
+    patterns = [f"*{ext}" for ext in extensions]
+    return [entry.path for entry in walk_files(folder_path, recursive=recursive, include=patterns)]
+
+
+def scan_file(file_path, matcher, encoding='utf-8'):
+    """
+    파일에 포함된 키워드 인덱스 집합을 반환합니다. (읽기 실패 시 빈 집합)
+
+    파일 내용을 한꺼번에 읽지 않습니다.
+    - 바이트 검색 모드: 파일을 mmap 해서 키워드마다 첫 발견 위치까지만 검색
+    - 정규식·오토마톤 모드 또는 mmap을 쓸 수 없는 파일: CHUNK_SIZE 청크로 읽으며 검사
+    - UTF-8이 아닌 파일: encoding으로 읽어서 UTF-8로 바꾼 청크를 검사
+    모든 키워드를 찾으면 나머지는 읽지 않습니다.
+    """
+    try:
+        if encoding not in UTF8_ENCODINGS:
+            with open(file_path, encoding=encoding, errors='replace', newline='') as f:
+                found = matcher.match_chunks(iter_text_chunks(f))
+            return found | {idx for idx, k in enumerate(matcher.keywords) if not k}
+
+        with open(file_path, 'rb') as f:
+            if matcher.automaton is None and not matcher.text_mode and os.fstat(f.fileno()).st_size > 0:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        return matcher.match_mmap(mm)
+                except (ValueError, OSError):
+                    pass  # mmap을 지원하지 않는 파일은 청크 읽기로 처리
+
+            if matcher.regexes is not None:
+                chunks = iter_line_chunks(f)
+            else:
+                chunks = iter_chunks(f, matcher.overlap)
+            found = matcher.match_chunks(chunks)
+            # 빈 파일도 빈 키워드('')는 포함한 것으로 처리 (기존 `keyword in content`와 동일)
+            return found | {idx for idx, k in enumerate(matcher.keywords) if not k}
+    except OSError as e:
+        print(f"파일 {os.path.basename(file_path)} 읽기 오류: {e}")
+        return set()
+
+
+# ─── 프로세스 풀 작업자 ───────────────────────────────────────────
+# 매처는 작업자 프로세스마다 한 번만 만들어 두고 파일마다 재사용합니다.
+_worker_matcher = None
+
+
+def _init_worker(keywords, options):
+    global _worker_matcher
+    _worker_matcher = KeywordMatcher(keywords, **options)
+
+
+def _scan_in_worker(item):
+    file_path, encoding = item
+    return scan_file(file_path, _worker_matcher, encoding)
+# ─────────────────────────────────────────────────────────────
+
+
+def _target_paths(folder_path, matcher, extensions, index_path, recursive):
+    """
+    검사할 파일 경로 목록과 파일별 인코딩을 반환합니다. (역색인을 쓰면 후보 파일만 남김)
+
+    인코딩 판별 결과는 역색인 파일에 함께 저장하고, 역색인을 쓰지 않으면 메모리에 보관합니다.
+    """
+    paths = list_target_files(folder_path, extensions, recursive)
+
+    cache = EncodingCache(index_path) if index_path else DEFAULT_CACHE
+    encodings = cache.resolve(paths)
+    paths = [path for path in paths if path in encodings]
+
+    # 역색인 사용 시: 변경된 파일만 다시 색인하고, 어느 키워드의 후보도 아닌 파일은 읽지 않음
+    # (정규식·대소문자 무시 검색은 n-gram으로 후보를 고를 수 없으므로 모든 파일 검사)
+    if index_path and matcher.indexable:
+        with SearchIndex(index_path) as index:
+            index.refresh(paths, encodings)
+            candidates = set()
+            for keyword in matcher.keywords:
+                candidates |= index.candidates(keyword, paths)
+        paths = [path for path in paths if path in candidates]
+
+    return paths, encodings
+
+
+def search_keywords(folder_path, keywords, extensions=None, workers=None, index_path=None,
+                    recursive=False, regex=False, ignore_case=False, whole_word=False):
+    """
+    각 파일을 한 번만 읽어서 여러 키워드를 동시에 검색합니다.
+
+    Args:
+        folder_path (str): 검색할 폴더 경로
+        keywords (list): 찾을 키워드 목록
+        extensions (list): 검색할 파일 확장자 목록 (기본값: ['.txt'])
+        workers (int): 프로세스 수 (None이면 CPU 수, 1이면 순차 처리)
+        index_path (str): 역색인 파일 경로 (지정하면 색인으로 후보 파일만 골라서 검사)
+        recursive (bool): 하위 폴더까지 검색할지 여부
+        regex (bool): 키워드를 정규식으로 해석
+        ignore_case (bool): 대소문자 무시
+        whole_word (bool): 단어 단위로만 일치
+
+    Returns:
+        dict: 각 키워드별 포함된 파일 이름 목록
+    """
+    if extensions is None:
+        extensions = ['.txt']
+
+    matcher = KeywordMatcher(keywords, regex, ignore_case, whole_word)
+    results = {keyword: [] for keyword in matcher.keywords}
+
+    try:
+        paths, encodings = _target_paths(folder_path, matcher, extensions, index_path, recursive)
+    except OSError as e:
+        print(f"폴더 {folder_path} 접근 오류: {e}")
+        return results
+
+    if workers == 1 or len(paths) < PARALLEL_MIN_FILES:
+        found_list = [scan_file(path, matcher, encodings[path]) for path in paths]
+    else:
+        chunksize = max(1, len(paths) // ((workers or os.cpu_count() or 1) * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(matcher.keywords, matcher.options)) as pool:
+            items = [(path, encodings[path]) for path in paths]
+            found_list = list(pool.map(_scan_in_worker, items, chunksize=chunksize))
+
+    # 파일 목록 순서대로 결과 정리
+    for path, found in zip(paths, found_list):
+        for idx in sorted(found):
+            results[matcher.keywords[idx]].append(os.path.basename(path))
+
+    return results
+
+
+def make_context(line, pos, length, width=CONTEXT_CHARS):
+    """
+    줄 내용에서 일치 부분(pos부터 length 글자) 앞뒤 width 글자만 잘라서 반환합니다.
+    (잘린 쪽은 ...으로 표시)
+    """
+    line = line.rstrip('\r\n')
+    if len(line) <= length + width * 2:
+        return line.strip()
+
+    start = max(0, pos - width)
+    end = min(len(line), pos + length + width)
+    prefix = '...' if start > 0 else ''
+    suffix = '...' if end < len(line) else ''
+    return f"{prefix}{line[start:end].strip()}{suffix}"
+
+
+def _iter_lines(file_path, encoding, overlap=0):
+    """
+    (줄 번호, UTF-8 바이트로 바꾼 줄, 원래 파일에서의 시작 바이트 위치) 를 하나씩 돌려줍니다.
+
+    줄바꿈 없이 CHUNK_SIZE보다 긴 줄(한 줄짜리 압축 로그 등)은 CHUNK_SIZE씩 나눠서
+    같은 줄 번호로 여러 번 돌려주므로 메모리 사용량이 일정합니다.
+    나눈 조각의 경계에 걸친 키워드를 놓치지 않도록 다음 조각 앞에 앞 조각의 마지막 overlap 바이트
+    (UTF-8이 아닌 파일은 overlap 글자)를 붙이고, 시작 위치도 그만큼 앞당깁니다.
+    """
+    if encoding in UTF8_ENCODINGS:
+        f = open(file_path, 'rb')
+        line_ends = b'\n'
+    else:
+        # UTF-8이 아닌 파일은 글자로 읽어서 UTF-8로 바꾸고, 위치는 원래 인코딩 기준으로 계산
+        # (BOM은 첫 줄의 글자로 남아 있으므로 위치 계산에 그대로 포함됨)
+        f = open(file_path, encoding=encoding, errors='replace', newline='')
+        line_ends = ('\n', '\r')
+
+    with f:
+        line_no, offset = 1, 0
+        tail = f.read(0)  # 빈 bytes 또는 빈 str
+        while True:
+            part = f.readline(CHUNK_SIZE)
+            if not part:
+                break
+            if encoding in UTF8_ENCODINGS:
+                yield line_no, tail + part, offset - len(tail)
+                offset += len(part)
+            else:
+                yield line_no, (tail + part).encode('utf-8'), offset - len(tail.encode(encoding, errors='replace'))
+                offset += len(part.encode(encoding, errors='replace'))
+
+            if part.endswith(line_ends):
+                line_no += 1
+                tail = part[:0]
+            else:
+                # 줄이 아직 끝나지 않음 - 다음 조각은 같은 줄의 이어지는 부분
+                tail = (tail + part)[-overlap:] if overlap else part[:0]
+
+
+def scan_lines(file_path, matcher, encoding='utf-8'):
+    """
+    파일을 한 줄씩 읽으며 키워드가 들어 있는 줄마다 Match를 하나씩 돌려주는 제너레이터
+    (한 줄에 여러 키워드가 있으면 키워드마다 하나씩, 위치는 그 줄에서 처음 나온 곳)
+    """
+    current_line, found = 0, set()
+    for line_no, line, offset in _iter_lines(file_path, encoding, matcher.overlap):
+        # 긴 줄은 여러 조각으로 나뉘어 오므로, 같은 줄에서 이미 찾은 키워드는 다시 보고하지 않음
+        if line_no != current_line:
+            current_line, found = line_no, set()
+        for idx, keyword in enumerate(matcher.keywords):
+            if idx in found:
+                continue
+            hit = matcher.find(idx, line)
+            if hit is None:
+                continue
+            found.add(idx)
+            pos, length = hit
+            # 바이트 위치를 글자 위치로 바꿔서 주변 내용을 자름
+            before = line[:pos].decode('utf-8', errors='replace')
+            matched = line[pos:pos + length].decode('utf-8', errors='replace')
+            text = before + matched + line[pos + length:].decode('utf-8', errors='replace')
+            context = make_context(text, len(before), len(matched))
+            if encoding not in UTF8_ENCODINGS:
+                pos = len(before.encode(encoding, errors='replace'))
+            yield Match(file_path, line_no, offset + pos, keyword, context)
+
+
+def iter_matches(folder_path, keywords, extensions=None, index_path=None, recursive=False,
+                 regex=False, ignore_case=False, whole_word=False):
+    """
+    일치한 줄을 찾는 즉시 하나씩 돌려주는 검색 (전체 결과를 메모리에 모으지 않음)
+
+    Args:
+        folder_path (str): 검색할 폴더 경로
+        keywords (list): 찾을 키워드 목록
+        extensions (list): 검색할 파일 확장자 목록 (기본값: ['.txt'])
+        index_path (str): 역색인 파일 경로 (지정하면 후보 파일만 읽음)
+        recursive (bool): 하위 폴더까지 검색할지 여부
+        regex, ignore_case, whole_word (bool): 검색 방식 (search_keywords와 같음)
+
+    Yields:
+        Match: (path, line_no, offset, keyword, context)
+    """
+    if extensions is None:
+        extensions = ['.txt']
+
+    matcher = KeywordMatcher(keywords, regex, ignore_case, whole_word)
+
+    try:
+        paths, encodings = _target_paths(folder_path, matcher, extensions, index_path, recursive)
+    except OSError as e:
+        print(f"폴더 {folder_path} 접근 오류: {e}")
+        return
+
+    for path in paths:
+        try:
+            yield from scan_lines(path, matcher, encodings[path])
+        except OSError as e:
+            print(f"파일 {os.path.basename(path)} 읽기 오류: {e}")
+
+
+class MatchWriter:
+    """
+    일치 결과를 받는 대로 결과 파일에 이어 쓰는 작성기
+
+    flush_every건마다 디스크로 내보내므로 검색 도중에도 결과 파일을 열어볼 수 있고,
+    중간에 멈춰도 그때까지의 결과가 남습니다.
+
+    사용 예:
+        with MatchWriter('result.txt') as writer:
+            for match in iter_matches('data', ['에러']):
+                writer.write(match)
+    """
+
+    def __init__(self, output_path, flush_every=100):
+        self.output_path = output_path
+        self.flush_every = flush_every
+        self.count = 0
+        self.files = set()
+        self.file = open(output_path, 'w', encoding='utf-8')
+        self.file.write("===== 키워드 검색 결과 =====\n\n")
+
+    def write(self, match):
+        name = os.path.basename(match.path)
+        self.file.write(f"{name}:{match.line_no} (offset {match.offset}) [{match.keyword}] {match.context}\n")
+        self.count += 1
+        self.files.add(match.path)
+        if self.count % self.flush_every == 0:
+            self.file.flush()
+
+    def close(self):
+        if self.count:
+            self.file.write(f"\n총 {len(self.files)}개 파일에서 {self.count}건이 발견되었습니다.\n")
+        else:
+            self.file.write("검색 결과가 없습니다.\n")
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
@@ -0,0 +1,161 @@
+# 반복 검색용 역색인(inverted index)
+# 파일마다 등장하는 글자 1-gram / 2-gram 목록을 SQLite에 저장해 두고,
+# 키워드 검색 시 키워드의 n-gram을 모두 가진 파일(후보)만 실제로 검사합니다.
+# 파일 크기·수정 시각이 바뀐 파일만 다시 색인하므로 두 번째 검색부터는 매우 빠릅니다.
+# 파일 내용은 파일마다 판별한 인코딩(UTF-8, CP949 등)으로 읽어서 색인합니다.
+import codecs
+import os
+import sqlite3
+
+# 색인할 때 한 번에 읽는 크기 (바이트)
+READ_SIZE = 1024 * 1024
+
+
+def keyword_grams(keyword):
+    """
+    키워드를 포함하는 파일이라면 반드시 가지고 있어야 할 n-gram 집합을 반환합니다.
+
+    Args:
+        keyword (str): 검색 키워드
+
+    Returns:
+        set: 1글자 키워드는 그 글자, 2글자 이상은 연속한 2글자 조각들
+    """
+    if len(keyword) == 1:
+        return {keyword}
+    return {keyword[i:i + 2] for i in range(len(keyword) - 1)}
+
+
+def file_grams(file_path, encoding='utf-8'):
+    """
+    파일 내용에 등장하는 1-gram과 2-gram 집합을 반환합니다.
+    파일을 READ_SIZE씩 읽으며, 청크 경계의 글자도 이어서 처리합니다.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    grams = set()
+    last = ''
+
+    with open(file_path, 'rb') as f:
+        while True:
+            block = f.read(READ_SIZE)
+            text = last + decoder.decode(block, final=not block)
+            grams.update(text)
+            grams.update(text[i:i + 2] for i in range(len(text) - 1))
+            last = text[-1:]
+            if not block:
+                break
+
+    return grams
+
+
+class SearchIndex:
+    """
+    SQLite 기반 n-gram 역색인
+
+    사용 예:
+        with SearchIndex('search_index.sqlite') as index:
+            index.refresh(paths)                    # 변경된 파일만 다시 색인
+            candidates = index.candidates('에러', paths)
+    """
+
+    def __init__(self, index_path):
+        self.conn = sqlite3.connect(index_path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS files (
+                id       INTEGER PRIMARY KEY,
+                path     TEXT UNIQUE NOT NULL,
+                size     INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                encoding TEXT
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                gram    TEXT    NOT NULL,
+                file_id INTEGER NOT NULL,
+                PRIMARY KEY (gram, file_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_postings_file ON postings (file_id);
+        """)
+        # 인코딩 컬럼이 없던 이전 색인 파일이면 컬럼 추가 (기존 파일은 다음 refresh에서 다시 색인됨)
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(files)")]
+        if 'encoding' not in columns:
+            self.conn.execute("ALTER TABLE files ADD COLUMN encoding TEXT")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.close()
+        return False
+
+    def refresh(self, paths, encodings=None):
+        """
+        paths 중 새로 생겼거나 크기·수정 시각·인코딩이 바뀐 파일만 다시 색인하고,
+        색인에는 있지만 더 이상 존재하지 않는 파일은 삭제합니다.
+
+        Args:
+            paths (list): 색인 대상 파일 경로 목록
+            encodings (dict): {경로: 인코딩} (없는 파일은 UTF-8로 읽음)
+
+        Returns:
+            int: 다시 색인한 파일 수
+        """
+        encodings = encodings or {}
+        indexed = {
+            path: (file_id, size, mtime_ns, encoding)
+            for file_id, path, size, mtime_ns, encoding in self.conn.execute(
+                "SELECT id, path, size, mtime_ns, encoding FROM files")
+        }
+        updated = 0
+
+        with self.conn:
+            for path in paths:
+                encoding = encodings.get(path, 'utf-8')
+                path = os.path.abspath(path)
+                try:
+                    st = os.stat(path)
+                    old = indexed.get(path)
+                    if old and old[1:] == (st.st_size, st.st_mtime_ns, encoding):
+                        continue
+                    grams = file_grams(path, encoding)
+                except OSError as e:
+                    print(f"파일 {os.path.basename(path)} 색인 오류: {e}")
+                    continue
+
+                if old:
+                    self.conn.execute("DELETE FROM postings WHERE file_id = ?", (old[0],))
+                    self.conn.execute("UPDATE files SET size = ?, mtime_ns = ?, encoding = ? WHERE id = ?",
+                                      (st.st_size, st.st_mtime_ns, encoding, old[0]))
+                    file_id = old[0]
+                else:
+                    file_id = self.conn.execute(
+                        "INSERT INTO files (path, size, mtime_ns, encoding) VALUES (?, ?, ?, ?)",
+                        (path, st.st_size, st.st_mtime_ns, encoding)).lastrowid
+                self.conn.executemany("INSERT INTO postings (gram, file_id) VALUES (?, ?)",
+                                      ((gram, file_id) for gram in grams))
+                updated += 1
+
+            # 삭제된 파일 정리
+            for path, (file_id, _, _, _) in indexed.items():
+                if not os.path.exists(path):
+                    self.conn.execute("DELETE FROM postings WHERE file_id = ?", (file_id,))
+                    self.conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+        return updated
+
+    def candidates(self, keyword, paths):
+        """
+        paths 중 keyword를 포함할 가능성이 있는 파일 경로 집합을 반환합니다.
+        (모든 n-gram이 등장하는 파일, 실제 포함 여부는 호출하는 쪽에서 검사)
+        """
+        paths = {os.path.abspath(p): p for p in paths}
+        if not keyword:
+            return set(paths.values())
+
+        grams = sorted(keyword_grams(keyword))
+        placeholders = ",".join("?" * len(grams))
+        rows = self.conn.execute(f"""
+            SELECT f.path FROM postings p JOIN files f ON f.id = p.file_id
+            WHERE p.gram IN ({placeholders})
+            GROUP BY p.file_id HAVING COUNT(*) = ?
+        """, (*grams, len(grams)))
+        return {paths[path] for path, in rows if path in paths}
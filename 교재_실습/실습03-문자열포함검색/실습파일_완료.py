@@ -1,8 +1,12 @@
 # 🔧 실습 시작 파일
 # 문자열 포함 파일 검색 프로그램
 import os
+import re
 
-def find_files_with_keyword(folder_path, keyword, extensions=None):
+from search_engine import MatchWriter, iter_matches, search_keywords
+
+def find_files_with_keyword(folder_path, keyword, extensions=None, index_path=None,
+                            regex=False, ignore_case=False, whole_word=False):
     """
     지정된 폴더에서 특정 키워드가 포함된 파일 목록을 반환합니다.
     
@@ -10,75 +14,20 @@ def find_files_with_keyword(folder_path, keyword, extensions=None):
         folder_path (str): 검색할 폴더 경로
         keyword (str): 찾을 키워드
         extensions (list): 검색할 파일 확장자 목록 (기본값: ['.txt'])
+        index_path (str): 역색인 파일 경로 (지정하면 반복 검색이 빨라짐)
+        regex (bool): 키워드를 정규식으로 해석
+        ignore_case (bool): 대소문자 무시
+        whole_word (bool): 단어 단위로만 일치
     
     Returns:
         list: 키워드가 포함된 파일 이름 목록
     """
-    # 기본 확장자 설정
-    if extensions is None:
-        extensions = ['.txt']
-    
-    # 키워드가 포함된 파일 목록
-    matched_files = []
-    
-    # 폴더 내 파일 목록 가져오기
-    try:
-        files = os.listdir(folder_path)
-        
-        # 각 파일에 대해 처리
-        for filename in files:
-            file_path = os.path.join(folder_path, filename)
-            
-            # 디렉토리는 건너뛰기
-            if os.path.isdir(file_path):
-                continue
-                
-            # 확장자 확인
-            _, ext = os.path.splitext(filename)
-            if ext.lower() not in extensions:
-                continue
-                
-            # 파일 내용 읽기
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                    # 키워드 포함 여부 확인
-                    if keyword in content:
-                        matched_files.append(filename)
-            except Exception as e:
-                print(f"파일 {filename} 읽기 오류: {e}")
-    
-    except Exception as e:
-        print(f"폴더 {folder_path} 접근 오류: {e}")
-    
-    return matched_files
+    # 파일 검색은 검색 엔진에 위임 (키워드 1개짜리 다중 검색)
+    return search_keywords(folder_path, [keyword], extensions, index_path=index_path,
+                           regex=regex, ignore_case=ignore_case, whole_word=whole_word)[keyword]
 
-def save_results_to_file(result_list, output_path):
-    """
-    검색 결과를 파일에 저장합니다.
-    
-    Args:
-        result_list (list): 저장할 결과 목록
-        output_path (str): 결과를 저장할 파일 경로
-    """
-    try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("===== 키워드 검색 결과 =====\n\n")
-            
-            if result_list:
-                f.write("포함된 파일 목록:\n")
-                for i, filename in enumerate(result_list, 1):
-                    f.write(f"{i}. {filename}\n")
-                f.write(f"\n총 {len(result_list)}개의 파일이 발견되었습니다.\n")
-            else:
-                f.write("검색 결과가 없습니다.\n")
-                
-        print(f"결과가 {output_path}에 저장되었습니다.")
-    except Exception as e:
-        print(f"결과 저장 오류: {e}")
-
-def search_multiple_keywords(folder_path, keywords, extensions=None):
+def search_multiple_keywords(folder_path, keywords, extensions=None, index_path=None,
+                             regex=False, ignore_case=False, whole_word=False):
     """
     여러 키워드가 포함된 파일을 검색합니다.
     
@@ -86,36 +35,39 @@ def search_multiple_keywords(folder_path, keywords, extensions=None):
         folder_path (str): 검색할 폴더 경로
         keywords (list): 찾을 키워드 목록
         extensions (list): 검색할 파일 확장자 목록
+        index_path (str): 역색인 파일 경로 (지정하면 반복 검색이 빨라짐)
+        regex, ignore_case, whole_word (bool): 검색 방식 (find_files_with_keyword와 같음)
+    
+    키워드마다 폴더를 다시 읽지 않고, 각 파일을 한 번만 읽어서 모든 키워드를 검사합니다.
     
     Returns:
         dict: 각 키워드별 포함된 파일 목록
     """
-    # 검색 결과를 저장할 딕셔너리
-    results = {}
-    
-    # 각 키워드별로 검색 수행
-    for keyword in keywords:
-        results[keyword] = find_files_with_keyword(folder_path, keyword, extensions)
-    
-    return results
+    # 파일마다 한 번만 읽어서 모든 키워드를 동시에 검사
+    return search_keywords(folder_path, keywords, extensions, index_path=index_path,
+                           regex=regex, ignore_case=ignore_case, whole_word=whole_word)
 
 def main():
     # 검색 폴더 경로
     search_folder = "data/search"
     
+    # 역색인 파일 (처음 검색할 때 만들어지고, 이후에는 바뀐 파일만 다시 색인)
+    index_path = "search_index.sqlite"
+    
     print("===== 문자열 포함 파일 검색 프로그램 =====")
     print("1. 단일 키워드 검색")
     print("2. 다중 키워드 검색")
     print("3. 다양한 파일 형식 검색 (.txt, .log)")
     print("4. 결과를 파일로 저장")
-    print("5. 종료")
+    print("5. 정규식 / 대소문자 무시 / 단어 단위 검색")
+    print("6. 종료")
     
-    choice = input("\n원하는 작업을 선택하세요 (1-5): ")
+    choice = input("\n원하는 작업을 선택하세요 (1-6): ")
     
     if choice == "1":
         # 단일 키워드 검색
         keyword = input("검색할 키워드를 입력하세요: ")
-        result = find_files_with_keyword(search_folder, keyword)
+        result = find_files_with_keyword(search_folder, keyword, index_path=index_path)
         
         print(f"\n키워드 '{keyword}'가 포함된 파일 목록:")
         if result:
@@ -127,7 +79,7 @@ def main():
     elif choice == "2":
         # 다중 키워드 검색 (연습문제 1번)
         keywords = ["에러", "실패", "클레임"]
-        results = search_multiple_keywords(search_folder, keywords)
+        results = search_multiple_keywords(search_folder, keywords, index_path=index_path)
         
         print("\n키워드 검색 결과:")
         for keyword, files in results.items():
@@ -141,7 +93,7 @@ def main():
     elif choice == "3":
         # .txt와 .log 파일 모두 검색 (연습문제 3번)
         keyword = input("검색할 키워드를 입력하세요: ")
-        result = find_files_with_keyword(search_folder, keyword, extensions=['.txt', '.log'])
+        result = find_files_with_keyword(search_folder, keyword, extensions=['.txt', '.log'], index_path=index_path)
         
         print(f"\n.txt와 .log 파일 중 '{keyword}'가 포함된 파일 목록:")
         if result:
@@ -155,19 +107,44 @@ def main():
     
     elif choice == "4":
         # 결과를 파일로 저장 (연습문제 2번)
+        # 일치한 줄을 찾는 즉시 화면에 보여주고 결과 파일에도 바로 이어 씀
         keyword = input("검색할 키워드를 입력하세요: ")
-        result = find_files_with_keyword(search_folder, keyword, extensions=['.txt', '.log'])
-        
         output_path = os.path.join(search_folder, "result.txt")
-        save_results_to_file(result, output_path)
         
-        print(f"\n키워드 '{keyword}'가 포함된 파일 목록이 {output_path}에 저장되었습니다.")
+        with MatchWriter(output_path) as writer:
+            for match in iter_matches(search_folder, [keyword], extensions=['.txt', '.log'], index_path=index_path):
+                print(f" - {os.path.basename(match.path)}:{match.line_no}  {match.context}")
+                writer.write(match)
+        
+        print(f"\n키워드 '{keyword}'가 포함된 줄 {writer.count}건이 {output_path}에 저장되었습니다.")
     
     elif choice == "5":
+        # 검색 방식을 골라서 일치한 줄 보기
+        keyword = input("검색할 키워드(또는 정규식)를 입력하세요: ")
+        print("검색 방식: 1) 대소문자 무시  2) 단어 단위  3) 정규식  4) 정규식 + 대소문자 무시")
+        mode = input("선택 (1-4): ")
+        options = {
+            "1": {"ignore_case": True},
+            "2": {"whole_word": True},
+            "3": {"regex": True},
+            "4": {"regex": True, "ignore_case": True},
+        }.get(mode, {})
+        
+        try:
+            count = 0
+            for match in iter_matches(search_folder, [keyword], extensions=['.txt', '.log'],
+                                      index_path=index_path, **options):
+                print(f" - {os.path.basename(match.path)}:{match.line_no}  {match.context}")
+                count += 1
+            print(f"\n총 {count}건이 발견되었습니다.")
+        except re.error as e:
+            print(f"정규식 오류: {e}")
+    
+    elif choice == "6":
         print("프로그램을 종료합니다.")
     
     else:
-        print("잘못된 선택입니다. 1-5 사이의 숫자를 입력하세요.")
+        print("잘못된 선택입니다. 1-6 사이의 숫자를 입력하세요.")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,227 @@
+# 압축 아카이브 스냅샷
+# 소스 폴더를 복사본 폴더 대신 tar + gzip(또는 zstd) 파일 하나로 백업합니다.
+# - 파일은 임시 복사 없이 바로 tar 스트림으로 흘려보냅니다.
+# - tar 스트림을 BLOCK_SIZE 단위 블록으로 잘라 여러 스레드가 동시에 압축합니다.
+#   블록마다 독립된 gzip 멤버(zstd 프레임)로 이어 붙이므로 결과는 일반 tar.gz와 같아서
+#   `tar xzf`로도 풀 수 있습니다.
+# - 블록 위치와 파일 위치를 색인 파일(.index.json)에 기록해 두어,
+#   파일 하나를 복원할 때 그 파일이 들어 있는 블록만 읽어서 풉니다.
+import datetime
+import json
+import os
+import sys
+import tarfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+# 공용 모듈(교재_실습/fswalk.py)을 불러오기 위해 상위 폴더를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fswalk import walk_files
+
+# (선택) pip install zstandard
+# 설치되어 있으면 codec='zstd'로 더 빠르고 작게 압축할 수 있습니다.
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# 압축 단위 블록 크기 (압축 전 바이트) - 작을수록 파일 하나 복원이 빠르고, 클수록 압축률이 좋음
+BLOCK_SIZE = 4 * 1024 * 1024
+
+# 압축 스레드 수 (zlib, zstd는 압축하는 동안 GIL을 놓으므로 스레드로 병렬 처리됨)
+COMPRESS_WORKERS = os.cpu_count() or 4
+
+# 압축 수준
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+# 확장자
+ARCHIVE_SUFFIX = {"gzip": ".tar.gz", "zstd": ".tar.zst"}
+INDEX_SUFFIX = ".index.json"
+
+
+def _compress_block(codec, data):
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)  # 31: gzip 형식
+    return compressor.compress(data) + compressor.flush()
+
+
+def _decompress_block(codec, data):
+    if codec == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompressobj(31).decompress(data)
+
+
+class BlockCompressWriter:
+    """
+    tarfile이 쓰는 바이트를 블록으로 모아 병렬 압축한 뒤 순서대로 파일에 기록하는 쓰기 객체
+
+    blocks: [(압축 전 시작 위치, 압축 파일 안의 위치, 압축된 길이)] - 색인용
+    """
+
+    def __init__(self, out, codec="gzip", workers=COMPRESS_WORKERS):
+        self.out = out
+        self.codec = codec
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        self.max_pending = workers * 2  # 메모리에 들고 있을 최대 블록 수
+        self.pending = []  # [(압축 전 시작 위치, future)]
+        self.buffer = bytearray()
+        self.position = 0  # 지금까지 받은 압축 전 바이트 수
+        self.block_start = 0
+        self.blocks = []
+
+    def write(self, data):
+        self.buffer += data
+        self.position += len(data)
+        while len(self.buffer) >= BLOCK_SIZE:
+            self._submit(bytes(self.buffer[:BLOCK_SIZE]))
+            del self.buffer[:BLOCK_SIZE]
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def _submit(self, block):
+        self.pending.append((self.block_start, self.pool.submit(_compress_block, self.codec, block)))
+        self.block_start += len(block)
+        # 앞쪽 블록부터 차례로 기록 (너무 많이 쌓이면 기다림)
+        while len(self.pending) > self.max_pending:
+            self._write_oldest()
+
+    def _write_oldest(self):
+        start, future = self.pending.pop(0)
+        data = future.result()
+        self.blocks.append((start, self.out.tell(), len(data)))
+        self.out.write(data)
+
+    def abort(self):
+        """기록하지 않은 블록을 버리고 압축 스레드를 멈춤 (아카이브를 만들다 실패했을 때)"""
+        self.pool.shutdown(cancel_futures=True)
+        self.pending.clear()
+        self.buffer.clear()
+
+    def close(self):
+        if self.buffer:
+            self._submit(bytes(self.buffer))
+            self.buffer.clear()
+        while self.pending:
+            self._write_oldest()
+        self.pool.shutdown()
+
+
+def create_archive(source_dir, backup_root, codec="gzip", workers=COMPRESS_WORKERS, recursive=True):
+    """
+    소스 폴더를 압축 아카이브 스냅샷 하나로 백업합니다.
+
+    Args:
+        source_dir (str): 백업할 소스 폴더 경로
+        backup_root (str): 아카이브를 저장할 폴더
+        codec (str): 'gzip' 또는 'zstd' (zstandard 미설치 시 gzip 사용)
+        workers (int): 압축 스레드 수
+        recursive (bool): 하위 폴더 포함 여부
+
+    Returns:
+        tuple: (파일 수, 아카이브 경로)
+
+    Raises:
+        OSError: 파일을 아카이브에 기록하는 도중 실패한 경우 (만들던 아카이브는 지움)
+    """
+    if codec == "zstd" and zstandard is None:
+        print("zstandard가 설치되어 있지 않아 gzip으로 압축합니다. (pip install zstandard)")
+        codec = "gzip"
+
+    os.makedirs(backup_root, exist_ok=True)
+    now = datetime.datetime.now()
+    archive_path = os.path.join(backup_root, now.strftime("%Y-%m-%d_%H%M%S_archive") + ARCHIVE_SUFFIX[codec])
+    suffix = 1
+    while True:
+        tmp_path = archive_path + ".tmp"
+        # 같은 초에 두 번 백업하는 경우 - .tmp는 "x" 모드로 열어서 다른 백업과 같은 파일을 쓰지 않게 함
+        if not os.path.exists(archive_path):
+            try:
+                out = open(tmp_path, "xb")
+                break
+            except FileExistsError:
+                pass
+        archive_path = os.path.join(backup_root,
+                                    now.strftime(f"%Y-%m-%d_%H%M%S_{suffix}_archive") + ARCHIVE_SUFFIX[codec])
+        suffix += 1
+
+    files = {}
+    with out:
+        writer = BlockCompressWriter(out, codec, workers)
+        try:
+            with tarfile.open(fileobj=writer, mode="w", format=tarfile.PAX_FORMAT) as tar:
+                for entry in walk_files(source_dir, recursive=recursive):
+                    rel_path = os.path.relpath(entry.path, source_dir).replace(os.sep, "/")
+                    # 아직 아무것도 기록하지 않은 단계의 오류(읽기 권한, 그 사이 삭제 등)만 건너뜀
+                    try:
+                        info = tar.gettarinfo(entry.path, arcname=rel_path)
+                        f = open(entry.path, "rb")
+                    except OSError as e:
+                        print(f"아카이브 오류: {rel_path} ({e})")
+                        continue
+                    # addfile 도중의 오류(읽는 중에 파일이 줄어든 경우 등)는 헤더와 내용 일부가
+                    # 이미 기록된 뒤이므로 건너뛸 수 없음 - 아카이브 전체를 중단
+                    with f:
+                        tar.addfile(info, f)
+                    # tar 안에서 파일 내용이 시작하는 위치 (압축 전 기준)
+                    # 내용은 512바이트 단위로 채워서 기록되므로 현재 위치에서 그만큼 뺌
+                    padded = -(-info.size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+                    files[rel_path] = [tar.offset - padded, info.size, int(info.mtime)]
+        except BaseException:
+            writer.abort()
+            out.close()
+            os.remove(tmp_path)
+            raise
+        writer.close()
+
+    index = {"codec": codec, "source": os.path.abspath(source_dir), "block_size": BLOCK_SIZE,
+             "blocks": writer.blocks, "files": files}
+    with open(archive_path + INDEX_SUFFIX, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+
+    # 색인까지 기록한 뒤에 아카이브 이름을 확정 (중간에 끊기면 .tmp만 남음)
+    os.replace(tmp_path, archive_path)
+    return len(files), archive_path
+
+
+def load_index(archive_path):
+    with open(archive_path + INDEX_SUFFIX, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def extract_file(archive_path, rel_path, target_path):
+    """
+    아카이브에서 파일 하나만 복원합니다. 그 파일이 들어 있는 블록만 읽어서 압축을 풉니다.
+
+    Args:
+        archive_path (str): 아카이브 경로
+        rel_path (str): 아카이브 안의 상대 경로 (/ 구분)
+        target_path (str): 복원할 파일 경로
+
+    Returns:
+        int: 복원한 바이트 수
+    """
+    index = load_index(archive_path)
+    if rel_path not in index["files"]:
+        raise KeyError(f"아카이브에 없는 파일입니다: {rel_path}")
+
+    start, size, mtime = index["files"][rel_path]
+    end = start + size
+    codec = index["codec"]
+    block_size = index["block_size"]
+
+    os.makedirs(os.path.dirname(os.path.abspath(target_path)), exist_ok=True)
+    with open(archive_path, "rb") as f, open(target_path, "wb") as out:
+        for block_start, offset, length in index["blocks"]:
+            block_end = block_start + block_size
+            if block_end <= start or block_start >= end:
+                continue
+            f.seek(offset)
+            data = _decompress_block(codec, f.read(length))
+            out.write(data[max(start - block_start, 0):end - block_start])
+
+    os.utime(target_path, (mtime, mtime))
+    return size
@@ -0,0 +1,277 @@
+# 내용 주소 기반(content-addressed) 중복 제거 저장소
+# 파일 내용을 sha256 해시 이름의 blob으로 한 번만 저장하고,
+# 스냅샷 폴더에는 manifest.json과 blob을 가리키는 하드링크(또는 reflink)만 만듭니다.
+# 바뀌지 않은 파일은 디스크 공간도 복사 시간도 들지 않습니다.
+#
+# 폴더 구조:
+#   backup/.store/objects/ab/ab12...   (blob, 읽기 전용)
+#   backup/2025-05-13_093000_snapshot/ (manifest.json + 원본과 같은 구조의 링크 파일)
+import contextlib
+import datetime
+import errno
+import hashlib
+import os
+import shutil
+import sys
+import uuid
+
+# 공용 모듈(교재_실습/fswalk.py)을 불러오기 위해 상위 폴더를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fswalk import walk_files
+
+from copy_engine import fast_copy
+from snapshot_manifest import Manifest
+
+# 해시 계산할 때 한 번에 읽는 크기 (바이트)
+READ_SIZE = 1024 * 1024
+
+# 공용 저장소 폴더 이름 (backup_root 아래)
+STORE_NAME = ".store"
+
+# 스냅샷과 blob 정리(retention)가 함께 쓰는 잠금 파일 이름 (저장소 폴더 아래)
+LOCK_NAME = "lock"
+
+# Linux의 reflink(파일 내용 공유 복사) ioctl 번호 (Btrfs, XFS 등에서 지원)
+FICLONE = 0x40049409
+
+
+def file_digest(path):
+    """파일 내용의 sha256 해시(16진수 문자열)를 반환합니다."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(READ_SIZE)
+            if not block:
+                break
+            h.update(block)
+    return h.hexdigest()
+
+
+def _copy_with_digest(src, dst):
+    """src를 dst로 복사하면서 복사한 내용의 sha256 해시를 계산해서 반환합니다."""
+    h = hashlib.sha256()
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        while True:
+            block = fsrc.read(READ_SIZE)
+            if not block:
+                break
+            h.update(block)
+            fdst.write(block)
+    shutil.copystat(src, dst)
+    return h.hexdigest()
+
+
+def _reflink(src, dst):
+    """src 내용을 공유하는 dst를 만듭니다. (지원하지 않는 파일 시스템이면 OSError)"""
+    import fcntl
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        except OSError:
+            fdst.close()
+            os.remove(dst)
+            raise
+
+
+def link_or_copy(src, dst):
+    """
+    하드링크 → reflink → 일반 복사 순서로 시도해서 dst를 만듭니다.
+
+    Returns:
+        str: 사용한 방법 ('hardlink', 'reflink', 'copy')
+    """
+    try:
+        os.link(src, dst)
+        return "hardlink"
+    except OSError as e:
+        # 다른 드라이브(EXDEV)나 하드링크 미지원 파일 시스템이면 다음 방법으로
+        if e.errno == errno.EEXIST:
+            raise
+
+    if sys.platform.startswith("linux"):
+        try:
+            _reflink(src, dst)
+            shutil.copystat(src, dst)
+            return "reflink"
+        except (OSError, ImportError):
+            pass
+
+    fast_copy(src, dst)
+    return "copy"
+
+
+@contextlib.contextmanager
+def store_lock(store_root, exclusive=False, blocking=True):
+    """
+    저장소 잠금 (flock)
+
+    스냅샷은 공유 잠금을, blob 정리는 배타 잠금을 잡아서, 스냅샷이 blob을 저장한 뒤
+    manifest를 기록하기 전까지 그 blob이 정리되지 않게 합니다.
+
+    Yields:
+        bool 또는 None: 잠금을 잡았으면 True, blocking=False에서 못 잡았으면 False,
+                        flock을 쓸 수 없는 운영체제면 None
+    """
+    try:
+        import fcntl
+    except ImportError:
+        yield None
+        return
+
+    os.makedirs(store_root, exist_ok=True)
+    with open(os.path.join(store_root, LOCK_NAME), "a") as f:
+        mode = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+        try:
+            fcntl.flock(f.fileno(), mode if blocking else mode | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class BlobStore:
+    """
+    sha256 해시로 파일 내용을 한 번만 저장하는 저장소
+
+    사용 예:
+        store = BlobStore('backup/.store')
+        digest, stored = store.put('data/original/notes.md')
+        store.link(digest, 'backup/2025-05-13_snapshot/notes.md')
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        os.makedirs(self.objects_dir, exist_ok=True)
+
+    def path_of(self, digest):
+        """해시에 해당하는 blob 경로 (앞 2글자로 폴더를 나눠 한 폴더에 파일이 몰리지 않게 함)"""
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def has(self, digest):
+        return os.path.exists(self.path_of(digest))
+
+    def put(self, src_path, digest=None):
+        """
+        파일을 저장소에 넣습니다. 같은 내용이 이미 있으면 복사하지 않습니다.
+
+        Args:
+            src_path (str): 원본 파일 경로
+            digest (str): 이미 계산한 해시 (있으면 같은 blob이 있는지 먼저 확인)
+
+        Returns:
+            tuple: (해시, 새로 저장했는지 여부)
+        """
+        if digest is not None and os.path.exists(self.path_of(digest)):
+            return digest, False
+
+        # 원본은 한 번만 읽음: 임시 파일로 복사하면서 해시를 계산하고, 그 해시로 중복 확인 후 이름을 정함
+        # (복사하는 도중 원본이 바뀌어도 blob 이름과 내용이 항상 일치함)
+        # 임시 파일에 쓴 뒤 이름을 바꿔서, 중간에 끊겨도 반쯤 쓴 blob이 남지 않게 함
+        tmp_path = os.path.join(self.objects_dir, f"tmp-{uuid.uuid4().hex}")
+        try:
+            digest = _copy_with_digest(src_path, tmp_path)
+            blob_path = self.path_of(digest)
+            if os.path.exists(blob_path):
+                os.remove(tmp_path)
+                return digest, False
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            os.chmod(tmp_path, 0o444)  # 하드링크로 공유되므로 스냅샷에서 수정하지 못하게 읽기 전용
+            os.replace(tmp_path, blob_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return digest, True
+
+    def link(self, digest, dst_path):
+        """blob을 dst_path에 하드링크(안 되면 reflink/복사)로 만듭니다. (이미 있는 파일은 교체)"""
+        os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+        if os.path.lexists(dst_path):
+            os.remove(dst_path)
+        return link_or_copy(self.path_of(digest), dst_path)
+
+
+def dedup_snapshot(source_dir, backup_root, link_files=True):
+    """
+    소스 폴더 전체(하위 폴더 포함)를 중복 제거 스냅샷으로 백업합니다.
+
+    Args:
+        source_dir (str): 백업할 소스 폴더 경로
+        backup_root (str): 백업 루트 폴더 경로
+        link_files (bool): 스냅샷 폴더에 원본 구조대로 링크 파일을 만들지 여부
+                           (False면 manifest.json만 기록)
+
+    Returns:
+        tuple: (파일 수, 새로 저장한 바이트 수, 스냅샷 폴더 경로)
+    """
+    store = BlobStore(os.path.join(backup_root, STORE_NAME))
+
+    now = datetime.datetime.now()
+    snapshot_dir = os.path.join(backup_root, now.strftime("%Y-%m-%d_%H%M%S_snapshot"))
+    suffix = 1
+    while os.path.exists(snapshot_dir):  # 같은 초에 두 번 백업하는 경우
+        snapshot_dir = os.path.join(backup_root, now.strftime(f"%Y-%m-%d_%H%M%S_{suffix}_snapshot"))
+        suffix += 1
+    os.makedirs(snapshot_dir)
+
+    manifest = Manifest(os.path.abspath(source_dir), now.isoformat(timespec="seconds"))
+
+    # manifest를 기록할 때까지 공유 잠금을 잡아서 blob 정리가 끼어들지 않게 함
+    with store_lock(store.root):
+        stored_bytes = _fill_snapshot(store, source_dir, snapshot_dir, manifest, link_files)
+    return len(manifest.files), stored_bytes, snapshot_dir
+
+
+def _fill_snapshot(store, source_dir, snapshot_dir, manifest, link_files):
+    """소스 파일을 저장소에 넣고 manifest를 기록합니다. (새로 저장한 바이트 수 반환)"""
+    stored_bytes = 0
+    for entry in walk_files(source_dir, recursive=True):
+        rel_path = os.path.relpath(entry.path, source_dir).replace(os.sep, "/")
+        st = entry.stat()
+
+        try:
+            digest, stored = store.put(entry.path)
+        except OSError as e:
+            print(f"백업 오류: {rel_path} ({e})")
+            continue
+
+        if stored:
+            stored_bytes += st.st_size
+        manifest.add(rel_path, st.st_size, st.st_mtime_ns, digest)
+
+        if link_files:
+            try:
+                store.link(digest, os.path.join(snapshot_dir, *rel_path.split("/")))
+            except OSError as e:
+                # blob과 manifest에는 들어 있으므로 복원에는 문제 없음
+                print(f"링크 생성 오류: {rel_path} ({e})")
+
+    # manifest는 마지막에 기록 (manifest가 있는 폴더만 완성된 스냅샷)
+    manifest.save(snapshot_dir)
+    return stored_bytes
+
+
+def restore_snapshot(snapshot_dir, target_dir, backup_root=None):
+    """
+    스냅샷의 파일들을 target_dir에 원래 수정 시각으로 복원합니다. (blob은 복사해서 꺼냄)
+
+    Returns:
+        int: 복원한 파일 수
+    """
+    if backup_root is None:
+        backup_root = os.path.dirname(os.path.abspath(snapshot_dir))
+    store = BlobStore(os.path.join(backup_root, STORE_NAME))
+    manifest = Manifest.load(snapshot_dir)
+
+    for rel_path, (size, mtime_ns, digest, _) in manifest.files.items():
+        dst_path = os.path.join(target_dir, *rel_path.split("/"))
+        os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+        shutil.copyfile(store.path_of(digest), dst_path)
+        os.utime(dst_path, ns=(mtime_ns, mtime_ns))
+
+    return len(manifest.files)
@@ -0,0 +1,247 @@
+# 백업 보관 정책 + 정리(가비지 컬렉션)
+# backup_root 아래에 계속 쌓이는 백업 폴더/아카이브를 보관 정책에 따라 정리합니다.
+# - 최근 N개 + 일별/주별/월별 대표 백업(grandfather-father-son)만 남김
+# - 남길 증분 백업이 파일을 가져다 쓰는 이전 백업 폴더는 지우지 않음 (manifest로 확인)
+# - 지울 폴더는 먼저 .trash로 이름만 바꿔서(즉시 끝남) 백업 목록에서 빼고, 실제 삭제는 마지막에 함
+# - 공용 저장소(.store)의 blob은 남은 스냅샷 manifest가 참조하는 해시만 표시(mark)하고
+#   나머지를 지움(sweep) - 스냅샷 폴더 안의 파일을 하나하나 훑지 않음
+# - blob 정리는 저장소 잠금(배타)을 잡고 진행 - 스냅샷이 진행 중이면(공유 잠금) 이번에는 건너뜀
+#   잠금을 쓸 수 없는 운영체제에서는 manifest가 아직 없는 스냅샷 폴더가 있으면 건너뛰고,
+#   최근 저장된 blob은 유예 시간 동안 지우지 않음
+# - 휴지통 폴더의 실제 삭제는 백그라운드 스레드에서 진행 (정리 작업이 삭제를 기다리지 않음)
+import datetime
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+
+from archive_snapshot import INDEX_SUFFIX
+from blob_store import STORE_NAME, store_lock
+from snapshot_manifest import Manifest, is_snapshot
+
+# 지울 백업을 잠시 옮겨 두는 폴더 (backup_root 아래)
+TRASH_NAME = ".trash"
+
+# 백업 이름 앞부분의 날짜/시간 (예: 2025-05-13, 2025-05-13_093000_incremental)
+NAME_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2})(?:_(\d{6}))?")
+
+ARCHIVE_SUFFIXES = (".tar.gz", ".tar.zst")
+
+# 이 시간(초) 안에 저장된 blob은 참조되지 않아도 지우지 않음
+# (진행 중인 스냅샷이 blob을 저장했지만 아직 manifest를 기록하지 않았을 수 있음)
+BLOB_GRACE_SECONDS = 15 * 60
+
+# manifest 없는 스냅샷 폴더가 이 시간(초)보다 오래되었으면 중단된 것으로 보고 정리 대상에 포함
+STALE_SNAPSHOT_SECONDS = 24 * 60 * 60
+
+
+class Backup:
+    """정리 대상 백업 하나 (폴더 또는 아카이브 파일)"""
+
+    def __init__(self, path, time):
+        self.path = path
+        self.name = os.path.basename(path)
+        self.time = time
+
+    def __repr__(self):
+        return f"Backup({self.name!r})"
+
+
+def _backup_time(name, path):
+    """이름의 날짜/시간을 읽고, 없으면 수정 시각을 사용"""
+    m = NAME_PATTERN.match(name)
+    if m:
+        date, hms = m.groups()
+        return datetime.datetime.strptime(date + (hms or "000000"), "%Y-%m-%d%H%M%S")
+    return datetime.datetime.fromtimestamp(os.path.getmtime(path))
+
+
+def list_backups(backup_root):
+    """backup_root 아래의 백업 폴더와 아카이브를 오래된 순서로 반환합니다."""
+    backups = []
+    with os.scandir(backup_root) as it:
+        for entry in it:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir() or entry.name.endswith(ARCHIVE_SUFFIXES):
+                backups.append(Backup(entry.path, _backup_time(entry.name, entry.path)))
+    return sorted(backups, key=lambda b: b.time)
+
+
+def select_keep(backups, keep_last=7, daily=7, weekly=4, monthly=12):
+    """
+    보관 정책에 따라 남길 백업을 고릅니다.
+
+    Args:
+        backups (list): list_backups() 결과
+        keep_last (int): 가장 최근 백업 몇 개를 남길지
+        daily (int): 최근 며칠 동안 하루에 하나씩 (그날의 마지막 백업)
+        weekly (int): 최근 몇 주 동안 한 주에 하나씩
+        monthly (int): 최근 몇 달 동안 한 달에 하나씩
+
+    Returns:
+        set: 남길 백업 경로 집합
+    """
+    newest_first = sorted(backups, key=lambda b: b.time, reverse=True)
+    keep = {b.path for b in newest_first[:keep_last]}
+
+    periods = [
+        (daily, lambda t: t.date()),
+        (weekly, lambda t: t.isocalendar()[:2]),
+        (monthly, lambda t: (t.year, t.month)),
+    ]
+    for count, period_of in periods:
+        seen = set()
+        for backup in newest_first:
+            period = period_of(backup.time)
+            if period in seen:
+                continue
+            if len(seen) >= count:
+                break
+            seen.add(period)
+            keep.add(backup.path)
+
+    return keep
+
+
+def _in_progress(backup):
+    """manifest가 아직 없는 중복 제거 스냅샷 폴더 (만드는 중이거나 중단된 스냅샷)"""
+    return (backup.name.endswith("_snapshot") and os.path.isdir(backup.path)
+            and not is_snapshot(backup.path))
+
+
+def _load_manifest(backup):
+    if os.path.isdir(backup.path) and is_snapshot(backup.path):
+        return Manifest.load(backup.path)
+    return None
+
+
+def apply_retention(backup_root, keep_last=7, daily=7, weekly=4, monthly=12, dry_run=False):
+    """
+    보관 정책을 적용해서 오래된 백업을 지우고, 참조되지 않는 blob을 정리합니다.
+
+    Args:
+        backup_root (str): 백업 루트 폴더
+        keep_last, daily, weekly, monthly (int): select_keep()과 같음
+        dry_run (bool): True면 지울 목록만 반환하고 아무것도 지우지 않음
+
+    Returns:
+        tuple: (남긴 백업 이름 목록, 지운 백업 이름 목록, 지운 blob 수)
+    """
+    backups = list_backups(backup_root)
+    # 진행 중인 스냅샷은 보관 정책 대상에서 빼고 그대로 둠 (오래된 것은 중단된 것으로 보고 지움)
+    stale_time = datetime.datetime.now() - datetime.timedelta(seconds=STALE_SNAPSHOT_SECONDS)
+    unfinished = [b for b in backups if _in_progress(b)]
+    running = [b for b in unfinished if b.time >= stale_time]
+    abandoned = [b for b in unfinished if b.time < stale_time]
+    backups = [b for b in backups if b not in unfinished]
+    keep = select_keep(backups, keep_last, daily, weekly, monthly)
+
+    # mark 1: 남길 백업의 manifest가 참조하는 폴더(증분 연결)와 blob 해시
+    manifests = {b.path: _load_manifest(b) for b in backups if b.path in keep}
+    referenced_folders = set()
+    live_digests = set()
+    for manifest in manifests.values():
+        if manifest is None:
+            continue
+        for entry in manifest.files.values():
+            if entry[3]:
+                referenced_folders.add(entry[3])
+        live_digests |= manifest.digests()
+
+    kept = [b for b in backups if b.path in keep or b.name in referenced_folders]
+    removed = [b for b in backups if b not in kept] + abandoned
+
+    if dry_run:
+        return [b.name for b in kept], [b.name for b in removed], 0
+
+    # 지울 백업은 휴지통 폴더로 이름만 바꿔서 바로 목록에서 뺌
+    trash_dir = os.path.join(backup_root, TRASH_NAME)
+    os.makedirs(trash_dir, exist_ok=True)
+    for backup in removed:
+        os.replace(backup.path, os.path.join(trash_dir, f"{uuid.uuid4().hex}_{backup.name}"))
+        if backup.name.endswith(ARCHIVE_SUFFIXES) and os.path.exists(backup.path + INDEX_SUFFIX):
+            os.remove(backup.path + INDEX_SUFFIX)
+
+    # mark 2 + sweep: 남은 스냅샷이 참조하지 않는 blob 삭제
+    # 스냅샷이 진행 중이면(잠금을 못 잡거나, 잠금을 쓸 수 없는데 진행 중인 폴더가 있으면) 다음으로 미룸
+    swept = 0
+    store_root = os.path.join(backup_root, STORE_NAME)
+    if os.path.isdir(store_root):
+        with store_lock(store_root, exclusive=True, blocking=False) as locked:
+            if locked or (locked is None and not running):
+                swept = sweep_blobs(backup_root, live_digests, time.time() - BLOB_GRACE_SECONDS)
+
+    empty_trash(backup_root)
+    return [b.name for b in kept], [b.name for b in removed], swept
+
+
+def sweep_blobs(backup_root, live_digests, cutoff=None):
+    """
+    공용 저장소에서 live_digests에 없는 blob을 지웁니다.
+    (blob 이름만 보고 판단하고, 지울 후보만 stat 해서 저장 시각을 확인)
+
+    Args:
+        backup_root (str): 백업 루트 폴더
+        live_digests (set): 남은 스냅샷이 참조하는 해시
+        cutoff (float): 이 시각(time.time() 기준) 이후에 저장된 blob은 지우지 않음 (None이면 모두 지움)
+
+    Returns:
+        int: 지운 blob 수
+    """
+    objects_dir = os.path.join(backup_root, STORE_NAME, "objects")
+    if not os.path.isdir(objects_dir):
+        return 0
+
+    swept = 0
+    with os.scandir(objects_dir) as prefixes:
+        for prefix in prefixes:
+            if not prefix.is_dir():
+                continue  # 복사 중에 남은 tmp- 파일 등
+            with os.scandir(prefix.path) as blobs:
+                for blob in blobs:
+                    if blob.name in live_digests:
+                        continue
+                    # blob의 수정 시각은 원본 파일의 시각이므로, 저장소에 들어온 시각은
+                    # 이름 변경·권한 변경 때 갱신되는 ctime으로 판단
+                    if cutoff is not None and blob.stat().st_ctime >= cutoff:
+                        continue
+                    os.chmod(blob.path, 0o644)  # blob은 읽기 전용으로 저장되어 있음
+                    os.remove(blob.path)
+                    swept += 1
+    return swept
+
+
+def empty_trash(backup_root, background=True):
+    """
+    휴지통 폴더를 실제로 삭제합니다.
+
+    휴지통의 백업은 이미 백업 목록에서 빠져 있으므로, 기본으로는 백그라운드 스레드에서 지우고
+    바로 반환합니다. (프로그램은 삭제가 끝난 뒤에 종료됨, 중간에 끊기면 다음 정리 때 이어서 삭제)
+
+    Returns:
+        threading.Thread: 삭제 중인 스레드 (background=False이거나 지울 것이 없으면 None)
+    """
+    # 휴지통 자체를 다른 이름으로 옮긴 뒤 지워서, 다음 정리가 새 휴지통을 바로 쓸 수 있게 함
+    trash_dir = os.path.join(backup_root, TRASH_NAME)
+    if os.path.isdir(trash_dir):
+        os.replace(trash_dir, os.path.join(backup_root, f"{TRASH_NAME}-{uuid.uuid4().hex}"))
+
+    # 이전에 지우다 만 휴지통도 함께 삭제
+    with os.scandir(backup_root) as it:
+        doomed = [entry.path for entry in it if entry.name.startswith(f"{TRASH_NAME}-")]
+    if not doomed:
+        return None
+
+    def remove_all():
+        for path in doomed:
+            shutil.rmtree(path, ignore_errors=True)
+
+    if not background:
+        remove_all()
+        return None
+    thread = threading.Thread(target=remove_all)
+    thread.start()
+    return thread
@@ -0,0 +1,167 @@
+# 스냅샷 목록(manifest) 파일
+# 백업 폴더마다 manifest.json 하나에 "상대 경로 → (크기, 수정 시각, 해시, 저장 위치)"를 기록합니다.
+# - 중복 제거 스냅샷(dedup): 실제 내용은 공용 저장소(blob_store)에 해시 이름으로 저장
+# - 전체/증분 백업(full/incremental): 실제 내용은 stored_in 폴더에 복사본으로 저장
+# 증분 백업은 직전 manifest와 메모리에서 비교하므로 백업 폴더의 파일을 하나하나 stat 하지 않습니다.
+import json
+import os
+import sys
+
+# 공용 모듈(교재_실습/fswalk.py)을 불러오기 위해 상위 폴더를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fswalk import walk_files
+
+MANIFEST_NAME = "manifest.json"
+
+
+class Manifest:
+    """
+    스냅샷 하나의 파일 목록
+
+    files: {상대 경로(/ 구분): (크기, 수정 시각(ns), sha256 해시 또는 None, 저장 폴더 이름 또는 None)}
+    kind: 'full', 'incremental', 'dedup'
+    parent: 증분 백업이 비교한 직전 스냅샷 폴더 이름
+    deleted: 직전 스냅샷 이후 삭제된 파일의 상대 경로 목록
+    """
+
+    def __init__(self, source="", created="", files=None, kind="dedup", parent=None, deleted=None):
+        self.source = source
+        self.created = created
+        self.files = files if files is not None else {}
+        self.kind = kind
+        self.parent = parent
+        self.deleted = deleted if deleted is not None else []
+
+    def add(self, rel_path, size, mtime_ns, digest=None, stored_in=None):
+        self.files[rel_path] = (size, mtime_ns, digest, stored_in)
+
+    def digests(self):
+        """이 스냅샷이 참조하는 해시 집합"""
+        return {entry[2] for entry in self.files.values() if entry[2]}
+
+    def total_size(self):
+        return sum(entry[0] for entry in self.files.values())
+
+    def save(self, snapshot_dir):
+        """snapshot_dir/manifest.json에 저장 (임시 파일에 쓴 뒤 교체하므로 중간에 끊겨도 안전)"""
+        path = os.path.join(snapshot_dir, MANIFEST_NAME)
+        tmp_path = path + ".tmp"
+        data = {
+            "source": self.source,
+            "created": self.created,
+            "kind": self.kind,
+            "parent": self.parent,
+            "deleted": self.deleted,
+            "files": {rel: list(entry) for rel, entry in self.files.items()},
+        }
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, snapshot_dir):
+        """snapshot_dir/manifest.json을 읽어서 Manifest를 만듭니다."""
+        with open(os.path.join(snapshot_dir, MANIFEST_NAME), encoding="utf-8") as f:
+            data = json.load(f)
+        # 저장 위치가 없던 항목은 None으로 채움
+        files = {rel: tuple(entry) + (None,) * (4 - len(entry)) for rel, entry in data["files"].items()}
+        return cls(data.get("source", ""), data.get("created", ""), files,
+                   data.get("kind", "dedup"), data.get("parent"), data.get("deleted", []))
+
+
+def is_snapshot(folder):
+    """manifest.json이 있는 폴더면 스냅샷"""
+    return os.path.isfile(os.path.join(folder, MANIFEST_NAME))
+
+
+def latest_snapshot(backup_root, kinds=None):
+    """
+    manifest.json이 가장 최근에 기록된 스냅샷을 찾습니다.
+
+    Args:
+        backup_root (str): 백업 루트 폴더
+        kinds (tuple): 찾을 스냅샷 종류 (None이면 모두)
+
+    Returns:
+        tuple: (스냅샷 폴더 경로, Manifest), 없으면 (None, None)
+    """
+    candidates = []
+    with os.scandir(backup_root) as it:
+        for entry in it:
+            if not entry.is_dir() or entry.name.startswith("."):
+                continue
+            try:
+                written = os.stat(os.path.join(entry.path, MANIFEST_NAME)).st_mtime_ns
+            except OSError:
+                continue  # manifest가 없으면 완성되지 않았거나 예전 방식의 백업 폴더
+            candidates.append((written, entry.path))
+
+    # 최근 것부터 열어보고 종류가 맞으면 바로 반환
+    for _, path in sorted(candidates, reverse=True):
+        manifest = Manifest.load(path)
+        if kinds is None or manifest.kind in kinds:
+            return path, manifest
+    return None, None
+
+
+def scan_source(source_dir, recursive=False):
+    """
+    소스 폴더의 파일 목록을 {상대 경로: (크기, 수정 시각(ns))}로 반환합니다.
+    (scandir 항목의 stat만 사용하므로 파일마다 한 번씩만 조회)
+    """
+    files = {}
+    for entry in walk_files(source_dir, recursive=recursive):
+        st = entry.stat()
+        rel_path = os.path.relpath(entry.path, source_dir).replace(os.sep, "/")
+        files[rel_path] = (st.st_size, st.st_mtime_ns)
+    return files
+
+
+def load_or_scan(folder):
+    """
+    폴더의 manifest를 읽습니다.
+    manifest가 없는 예전 방식의 백업 폴더면 폴더 안 파일을 직접 훑어서 같은 형식의 Manifest를 만듭니다.
+    (백업 파일은 원본의 수정 시각을 그대로 복사해 두었으므로 원본과 비교할 수 있음)
+    """
+    if is_snapshot(folder):
+        return Manifest.load(folder)
+
+    manifest = Manifest(created="", kind="full")
+    stored_in = os.path.basename(os.path.abspath(folder))
+    for rel_path, (size, mtime_ns) in scan_source(folder).items():
+        manifest.add(rel_path, size, mtime_ns, None, stored_in)
+    return manifest
+
+
+def diff_manifest(current, previous):
+    """
+    현재 파일 목록과 직전 manifest를 메모리에서 비교합니다.
+
+    Args:
+        current (dict): scan_source() 결과
+        previous (Manifest): 직전 스냅샷 manifest
+
+    Returns:
+        tuple: (새 파일 목록, 수정된 파일 목록, 삭제된 파일 목록)
+    """
+    added, modified = [], []
+    for rel_path, (size, mtime_ns) in current.items():
+        old = previous.files.get(rel_path)
+        if old is None:
+            added.append(rel_path)
+        elif old[0] != size or old[1] != mtime_ns:
+            modified.append(rel_path)
+    deleted = [rel_path for rel_path in previous.files if rel_path not in current]
+    return added, modified, deleted
+
+
+def resolve_sources(manifest, backup_root):
+    """
+    전체/증분 스냅샷의 각 파일이 실제로 저장된 경로를 {상대 경로: 백업 파일 경로}로 반환합니다.
+    (증분이 여러 번 이어져 있어도 manifest 하나만 읽으면 됨)
+    """
+    return {
+        rel_path: os.path.join(backup_root, entry[3], *rel_path.split("/"))
+        for rel_path, entry in manifest.files.items()
+        if entry[3]
+    }
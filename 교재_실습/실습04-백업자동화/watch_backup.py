@@ -0,0 +1,233 @@
+# 폴더 감시 연속 백업
+# 소스 폴더의 변경을 감시하다가, 바뀐 파일만 모아서 증분 백업합니다.
+# - Linux: inotify로 커널이 알려주는 변경 이벤트만 받음 (폴더 전체를 다시 훑지 않음)
+# - 그 외 운영체제: 일정 간격으로 폴더 목록을 비교하는 폴링 방식
+# - 짧은 시간에 몰린 변경은 DEBOUNCE_SECONDS 동안 조용해질 때까지 모아서 한 번에 백업
+#   (계속 바뀌더라도 MAX_BATCH_DELAY가 지나면 그때까지 모은 것을 백업)
+# 기준이 되는 전체/증분 백업(manifest.json)이 먼저 있어야 합니다.
+import ctypes
+import datetime
+import os
+import select
+import stat
+import struct
+import sys
+import time
+
+from copy_engine import copy_files
+from snapshot_manifest import Manifest, latest_snapshot, scan_source
+
+# 마지막 변경 후 이 시간(초) 동안 조용하면 백업
+DEBOUNCE_SECONDS = 2.0
+
+# 변경이 계속 이어져도 첫 변경 후 이 시간(초)이 지나면 백업
+MAX_BATCH_DELAY = 30.0
+
+# 폴링 방식에서 폴더를 다시 확인하는 간격 (초)
+POLL_INTERVAL = 2.0
+
+# inotify 상수 (linux/inotify.h)
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE
+
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+class InotifyWatcher:
+    """inotify로 폴더 하나의 파일 변경 이름을 받아오는 감시자 (Linux 전용)"""
+
+    def __init__(self, folder):
+        libc = ctypes.CDLL(None, use_errno=True)
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 실패")
+        if libc.inotify_add_watch(self.fd, os.fsencode(folder), WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch 실패: {folder}")
+
+    def poll(self, timeout):
+        """
+        timeout초까지 기다리며 변경된 파일 이름 집합을 반환합니다.
+        이벤트가 넘쳐서 일부를 잃었으면 None (폴더 전체를 다시 확인해야 함)
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        names = set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return names
+
+        pos = 0
+        while pos < len(data):
+            _, mask, _, length = EVENT_HEADER.unpack_from(data, pos)
+            pos += EVENT_HEADER.size
+            name = os.fsdecode(data[pos:pos + length].rstrip(b"\0"))
+            pos += length
+            if mask & IN_Q_OVERFLOW:
+                return None
+            if name and not mask & IN_ISDIR:
+                names.add(name)
+        return names
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """폴더 목록(크기, 수정 시각)을 주기적으로 비교하는 감시자 (inotify를 쓸 수 없을 때)"""
+
+    def __init__(self, folder, interval=POLL_INTERVAL):
+        self.folder = folder
+        self.interval = interval
+        self.state = scan_source(folder)
+
+    def poll(self, timeout):
+        time.sleep(max(timeout, self.interval))
+        current = scan_source(self.folder)
+        names = {name for name, info in current.items() if self.state.get(name) != info}
+        names |= self.state.keys() - current.keys()
+        self.state = current
+        return names
+
+    def close(self):
+        pass
+
+
+def make_watcher(folder):
+    """Linux면 inotify 감시자를, 아니면(또는 실패하면) 폴링 감시자를 만듭니다."""
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(folder)
+        except OSError as e:
+            print(f"inotify를 사용할 수 없어 폴링 방식으로 감시합니다: {e}")
+    return PollingWatcher(folder)
+
+
+def backup_changes(source_dir, backup_root, names, previous, parent_dir):
+    """
+    바뀐 파일 이름 목록만 확인해서 증분 백업 하나를 만듭니다. (폴더 전체를 다시 훑지 않음)
+
+    Args:
+        source_dir (str): 소스 폴더
+        backup_root (str): 백업 루트 폴더
+        names (set): 바뀌었을 수 있는 파일 이름
+        previous (Manifest): 직전 백업 manifest
+        parent_dir (str): 직전 백업 폴더 경로
+
+    Returns:
+        tuple: (새 manifest, 새 백업 폴더 경로), 실제로 바뀐 것이 없으면 (previous, parent_dir)
+    """
+    changed, deleted = {}, []
+    for name in names:
+        try:
+            st = os.stat(os.path.join(source_dir, name))
+        except FileNotFoundError:
+            if name in previous.files:
+                deleted.append(name)
+            continue
+        if not stat.S_ISREG(st.st_mode):
+            continue
+        old = previous.files.get(name)
+        if old is None or old[:2] != (st.st_size, st.st_mtime_ns):
+            changed[name] = (st.st_size, st.st_mtime_ns)
+
+    if not changed and not deleted:
+        return previous, parent_dir
+
+    now = datetime.datetime.now()
+    backup_dir = os.path.join(backup_root, now.strftime("%Y-%m-%d_%H%M%S_incremental"))
+    suffix = 1
+    while os.path.exists(backup_dir):  # 같은 초에 두 번 백업하는 경우
+        backup_dir = os.path.join(backup_root, now.strftime(f"%Y-%m-%d_%H%M%S_{suffix}_incremental"))
+        suffix += 1
+    os.makedirs(backup_dir)
+    folder_name = os.path.basename(backup_dir)
+
+    jobs = [(os.path.join(source_dir, name), os.path.join(backup_dir, name), size)
+            for name, (size, _) in changed.items()]
+    _, _, errors = copy_files(jobs, show_progress=False)
+    failed = {os.path.basename(src) for src, _ in errors}
+
+    manifest = Manifest(previous.source, now.isoformat(timespec="seconds"), dict(previous.files),
+                        kind="incremental", parent=os.path.basename(parent_dir), deleted=deleted)
+    for name in deleted:
+        del manifest.files[name]
+    for name, (size, mtime_ns) in changed.items():
+        if name not in failed:
+            manifest.add(name, size, mtime_ns, None, folder_name)
+    manifest.save(backup_dir)
+
+    print(f"[{now:%H:%M:%S}] 증분 백업: 변경 {len(changed) - len(failed)}개, 삭제 {len(deleted)}개 -> {folder_name}")
+    return manifest, backup_dir
+
+
+def watch_and_backup(source_dir, backup_root, debounce=DEBOUNCE_SECONDS, max_delay=MAX_BATCH_DELAY,
+                     stop_event=None):
+    """
+    소스 폴더를 감시하며 변경을 모아서 증분 백업합니다. Ctrl+C(또는 stop_event)로 종료합니다.
+
+    Args:
+        source_dir (str): 감시할 소스 폴더
+        backup_root (str): 백업 루트 폴더 (기준 전체/증분 백업이 있어야 함)
+        debounce (float): 마지막 변경 후 기다릴 시간 (초)
+        max_delay (float): 첫 변경 후 최대 대기 시간 (초)
+        stop_event (threading.Event): 설정되면 감시 종료 (다른 스레드에서 실행할 때)
+
+    Returns:
+        int: 만든 증분 백업 수
+    """
+    parent_dir, manifest = latest_snapshot(backup_root, kinds=("full", "incremental"))
+    if parent_dir is None:
+        print("기준 백업이 없습니다. 먼저 전체 백업이나 증분 백업을 실행하세요.")
+        return 0
+
+    watcher = make_watcher(source_dir)
+    print(f"'{source_dir}' 감시 중... (종료: Ctrl+C)")
+
+    pending = set()
+    first_change = last_change = None
+    batches = 0
+
+    def flush():
+        nonlocal manifest, parent_dir, batches
+        new_manifest, new_dir = backup_changes(source_dir, backup_root, pending, manifest, parent_dir)
+        if new_dir != parent_dir:
+            batches += 1
+        manifest, parent_dir = new_manifest, new_dir
+        pending.clear()
+
+    try:
+        while stop_event is None or not stop_event.is_set():
+            names = watcher.poll(timeout=min(debounce, 0.5))
+            now = time.monotonic()
+            if names is None:
+                # 이벤트를 잃었으면 소스 폴더와 직전 manifest의 모든 파일을 확인
+                names = set(scan_source(source_dir)) | set(manifest.files)
+            if names:
+                pending |= names
+                first_change = first_change or now
+                last_change = now
+
+            if pending and (now - last_change >= debounce or now - first_change >= max_delay):
+                flush()
+                first_change = last_change = None
+    except KeyboardInterrupt:
+        print("\n감시를 종료합니다.")
+    finally:
+        if pending:
+            flush()
+        watcher.close()
+
+    return batches
@@ -1,49 +1,78 @@
 # 백업 자동화 프로그램
 import os
-import shutil
 import datetime
 import time
 import argparse
+import sys
 
-def backup_files(source_dir, backup_root):
+# 공용 모듈(교재_실습/fswalk.py)을 불러오기 위해 상위 폴더를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fswalk import walk_files
+
+from archive_snapshot import create_archive
+from blob_store import dedup_snapshot, file_digest
+from copy_engine import copy_files
+from retention import apply_retention
+from snapshot_manifest import Manifest, diff_manifest, latest_snapshot, load_or_scan, resolve_sources, scan_source
+from watch_backup import watch_and_backup
+
+def new_backup_dir(backup_root, kind):
     """
-    지정한 폴더의 모든 파일을 날짜별 백업 폴더에 복사합니다.
+    이번 백업에 쓸 새 폴더 경로를 정합니다. (YYYY-MM-DD_HHMMSS_종류 형식)
+    
+    증분 백업의 manifest가 이전 백업 폴더의 파일을 가리키므로, 기존 폴더는 절대 다시 쓰지 않습니다.
+    같은 초에 이미 같은 이름이 있으면 _1, _2 ... 를 붙입니다.
+    
+    Args:
+        backup_root (str): 백업 파일이 저장될 루트 폴더 경로
+        kind (str): 백업 종류 ('full', 'incremental')
+    
+    Returns:
+        str: 아직 없는 백업 폴더 경로
+    """
+    now = datetime.datetime.now()
+    backup_dir = os.path.join(backup_root, now.strftime(f"%Y-%m-%d_%H%M%S_{kind}"))
+    suffix = 1
+    while os.path.exists(backup_dir):
+        backup_dir = os.path.join(backup_root, now.strftime(f"%Y-%m-%d_%H%M%S_{suffix}_{kind}"))
+        suffix += 1
+    return backup_dir
+
+def backup_files(source_dir, backup_root, hash_files=False):
+    """
+    지정한 폴더의 모든 파일을 날짜·시간별 백업 폴더에 복사합니다.
+    백업 폴더에는 증분 백업의 기준이 되는 manifest.json도 함께 기록합니다.
     
     Args:
         source_dir (str): 백업할 소스 폴더 경로
         backup_root (str): 백업 파일이 저장될 루트 폴더 경로
+        hash_files (bool): manifest에 파일 해시(sha256)도 기록할지 여부
     
     Returns:
         tuple: (백업 파일 수, 백업 폴더 경로)
     """
-    # 현재 날짜로 폴더명 생성 (YYYY-MM-DD 형식)
-    date_str = datetime.datetime.now().strftime("%Y-%m-%d")
-    
-    # 백업 폴더 경로 생성
-    backup_dir = os.path.join(backup_root, date_str)
+    # 현재 날짜와 시간으로 새 폴더 생성 (YYYY-MM-DD_HHMMSS_full 형식)
+    # 같은 날 다시 백업해도 증분 백업이 참조하는 이전 전체 백업을 덮어쓰지 않음
+    backup_dir = new_backup_dir(backup_root, "full")
+    os.makedirs(backup_dir)
     
-    # 백업 폴더가 없으면 생성
-    os.makedirs(backup_dir, exist_ok=True)
+    # 소스 폴더의 모든 파일을 복사 목록에 추가 (디렉토리는 건너뜀)
+    current = scan_source(source_dir)
+    jobs = [(os.path.join(source_dir, name), os.path.join(backup_dir, name), size)
+            for name, (size, _) in current.items()]
     
-    # 백업 파일 카운터
-    file_count = 0
+    # 여러 파일을 병렬로 복사 (진행 상황은 합계로 출력)
+    file_count, _, errors = copy_files(jobs)
     
-    # 소스 폴더의 모든 파일을 백업 폴더에 복사
-    for filename in os.listdir(source_dir):
-        # 파일 경로
-        src_file = os.path.join(source_dir, filename)
-        dst_file = os.path.join(backup_dir, filename)
-        
-        # 디렉토리는 건너뛰기 (필요한 경우 copytree로 복사 가능)
-        if os.path.isdir(src_file):
-            continue
-        
-        # 파일 복사
-        shutil.copy2(src_file, dst_file)
-        file_count += 1
-        
-        # 복사 진행 상황 출력
-        print(f"백업 중: {filename}")
+    # 복사에 성공한 파일만 manifest에 기록
+    failed = {os.path.basename(src) for src, _ in errors}
+    manifest = Manifest(os.path.abspath(source_dir), datetime.datetime.now().isoformat(timespec="seconds"),
+                        kind="full")
+    for name, (size, mtime_ns) in current.items():
+        if name not in failed:
+            digest = file_digest(os.path.join(source_dir, name)) if hash_files else None
+            manifest.add(name, size, mtime_ns, digest, os.path.basename(backup_dir))
+    manifest.save(backup_dir)
     
     return file_count, backup_dir
 
@@ -67,105 +96,116 @@ def backup_with_timestamp(source_dir, backup_root):
     # 백업 폴더가 없으면 생성
     os.makedirs(backup_dir, exist_ok=True)
     
-    # 백업 파일 카운터
-    file_count = 0
-    
-    # 소스 폴더의 모든 파일을 백업 폴더에 복사
-    for filename in os.listdir(source_dir):
-        # 파일 경로
-        src_file = os.path.join(source_dir, filename)
-        
-        # 디렉토리는 건너뛰기
-        if os.path.isdir(src_file):
-            continue
-            
+    # 소스 폴더의 모든 파일을 복사 목록에 추가 (디렉토리는 건너뜀)
+    jobs = []
+    for entry in walk_files(source_dir):
         # 파일명과 확장자 분리
-        name, ext = os.path.splitext(filename)
+        name, ext = os.path.splitext(entry.name)
         
         # 타임스탬프가 있는 새 파일명 생성
-        timestamp = datetime.datetime.fromtimestamp(os.path.getmtime(src_file)).strftime("%Y%m%d_%H%M%S")
+        st = entry.stat()
+        timestamp = datetime.datetime.fromtimestamp(st.st_mtime).strftime("%Y%m%d_%H%M%S")
         new_filename = f"{name}_{timestamp}{ext}"
         
         # 새 파일 경로
         dst_file = os.path.join(backup_dir, new_filename)
-        
-        # 파일 복사
-        shutil.copy2(src_file, dst_file)
-        file_count += 1
-        
-        # 복사 진행 상황 출력
-        print(f"타임스탬프 백업 중: {filename} -> {new_filename}")
+        jobs.append((entry.path, dst_file, st.st_size))
+    
+    # 여러 파일을 병렬로 복사 (진행 상황은 합계로 출력)
+    file_count, _, _ = copy_files(jobs)
     
     return file_count, backup_dir
 
-def incremental_backup(source_dir, backup_root, reference_dir=None):
+def incremental_backup(source_dir, backup_root, reference_dir=None, hash_files=False):
     """
     증분 백업: 마지막 백업 이후 변경된 파일만 백업합니다.
     
+    직전 백업(전체 또는 증분)의 manifest.json과 소스 폴더 목록을 메모리에서 비교하므로
+    백업 폴더의 파일은 하나도 stat 하지 않습니다. 증분 백업의 manifest에는
+    바뀌지 않은 파일이 어느 백업 폴더에 있는지도 이어서 기록되어(증분 연결),
+    삭제된 파일 목록도 함께 남습니다.
+    
     Args:
         source_dir (str): 백업할 소스 폴더 경로
         backup_root (str): 백업 파일이 저장될 루트 폴더 경로
-        reference_dir (str): 비교 기준이 될 이전 백업 폴더 (기본값: 가장 최근 백업)
+        reference_dir (str): 비교 기준이 될 이전 백업 폴더 (기본값: 가장 최근 전체/증분 백업)
+                             manifest가 없는 폴더면 폴더 안 파일을 직접 훑어서 비교
+        hash_files (bool): 바뀐 파일의 해시(sha256)도 manifest에 기록할지 여부
     
     Returns:
-        tuple: (백업 파일 수, 백업 폴더 경로)
+        tuple: (백업 파일 수, 백업 폴더 경로), 바뀐 것이 없으면 (0, None) - 폴더를 만들지 않음
     """
     # 현재 날짜와 시간으로 폴더명 생성 (YYYY-MM-DD_HHMMSS_incremental 형식)
-    datetime_str = datetime.datetime.now().strftime("%Y-%m-%d_%H%M%S_incremental")
+    backup_dir = new_backup_dir(backup_root, "incremental")
+    folder_name = os.path.basename(backup_dir)
     
-    # 백업 폴더 경로 생성
-    backup_dir = os.path.join(backup_root, datetime_str)
-    
-    # 기준 폴더가 지정되지 않은 경우 가장 최근 백업 폴더 찾기
+    # 기준 폴더가 지정되지 않은 경우 manifest가 가장 최근에 기록된 전체/증분 백업 찾기
     if reference_dir is None:
-        backup_folders = [d for d in os.listdir(backup_root) 
-                        if os.path.isdir(os.path.join(backup_root, d)) and not d.endswith("_incremental")]
-        
-        if backup_folders:
-            # 최신 폴더 찾기
-            backup_folders.sort(reverse=True)  # 날짜 형식이므로 역순 정렬하면 최신이 앞에 옴
-            reference_dir = os.path.join(backup_root, backup_folders[0])
-        else:
-            # 기준 폴더가 없으면 전체 백업 수행
+        reference_dir, previous = latest_snapshot(backup_root, kinds=("full", "incremental"))
+        if reference_dir is None:
+            # 기준 백업이 없으면 전체 백업 수행
             print("기준 백업 폴더가 없어 전체 백업을 수행합니다.")
-            return backup_files(source_dir, backup_root)
+            return backup_files(source_dir, backup_root, hash_files)
+    else:
+        previous = load_or_scan(reference_dir)
     
-    # 백업 폴더가 없으면 생성
-    os.makedirs(backup_dir, exist_ok=True)
+    # 소스 폴더 목록과 직전 manifest 비교 (메모리 안에서)
+    current = scan_source(source_dir)
+    added, modified, deleted = diff_manifest(current, previous)
     
-    # 백업 파일 카운터
-    file_count = 0
+    if not added and not modified and not deleted:
+        return 0, None
     
-    # 소스 폴더의 모든 파일 검사
-    for filename in os.listdir(source_dir):
-        # 파일 경로
-        src_file = os.path.join(source_dir, filename)
-        ref_file = os.path.join(reference_dir, filename)
-        dst_file = os.path.join(backup_dir, filename)
-        
-        # 디렉토리는 건너뛰기
-        if os.path.isdir(src_file):
+    # 백업 폴더 생성
+    os.makedirs(backup_dir)
+    
+    # 새 파일·수정된 파일만 복사
+    changed = added + modified
+    jobs = [(os.path.join(source_dir, name), os.path.join(backup_dir, name), current[name][0])
+            for name in changed]
+    file_count, _, errors = copy_files(jobs)
+    failed = {os.path.basename(src) for src, _ in errors}
+    
+    # 현재 상태 전체를 manifest로 기록 (바뀌지 않은 파일은 이전 저장 위치를 그대로 이어받음)
+    # 복사에 실패한 파일도 이전 기록을 이어받아서, 다음 백업에서 삭제가 아니라 수정으로 보고 다시 복사함
+    manifest = Manifest(os.path.abspath(source_dir), datetime.datetime.now().isoformat(timespec="seconds"),
+                        kind="incremental", parent=os.path.basename(os.path.abspath(reference_dir)),
+                        deleted=deleted)
+    for name, (size, mtime_ns) in current.items():
+        if name in previous.files and (name not in modified or name in failed):
+            manifest.files[name] = previous.files[name]
+        elif name in failed:
             continue
-            
-        # 파일이 새로 생성되었거나 수정된 경우에만 백업
-        if not os.path.exists(ref_file) or \
-           os.path.getmtime(src_file) > os.path.getmtime(ref_file):
-            
-            # 파일 복사
-            shutil.copy2(src_file, dst_file)
-            file_count += 1
-            
-            # 변경 유형 확인
-            if not os.path.exists(ref_file):
-                change_type = "새 파일"
-            else:
-                change_type = "수정됨"
-                
-            # 복사 진행 상황 출력
-            print(f"증분 백업 중: {filename} ({change_type})")
+        else:
+            digest = file_digest(os.path.join(source_dir, name)) if hash_files else None
+            manifest.add(name, size, mtime_ns, digest, folder_name)
+    manifest.save(backup_dir)
+    
+    print(f"새 파일 {len(added)}개, 수정됨 {len(modified)}개, 삭제됨 {len(deleted)}개")
     
     return file_count, backup_dir
 
+def restore_backup(snapshot_dir, target_dir):
+    """
+    전체/증분 백업 폴더 하나를 기준으로 그 시점의 파일을 모두 복원합니다.
+    (증분 백업이면 이전 백업 폴더들에 나뉘어 있는 파일을 manifest로 찾아서 복사)
+    
+    Args:
+        snapshot_dir (str): 복원할 백업 폴더 경로
+        target_dir (str): 복원할 위치
+    
+    Returns:
+        int: 복원한 파일 수
+    """
+    manifest = Manifest.load(snapshot_dir)
+    backup_root = os.path.dirname(os.path.abspath(snapshot_dir))
+    sources = resolve_sources(manifest, backup_root)
+    
+    jobs = [(src, os.path.join(target_dir, *name.split("/")), manifest.files[name][0])
+            for name, src in sources.items()]
+    file_count, _, _ = copy_files(jobs)
+    return file_count
+
 def main():
     # 소스 및 백업 폴더 경로
     source_dir = "data/original"
@@ -180,12 +220,16 @@ def main():
     os.makedirs(backup_root, exist_ok=True)
     
     print("===== 백업 자동화 프로그램 =====")
-    print("1. 기본 백업 (날짜별 폴더)")
+    print("1. 기본 백업 (날짜·시간별 폴더)")
     print("2. 타임스탬프 백업 (파일명에 시간 추가)")
     print("3. 증분 백업 (변경된 파일만)")
-    print("4. 종료")
+    print("4. 중복 제거 스냅샷 백업 (바뀐 내용만 저장)")
+    print("5. 압축 아카이브 스냅샷 (tar.gz, 파일 하나씩 복원 가능)")
+    print("6. 감시 모드 (변경될 때마다 자동 증분 백업)")
+    print("7. 오래된 백업 정리 (최근 7개 + 일/주/월별 대표만 보관)")
+    print("8. 종료")
     
-    choice = input("\n원하는 작업을 선택하세요 (1-4): ")
+    choice = input("\n원하는 작업을 선택하세요 (1-8): ")
     
     if choice == "1":
         # 기본 백업 실행
@@ -228,10 +272,64 @@ def main():
         print(f"소요 시간: {elapsed_time:.2f}초")
     
     elif choice == "4":
+        # 중복 제거 스냅샷 실행 (같은 내용은 공용 저장소에 한 번만 저장)
+        start_time = time.time()
+        
+        count, stored_bytes, snapshot_dir = dedup_snapshot(source_dir, backup_root)
+        
+        end_time = time.time()
+        elapsed_time = end_time - start_time
+        
+        print(f"\n스냅샷 완료: {count}개 파일이 '{snapshot_dir}'에 기록되었습니다.")
+        print(f"새로 저장한 용량: {stored_bytes:,} 바이트")
+        print(f"소요 시간: {elapsed_time:.2f}초")
+    
+    elif choice == "5":
+        # 압축 아카이브 스냅샷 실행 (여러 스레드로 압축)
+        start_time = time.time()
+        
+        try:
+            count, archive_path = create_archive(source_dir, backup_root)
+        except OSError as e:
+            print(f"\n아카이브 실패: {e} (만들던 아카이브는 삭제했습니다)")
+            return
+        
+        end_time = time.time()
+        elapsed_time = end_time - start_time
+        
+        print(f"\n아카이브 완료: {count}개 파일이 '{archive_path}'에 저장되었습니다.")
+        print(f"아카이브 크기: {os.path.getsize(archive_path):,} 바이트")
+        print(f"소요 시간: {elapsed_time:.2f}초")
+    
+    elif choice == "6":
+        # 먼저 증분 백업으로 현재 상태를 맞춘 뒤(기준 백업이 없으면 전체 백업), 변경을 감시
+        incremental_backup(source_dir, backup_root)
+        count = watch_and_backup(source_dir, backup_root)
+        print(f"감시 중 {count}번의 증분 백업을 만들었습니다.")
+    
+    elif choice == "7":
+        # 보관 정책 적용 (지울 목록을 먼저 보여주고 확인)
+        kept, removed, _ = apply_retention(backup_root, dry_run=True)
+        
+        if not removed:
+            print("정리할 백업이 없습니다.")
+        else:
+            print(f"\n보관: {len(kept)}개, 삭제 예정: {len(removed)}개")
+            for name in removed:
+                print(f" - {name}")
+            
+            if input("\n삭제할까요? (y/n): ").lower() == "y":
+                start_time = time.time()
+                kept, removed, swept = apply_retention(backup_root)
+                elapsed_time = time.time() - start_time
+                print(f"\n{len(removed)}개 백업과 참조되지 않는 blob {swept}개를 삭제했습니다.")
+                print(f"소요 시간: {elapsed_time:.2f}초")
+    
+    elif choice == "8":
         print("프로그램을 종료합니다.")
     
     else:
-        print("잘못된 선택입니다. 1-4 사이의 숫자를 입력하세요.")
+        print("잘못된 선택입니다. 1-8 사이의 숫자를 입력하세요.")
 
 if __name__ == "__main__":
     main()
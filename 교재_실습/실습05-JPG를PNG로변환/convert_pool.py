@@ -0,0 +1,138 @@
+# 병렬 이미지 변환 엔진
+# 이미지 디코딩/인코딩은 CPU를 많이 쓰므로 프로세스 풀로 여러 코어에 나눠서 처리합니다.
+# - 저장할 파일 이름(이름 충돌 처리 포함)은 작업을 나누기 전에 미리 정해서 프로세스끼리 겹치지 않게 함
+# - 작업은 chunksize개씩 묶어서 넘겨 프로세스 간 통신 횟수를 줄임
+# - 결과는 파일 목록 순서대로 받아서 진행 상황을 출력하고, 실패한 파일은 모아서 반환
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageEnhance
+
+# 공용 모듈(교재_실습/fswalk.py)을 불러오기 위해 상위 폴더를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fswalk import walk_files
+
+# 변환할 파일이 이보다 적으면 프로세스를 띄우는 비용이 더 크므로 순차 처리
+PARALLEL_MIN_FILES = 8
+
+JPG_PATTERNS = ['*.jpg', '*.jpeg']
+
+
+def list_jpg_files(source_dir):
+    """소스 폴더의 JPG 파일 이름 목록 (.jpg, .jpeg, 대소문자 무관)"""
+    return sorted(entry.name for entry in walk_files(source_dir, include=JPG_PATTERNS))
+
+
+def plan_outputs(source_dir, output_dir, filenames):
+    """
+    각 JPG 파일의 PNG 저장 경로를 정합니다.
+    이미 있는 파일이나 이번에 먼저 정한 이름과 겹치면 _1, _2 ... 를 붙입니다.
+
+    Returns:
+        list: (원본 경로, 저장 경로) 목록
+    """
+    taken = set()
+    tasks = []
+    for filename in filenames:
+        name, _ = os.path.splitext(filename)
+        new_name = f"{name}.png"
+        count = 0
+        while new_name in taken or os.path.exists(os.path.join(output_dir, new_name)):
+            count += 1
+            new_name = f"{name}_{count}.png"
+        taken.add(new_name)
+        tasks.append((os.path.join(source_dir, filename), os.path.join(output_dir, new_name)))
+    return tasks
+
+
+def apply_options(img, options):
+    """변환 옵션(크기 조정, 회전, 밝기)을 적용한 이미지를 반환합니다."""
+    # 크기 조정
+    if 'resize' in options:
+        width, height = options['resize']
+        img = img.resize((width, height), Image.LANCZOS)
+
+    # 회전
+    if 'rotate' in options:
+        img = img.rotate(options['rotate'], expand=True)
+
+    # 밝기 조정
+    if 'brightness' in options:
+        img = ImageEnhance.Brightness(img).enhance(options['brightness'])
+
+    return img
+
+
+def convert_one(task):
+    """
+    이미지 하나를 PNG로 변환합니다. (작업 프로세스에서 실행)
+
+    Args:
+        task (tuple): (원본 경로, 저장 경로, 옵션 dict, 품질)
+
+    Returns:
+        str: 오류 메시지 (성공하면 None)
+    """
+    src_path, dst_path, options, quality = task
+    try:
+        with Image.open(src_path) as img:
+            img = apply_options(img, options or {})
+            img.save(dst_path, "PNG", quality=quality)
+        return None
+    except Exception as e:
+        return str(e)
+
+
+def convert_images(tasks, options=None, quality=100, workers=None, chunksize=None, show_progress=True):
+    """
+    여러 이미지를 프로세스 풀로 변환합니다.
+
+    Args:
+        tasks (list): plan_outputs() 결과 (원본 경로, 저장 경로) 목록
+        options (dict): 변환 옵션 (resize, rotate, brightness)
+        quality (int): 저장 품질
+        workers (int): 프로세스 수 (None이면 CPU 수, 1이면 순차 처리)
+        chunksize (int): 한 번에 넘길 작업 수 (None이면 자동)
+        show_progress (bool): 진행 상황 출력 여부
+
+    Returns:
+        tuple: (변환된 파일 수, [(파일 이름, 오류 메시지)] 목록)
+    """
+    jobs = [(src, dst, options, quality) for src, dst in tasks]
+    total = len(jobs)
+    converted = 0
+    errors = []
+
+    if workers == 1 or total < PARALLEL_MIN_FILES:
+        results = map(convert_one, jobs)
+        pool = None
+    else:
+        if chunksize is None:
+            chunksize = max(1, total // ((workers or os.cpu_count() or 1) * 4))
+        pool = ProcessPoolExecutor(max_workers=workers)
+        results = pool.map(convert_one, jobs, chunksize=chunksize)
+
+    # 옵션 변환이면 진행 상황에 적용한 옵션도 표시
+    detail = ""
+    if options is not None:
+        options_info = ", ".join(f"{k}: {v}" for k, v in options.items())
+        detail = f" (옵션: {options_info or '없음'})"
+
+    try:
+        # 결과는 작업 순서대로 도착하므로 진행 상황도 파일 순서대로 출력됨
+        for done, ((src, dst), error) in enumerate(zip(tasks, results), 1):
+            filename = os.path.basename(src)
+            if error is None:
+                converted += 1
+                if show_progress:
+                    print(f"[{done}/{total}] 변환 완료: {filename} -> {os.path.basename(dst)}{detail}")
+            else:
+                errors.append((filename, error))
+                if show_progress:
+                    print(f"[{done}/{total}] 오류: {filename} 변환 중 문제 발생 - {error}")
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    return converted, errors
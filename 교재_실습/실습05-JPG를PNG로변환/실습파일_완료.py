@@ -4,14 +4,18 @@ import os
 import time
 import argparse
 
-def convert_jpg_to_png(source_dir, output_dir, quality=100):
+from convert_pool import convert_images, list_jpg_files, plan_outputs
+
+def convert_jpg_to_png(source_dir, output_dir, quality=100, workers=None):
     """
     JPG 이미지를 PNG로 변환하여 저장합니다.
+    여러 프로세스가 동시에 변환합니다. (convert_pool 참고)
     
     Args:
         source_dir (str): JPG 이미지가 있는 소스 폴더 경로
         output_dir (str): 변환된 PNG 이미지를 저장할 폴더 경로
         quality (int): PNG 저장 품질 (1-100, 기본값 100)
+        workers (int): 변환 프로세스 수 (None이면 CPU 수)
     
     Returns:
         int: 변환된 이미지 파일 수
@@ -19,52 +23,17 @@ def convert_jpg_to_png(source_dir, output_dir, quality=100):
     # 출력 폴더가 없으면 생성
     os.makedirs(output_dir, exist_ok=True)
     
-    # 변환된 파일 카운터
-    converted_count = 0
+    # JPG 파일 목록 (.jpg, .jpeg, .JPG, .JPEG)과 저장할 이름(이름 충돌 처리 포함)
+    tasks = plan_outputs(source_dir, output_dir, list_jpg_files(source_dir))
     
-    # 소스 폴더의 모든 파일 처리
-    for filename in os.listdir(source_dir):
-        # 파일 전체 경로
-        file_path = os.path.join(source_dir, filename)
-        
-        # 디렉토리는 건너뛰기
-        if os.path.isdir(file_path):
-            continue
-            
-        # JPG 파일만 처리 (.jpg, .jpeg, .JPG, .JPEG)
-        if filename.lower().endswith(('.jpg', '.jpeg')):
-            try:
-                # 이미지 열기
-                img = Image.open(file_path)
-                
-                # 파일명과 확장자 분리
-                name, _ = os.path.splitext(filename)
-                
-                # 새 PNG 파일명
-                new_name = f"{name}.png"
-                new_path = os.path.join(output_dir, new_name)
-                
-                # 이름 충돌 처리
-                if os.path.exists(new_path):
-                    count = 1
-                    while os.path.exists(os.path.join(output_dir, f"{name}_{count}.png")):
-                        count += 1
-                    new_name = f"{name}_{count}.png"
-                    new_path = os.path.join(output_dir, new_name)
-                
-                # PNG로 저장
-                img.save(new_path, "PNG", quality=quality)
-                converted_count += 1
-                
-                # 변환 상태 출력
-                print(f"변환 완료: {filename} -> {new_name}")
-                
-            except Exception as e:
-                print(f"오류: {filename} 변환 중 문제 발생 - {e}")
+    # 변환 실행
+    converted_count, errors = convert_images(tasks, quality=quality, workers=workers)
+    if errors:
+        print(f"변환 실패: {len(errors)}개")
     
     return converted_count
 
-def convert_with_options(source_dir, output_dir, options=None):
+def convert_with_options(source_dir, output_dir, options=None, workers=None):
     """
     다양한 옵션을 적용하여 JPG 이미지를 PNG로 변환합니다.
     
@@ -72,6 +41,7 @@ def convert_with_options(source_dir, output_dir, options=None):
         source_dir (str): JPG 이미지가 있는 소스 폴더 경로
         output_dir (str): 변환된 PNG 이미지를 저장할 폴더 경로
         options (dict): 변환 옵션 (resize, rotate 등)
+        workers (int): 변환 프로세스 수 (None이면 CPU 수)
     
     Returns:
         int: 변환된 이미지 파일 수
@@ -83,79 +53,24 @@ def convert_with_options(source_dir, output_dir, options=None):
     # 출력 폴더가 없으면 생성
     os.makedirs(output_dir, exist_ok=True)
     
-    # 변환된 파일 카운터
-    converted_count = 0
+    # JPG 파일 목록과 저장할 이름
+    tasks = plan_outputs(source_dir, output_dir, list_jpg_files(source_dir))
     
-    # 소스 폴더의 모든 파일 처리
-    for filename in os.listdir(source_dir):
-        # 파일 전체 경로
-        file_path = os.path.join(source_dir, filename)
-        
-        # 디렉토리는 건너뛰기
-        if os.path.isdir(file_path):
-            continue
-            
-        # JPG 파일만 처리 (.jpg, .jpeg, .JPG, .JPEG)
-        if filename.lower().endswith(('.jpg', '.jpeg')):
-            try:
-                # 이미지 열기
-                img = Image.open(file_path)
-                
-                # 옵션 적용
-                # 크기 조정
-                if 'resize' in options:
-                    width, height = options['resize']
-                    img = img.resize((width, height), Image.LANCZOS)
-                
-                # 회전
-                if 'rotate' in options:
-                    angle = options['rotate']
-                    img = img.rotate(angle, expand=True)
-                
-                # 밝기 조정
-                if 'brightness' in options:
-                    from PIL import ImageEnhance
-                    factor = options['brightness']
-                    enhancer = ImageEnhance.Brightness(img)
-                    img = enhancer.enhance(factor)
-                
-                # 파일명과 확장자 분리
-                name, _ = os.path.splitext(filename)
-                
-                # 새 PNG 파일명
-                new_name = f"{name}.png"
-                new_path = os.path.join(output_dir, new_name)
-                
-                # 이름 충돌 처리
-                if os.path.exists(new_path):
-                    count = 1
-                    while os.path.exists(os.path.join(output_dir, f"{name}_{count}.png")):
-                        count += 1
-                    new_name = f"{name}_{count}.png"
-                    new_path = os.path.join(output_dir, new_name)
-                
-                # PNG로 저장
-                img.save(new_path, "PNG")
-                converted_count += 1
-                
-                # 적용된 옵션 정보
-                options_info = ", ".join(f"{k}: {v}" for k, v in options.items())
-                
-                # 변환 상태 출력
-                print(f"변환 완료: {filename} -> {new_name} (옵션: {options_info if options else '없음'})")
-                
-            except Exception as e:
-                print(f"오류: {filename} 변환 중 문제 발생 - {e}")
+    # 옵션(크기 조정, 회전, 밝기)을 적용하며 변환
+    converted_count, errors = convert_images(tasks, options=options, workers=workers)
+    if errors:
+        print(f"변환 실패: {len(errors)}개")
     
     return converted_count
 
-def batch_conversion_with_preview(source_dir, output_dir):
+def batch_conversion_with_preview(source_dir, output_dir, workers=None):
     """
     미리보기 기능이 있는 일괄 변환 함수
     
     Args:
         source_dir (str): JPG 이미지가 있는 소스 폴더 경로
         output_dir (str): 변환된 PNG 이미지를 저장할 폴더 경로
+        workers (int): 변환 프로세스 수 (None이면 CPU 수)
     
     Returns:
         int: 변환된 이미지 파일 수
@@ -168,9 +83,7 @@ def batch_conversion_with_preview(source_dir, output_dir):
     os.makedirs(preview_dir, exist_ok=True)
     
     # JPG 파일 목록 가져오기
-    jpg_files = [f for f in os.listdir(source_dir) 
-                if os.path.isfile(os.path.join(source_dir, f)) and 
-                f.lower().endswith(('.jpg', '.jpeg'))]
+    jpg_files = list_jpg_files(source_dir)
     
     if not jpg_files:
         print("변환할 JPG 파일이 없습니다.")
@@ -204,7 +117,7 @@ def batch_conversion_with_preview(source_dir, output_dir):
         os.rmdir(preview_dir)
         
         # 실제 변환 수행
-        return convert_jpg_to_png(source_dir, output_dir)
+        return convert_jpg_to_png(source_dir, output_dir, workers=workers)
         
     except Exception as e:
         print(f"미리보기 생성 중 오류 발생: {e}")
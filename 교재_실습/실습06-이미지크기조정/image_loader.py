@@ -0,0 +1,70 @@
+# 축소용 이미지 로더
+# 큰 사진을 작게 줄일 때 원본 해상도 전체를 디코딩하지 않도록 합니다.
+# - JPEG: draft()로 디코더에게 크기를 알려주면 1/2, 1/4, 1/8 크기로 바로 디코딩함 (DCT 스케일링)
+#   DCT 축소는 LANCZOS보다 화질이 떨어지므로, 목표 크기의 REDUCING_GAP배 이상으로만 줄여서
+#   남은 축소를 LANCZOS가 맡도록 함 (Image.thumbnail이 내부에서 하는 방식과 같음)
+# - resize/thumbnail에 reducing_gap을 주면 먼저 정수 배율로 빠르게 줄인 뒤 LANCZOS로 마무리함
+# 예: 24MP(6000x4000) 사진 → 200px 썸네일은 750x500 크기로 디코딩되어 메모리가 약 1/64로 줄어듦
+from PIL import Image
+
+# 정수 배율 축소 후 남겨 둘 여유 배율 (클수록 화질에 가깝고, 작을수록 빠름)
+REDUCING_GAP = 3.0
+
+
+def fit_size(original_size, size):
+    """
+    가로세로 비율을 유지하면서 size 안에 들어가는 크기를 계산합니다.
+
+    Args:
+        original_size (tuple): 원본 크기 (가로, 세로)
+        size (tuple): 목표 크기 (가로, 세로)
+
+    Returns:
+        tuple: 조정할 크기 (가로, 세로)
+    """
+    original_width, original_height = original_size
+
+    # 더 작은 비율을 선택하여 이미지가 목표 크기를 넘지 않도록 함
+    ratio = min(size[0] / original_width, size[1] / original_height)
+    return (int(original_width * ratio), int(original_height * ratio))
+
+
+def load_resized(file_path, size, maintain_aspect_ratio=True):
+    """
+    이미지를 size 크기로 줄여서 불러옵니다.
+
+    Args:
+        file_path (str): 이미지 파일 경로
+        size (tuple): 조정할 크기 (가로, 세로) 픽셀
+        maintain_aspect_ratio (bool): 가로세로 비율 유지 여부
+
+    Returns:
+        tuple: (크기 조정된 이미지, 원본 크기)
+    """
+    with Image.open(file_path) as img:
+        # 여기까지는 헤더만 읽은 상태 (픽셀은 아직 디코딩하지 않음)
+        original_size = img.size
+        new_size = fit_size(original_size, size) if maintain_aspect_ratio else tuple(size)
+
+        # new_size의 REDUCING_GAP배 이상인 가장 작은 배율로 디코딩 (JPEG이 아니면 아무것도 하지 않음)
+        img.draft(None, (int(new_size[0] * REDUCING_GAP), int(new_size[1] * REDUCING_GAP)))
+        resized = img.resize(new_size, Image.LANCZOS, reducing_gap=REDUCING_GAP)
+    return resized, original_size
+
+
+def load_thumbnail(file_path, thumbnail_size):
+    """
+    썸네일을 만들어서 불러옵니다. (Image.thumbnail과 같은 크기)
+
+    Args:
+        file_path (str): 이미지 파일 경로
+        thumbnail_size (tuple): 썸네일 최대 크기 (가로, 세로) 픽셀
+
+    Returns:
+        Image: 썸네일 이미지
+    """
+    with Image.open(file_path) as img:
+        # thumbnail은 reducing_gap에 맞춰 JPEG draft 디코딩까지 알아서 함
+        img.thumbnail(thumbnail_size, reducing_gap=REDUCING_GAP)
+        # 파일을 닫은 뒤에도 쓸 수 있도록 복사본을 반환
+        return img.copy()
@@ -1,9 +1,10 @@
 # 이미지 크기 일괄 조정 프로그램
-from PIL import Image
 import os
 import time
 import argparse
 
+from image_loader import load_resized, load_thumbnail
+
 def resize_images(source_dir, output_dir, size=(800, 800), maintain_aspect_ratio=True, quality=90):
     """
     폴더 내 이미지 파일의 크기를 일괄 조정하는 함수
@@ -39,29 +40,8 @@ def resize_images(source_dir, output_dir, size=(800, 800), maintain_aspect_ratio
         # 지원하는 이미지 파일만 처리
         if filename.lower().endswith(supported_extensions):
             try:
-                # 이미지 열기
-                img = Image.open(file_path)
-                
-                # 가로세로 비율 유지 옵션 적용
-                if maintain_aspect_ratio:
-                    # 원본 이미지 크기
-                    original_width, original_height = img.size
-                    
-                    # 가로와 세로 중 더 큰 비율을 기준으로 조정
-                    width_ratio = size[0] / original_width
-                    height_ratio = size[1] / original_height
-                    
-                    # 더 작은 비율을 선택하여 이미지가 목표 크기를 넘지 않도록 함
-                    ratio = min(width_ratio, height_ratio)
-                    
-                    # 새 크기 계산
-                    new_size = (int(original_width * ratio), int(original_height * ratio))
-                    
-                    # 이미지 리사이즈
-                    img_resized = img.resize(new_size, Image.LANCZOS)
-                else:
-                    # 비율 유지 없이 지정한 크기로 조정
-                    img_resized = img.resize(size, Image.LANCZOS)
+                # 이미지를 열어서 크기 조정 (JPEG은 줄어든 크기로 바로 디코딩)
+                img_resized, original_size = load_resized(file_path, size, maintain_aspect_ratio)
                 
                 # 출력 파일 경로
                 output_path = os.path.join(output_dir, filename)
@@ -81,7 +61,7 @@ def resize_images(source_dir, output_dir, size=(800, 800), maintain_aspect_ratio
                 new_size_kb = os.path.getsize(output_path) / 1024
                 reduction = (1 - new_size_kb / original_size_kb) * 100
                 
-                print(f"처리: {filename} - 원본: {img.size} → 조정: {img_resized.size}")
+                print(f"처리: {filename} - 원본: {original_size} → 조정: {img_resized.size}")
                 print(f"  크기 변화: {original_size_kb:.1f}KB → {new_size_kb:.1f}KB ({reduction:.1f}% 감소)")
                 
             except Exception as e:
@@ -122,14 +102,11 @@ def create_thumbnails(source_dir, output_dir, thumbnail_size=(200, 200)):
         # 지원하는 이미지 파일만 처리
         if filename.lower().endswith(supported_extensions):
             try:
-                # 이미지 열기
-                img = Image.open(file_path)
-                
                 # 파일명과 확장자 분리
                 name, ext = os.path.splitext(filename)
                 
-                # 썸네일 생성
-                img.thumbnail(thumbnail_size)
+                # 썸네일 생성 (JPEG은 썸네일 크기에 가깝게 바로 디코딩)
+                img = load_thumbnail(file_path, thumbnail_size)
                 
                 # 썸네일 파일명
                 thumbnail_filename = f"{name}_thumb{ext}"
@@ -195,33 +172,10 @@ def batch_resize_with_options(source_dir, output_dir, options=None):
         # 지원하는 이미지 파일만 처리
         if filename.lower().endswith(supported_extensions):
             try:
-                # 이미지 열기
-                img = Image.open(file_path)
-                
-                # 가로세로 비율 유지 옵션 적용
-                if options.get('maintain_aspect_ratio', True):
-                    # 원본 이미지 크기
-                    original_width, original_height = img.size
-                    
-                    # 목표 크기
-                    target_size = options.get('size', (800, 800))
-                    
-                    # 가로와 세로 중 더 큰 비율을 기준으로 조정
-                    width_ratio = target_size[0] / original_width
-                    height_ratio = target_size[1] / original_height
-                    
-                    # 더 작은 비율을 선택하여 이미지가 목표 크기를 넘지 않도록 함
-                    ratio = min(width_ratio, height_ratio)
-                    
-                    # 새 크기 계산
-                    new_size = (int(original_width * ratio), int(original_height * ratio))
-                    
-                    # 이미지 리사이즈
-                    img_resized = img.resize(new_size, Image.LANCZOS)
-                else:
-                    # 비율 유지 없이 지정한 크기로 조정
-                    target_size = options.get('size', (800, 800))
-                    img_resized = img.resize(target_size, Image.LANCZOS)
+                # 이미지를 열어서 크기 조정 (JPEG은 줄어든 크기로 바로 디코딩)
+                target_size = options.get('size', (800, 800))
+                img_resized, _ = load_resized(file_path, target_size,
+                                              options.get('maintain_aspect_ratio', True))
                 
                 # 파일명과 확장자 분리
                 name, ext = os.path.splitext(filename)